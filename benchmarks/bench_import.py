@@ -0,0 +1,102 @@
+"""Time a fresh interpreter importing offset_poly.
+
+Run from the project root:
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --max-ms 20
+
+Each statement is run in --repeat fresh interpreters, and the best time is
+reported minus the best time of an interpreter that imports nothing. Modules
+that should load lazily (the offset engine, vec2_math, and NumPy) are listed if
+a bare `import offset_poly` loads them.
+
+With --max-ms, the exit code is 1 if `import offset_poly` takes longer than that
+or loads any module that should load lazily.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+_STATEMENTS = {
+    "baseline": "pass",
+    "import offset_poly": "import offset_poly",
+    "offset_polygon": "from offset_poly import offset_polygon",
+    "offset_poly.cli": "import offset_poly.cli",
+}
+
+_LAZY_MODULES = ("numpy", "offset_poly.offset", "offset_poly.offset_array", "vec2_math")
+
+
+def _time_statement(statement: str, repeat: int) -> float:
+    """Return the best wall time of a fresh interpreter running statement."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _ = subprocess.run([sys.executable, "-c", statement], check=True)  # noqa: S603
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def get_eager_modules() -> list[str]:
+    """Return modules loaded by `import offset_poly` that should load lazily."""
+    statement = (
+        "import json, sys, offset_poly; "
+        + f"print(json.dumps([x for x in {list(_LAZY_MODULES)} if x in sys.modules]))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", statement], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def run(repeat: int) -> dict[str, float]:
+    """Time every statement.
+
+    :param repeat: number of fresh interpreters per statement
+    :return: {statement name: milliseconds more than the baseline}
+    """
+    baseline = _time_statement(_STATEMENTS["baseline"], repeat)
+    results: dict[str, float] = {}
+    for name, statement in _STATEMENTS.items():
+        if name == "baseline":
+            continue
+        milliseconds = (_time_statement(statement, repeat) - baseline) * 1000
+        results[name] = milliseconds
+        print(f"{name:24} {milliseconds:>8.2f} ms")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the import benchmark from the command line.
+
+    :param argv: command line arguments
+    :return: exit code. 1 if `import offset_poly` is slower than --max-ms or
+        loads a module that should load lazily.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    _ = parser.add_argument("--repeat", type=int, default=20)
+    _ = parser.add_argument("--max-ms", type=float, help="fail above this")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    eager = get_eager_modules()
+    for module in eager:
+        print(f"EAGER {module}")
+    if args.max_ms is None:
+        return 0
+    if results["import offset_poly"] > args.max_ms:
+        print(f"REGRESSION import offset_poly is slower than {args.max_ms} ms")
+        return 1
+    return 1 if eager else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
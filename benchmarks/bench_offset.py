@@ -0,0 +1,276 @@
+"""Time and measure peak memory of the offset hot paths.
+
+Run from the project root:
+
+    python benchmarks/bench_offset.py
+    python benchmarks/bench_offset.py --max-size 1000000 --save baseline.json
+    python benchmarks/bench_offset.py --compare baseline.json
+
+Timings only compare on the same machine, so no baseline is committed. Save one
+from a checkout of the commit to compare against, then run --compare on the
+change.
+
+Every entry point is run on the same synthetic shapes at sizes from 10 points up
+to --max-size. For each case, the best of --repeat runs is reported as points per
+second. Peak memory is measured in a separate run with tracemalloc, so tracing
+does not slow down the timed runs.
+
+With --compare, cases that are more than --tolerance slower than the saved
+baseline are listed, and the exit code is 1.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import itertools as it
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from offset_poly import gap_corner, offset_poly_per_edge, offset_polygon
+from offset_poly.offset import PolyType
+from offset_poly.offset_corner import iter_fused_gap_corners, iter_gap_corners
+from offset_poly.prepare_poly import remove_coincident_adjacent_points
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from offset_poly.offset_corner import GapCorner
+
+_Points = list[tuple[float, float]]
+
+_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def _convex(num_points: int) -> _Points:
+    """Return a ccw regular polygon."""
+    step = math.tau / num_points
+    return [(math.cos(i * step), math.sin(i * step)) for i in range(num_points)]
+
+
+def _star(num_points: int) -> _Points:
+    """Return a ccw star alternating between two radii."""
+    step = math.tau / num_points
+    radii = (1.0, 0.5)
+    return [
+        (radii[i % 2] * math.cos(i * step), radii[i % 2] * math.sin(i * step))
+        for i in range(num_points)
+    ]
+
+
+def _spiral(num_points: int) -> _Points:
+    """Return a ccw spiral of up to ten turns with at least ten points per turn."""
+    step = math.tau * max(1, min(10, num_points // 10)) / num_points
+    return [
+        (
+            (1 + i / num_points) * math.cos(i * step),
+            (1 + i / num_points) * math.sin(i * step),
+        )
+        for i in range(num_points)
+    ]
+
+
+def _near_degenerate(num_points: int) -> _Points:
+    """Return a zigzag that turns back almost 180 degrees at every corner."""
+    return [(float(i % 2), i * 1e-3) for i in range(num_points)]
+
+
+def _duplicates(num_points: int) -> _Points:
+    """Return a convex polygon where every point is repeated about three times."""
+    rng = random.Random(0)
+    points: _Points = []
+    for point in _convex(max(3, num_points // 3)):
+        points.extend([point] * rng.randint(1, 5))
+    return points[:num_points] if len(points) >= num_points else points
+
+
+SHAPES: dict[str, Callable[[int], _Points]] = {
+    "convex": _convex,
+    "star": _star,
+    "spiral": _spiral,
+    "near_degenerate": _near_degenerate,
+    "duplicates": _duplicates,
+}
+
+
+def _run_gap_corner(points: _Points) -> None:
+    """Offset every corner with gap_corner and read xsect.
+
+    gap_corner does not accept coincident points, so remove them first.
+    """
+    unique = remove_coincident_adjacent_points(points)
+    for pnt_a, pnt_b, pnt_c in zip(unique, unique[1:], unique[2:], strict=False):
+        _ = gap_corner(pnt_a, pnt_b, pnt_c, 0.01).xsect
+
+
+def _run_cpts(points: _Points) -> None:
+    """Read cpts from every corner of an offset polygon."""
+    for corner in offset_polygon(points, 0.01):
+        _ = corner.cpts
+
+
+def _run_kernel(kernel: Callable[..., Iterable[GapCorner]], points: _Points) -> None:
+    """Offset every corner of a polygon with one kernel and read xsect and cpts.
+
+    Compares the fused kernel with lazy GapCorners at every size, whichever one
+    offset_poly_per_vert would pick. The shapes are not closed, so wrap them the
+    way offset_polygon would: last point first and first point last.
+    """
+    unique = remove_coincident_adjacent_points(points)
+    wrapped = unique[-1:] + unique + unique[:1]
+    for corner in kernel(wrapped, it.repeat((0.01, 0.01))):
+        _ = corner.xsect, corner.cpts
+
+
+def _get_entry_points() -> dict[str, Callable[[_Points], object]]:
+    """Return each entry point to time. Array entry points need numpy.
+
+    GapCorner values are lazy, so the scalar entry points read xsect from each
+    corner to do the same work as the array entry points.
+    """
+    entry_points: dict[str, Callable[[_Points], object]] = {
+        "offset_polygon": lambda x: [c.xsect for c in offset_polygon(x, 0.01)],
+        "offset_poly_per_edge": lambda x: [
+            c.xsect for c in offset_poly_per_edge(x, [0.01, 0.02], PolyType.POLYGON)
+        ],
+        "gap_corner": _run_gap_corner,
+        "GapCorner.cpts": _run_cpts,
+        "iter_gap_corners": functools.partial(_run_kernel, iter_gap_corners),
+        "iter_fused_gap_corners": functools.partial(
+            _run_kernel, iter_fused_gap_corners
+        ),
+    }
+    try:
+        from offset_poly.offset_array import (  # noqa: PLC0415
+            offset_poly_per_edge_array,
+            offset_polygon_array,
+        )
+    except ImportError:
+        return entry_points
+    entry_points["offset_polygon_array"] = lambda x: offset_polygon_array(x, 0.01)
+    entry_points["offset_poly_per_edge_array"] = lambda x: offset_poly_per_edge_array(
+        x, [0.01, 0.02], PolyType.POLYGON
+    )
+    return entry_points
+
+
+def _time(func: Callable[[_Points], object], points: _Points, repeat: int) -> float:
+    """Return the best time of repeat runs in seconds."""
+    best = math.inf
+    for _ in range(repeat):
+        beg = time.perf_counter()
+        _ = func(points)
+        best = min(best, time.perf_counter() - beg)
+    return best
+
+
+def _peak_memory(func: Callable[[_Points], object], points: _Points) -> int:
+    """Return the peak bytes allocated during one run."""
+    tracemalloc.start()
+    try:
+        _ = func(points)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run(
+    max_size: int, repeat: int, entry_filter: str | None = None
+) -> dict[str, dict[str, float]]:
+    """Run every benchmark case.
+
+    :param max_size: largest number of points
+    :param repeat: number of timed runs per case
+    :param entry_filter: only run entry points with this substring in the name
+    :return: {"entry_point/shape/size": {"seconds", "points_per_second",
+        "peak_bytes"}}
+    """
+    results: dict[str, dict[str, float]] = {}
+    entry_points = _get_entry_points()
+    for size in (x for x in _SIZES if x <= max_size):
+        for shape_name, shape in SHAPES.items():
+            points = shape(size)
+            for name, func in entry_points.items():
+                if entry_filter and entry_filter not in name:
+                    continue
+                seconds = _time(func, points, repeat)
+                case = {
+                    "seconds": seconds,
+                    "points_per_second": len(points) / seconds,
+                    "peak_bytes": _peak_memory(func, points),
+                }
+                results[f"{name}/{shape_name}/{size}"] = case
+                print(
+                    f"{name:28} {shape_name:16} {size:>9,} "
+                    + f"{case['points_per_second']:>14,.0f} pts/s "
+                    + f"{case['peak_bytes'] / 2**20:>10.2f} MiB"
+                )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Return a description of every case slower than baseline by tolerance.
+
+    :param results: output of run
+    :param baseline: saved output of an earlier run
+    :param tolerance: allowed slowdown as a fraction. 0.1 is 10% slower.
+    :return: one line per regression
+    """
+    regressions: list[str] = []
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        ratio = result["seconds"] / baseline[case]["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{case}: {ratio:.2f}x baseline time")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run benchmarks from the command line.
+
+    :param argv: command line arguments
+    :return: exit code. 1 if any case regressed against --compare.
+    """
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n")[0])
+    _ = parser.add_argument("--max-size", type=int, default=10_000)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    _ = parser.add_argument("--filter", help="only entry points containing this")
+    _ = parser.add_argument("--save", type=Path, help="write results to this json")
+    _ = parser.add_argument("--compare", type=Path, help="compare to this json")
+    _ = parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    results = run(args.max_size, args.repeat, args.filter)
+    if args.save:
+        _ = args.save.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "results": results}, indent=2
+            )
+        )
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
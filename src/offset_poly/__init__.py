@@ -1,21 +1,103 @@
-"""Import functions into the package namespace.
+"""Import functions and classes into the package namespace.
+
+Names are imported from their modules the first time they are used, so
+`import offset_poly` does not load the offset engine (or vec2_math) until a
+worker actually offsets something.
 
 :author: Shay Hill
 :created: 2023-08-19
 """
 
-from offset_poly.offset import (
-    offset_poly_per_edge,
-    offset_poly_per_vert,
-    offset_polygon,
-    offset_polyline,
-)
-from offset_poly.offset_corner import gap_corner
+from __future__ import annotations
+
+import importlib
+
+# not imported from typing, which takes longer to import than this package
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from offset_poly.batch import offset_many, offset_rings
+    from offset_poly.cache import OffsetCache
+    from offset_poly.flatten import flatten_corners
+    from offset_poly.offset import (
+        iter_offset_polyline,
+        offset_poly_per_edge,
+        offset_poly_per_vert,
+        offset_polygon,
+        offset_polyline,
+    )
+    from offset_poly.offset_array import (
+        PreparedPoly,
+        offset_polygon_multi,
+        offset_polyline_multi,
+    )
+    from offset_poly.offset_corner import gap_corner
+    from offset_poly.self_intersections import (
+        find_self_intersections,
+        remove_self_intersections,
+    )
+    from offset_poly.session import OffsetSession
+    from offset_poly.stats import record_stats
+    from offset_poly.taper import offset_tapered
+
+_NAME2MODULE = {
+    "OffsetCache": "offset_poly.cache",
+    "OffsetSession": "offset_poly.session",
+    "PreparedPoly": "offset_poly.offset_array",
+    "find_self_intersections": "offset_poly.self_intersections",
+    "flatten_corners": "offset_poly.flatten",
+    "gap_corner": "offset_poly.offset_corner",
+    "iter_offset_polyline": "offset_poly.offset",
+    "offset_many": "offset_poly.batch",
+    "offset_poly_per_edge": "offset_poly.offset",
+    "offset_poly_per_vert": "offset_poly.offset",
+    "offset_polygon": "offset_poly.offset",
+    "offset_polygon_multi": "offset_poly.offset_array",
+    "offset_polyline": "offset_poly.offset",
+    "offset_polyline_multi": "offset_poly.offset_array",
+    "offset_rings": "offset_poly.batch",
+    "offset_tapered": "offset_poly.taper",
+    "record_stats": "offset_poly.stats",
+    "remove_self_intersections": "offset_poly.self_intersections",
+}
 
 __all__ = [
+    "OffsetCache",
+    "OffsetSession",
+    "PreparedPoly",
+    "find_self_intersections",
+    "flatten_corners",
     "gap_corner",
+    "iter_offset_polyline",
+    "offset_many",
     "offset_poly_per_edge",
     "offset_poly_per_vert",
     "offset_polygon",
+    "offset_polygon_multi",
     "offset_polyline",
+    "offset_polyline_multi",
+    "offset_rings",
+    "offset_tapered",
+    "record_stats",
+    "remove_self_intersections",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name from its module on first use.
+
+    :param name: attribute name
+    :return: the function or class
+    :raise AttributeError: if name is not a public name of the package
+    """
+    module = _NAME2MODULE.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,10 @@
+"""Run the command-line offsetter with python -m offset_poly.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from offset_poly.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,360 @@
+"""Offset many independent polylines or polygons at once.
+
+offset_rings offsets many concatenated rings in one vectorized pass. offset_many
+spreads that work across worker processes. Polylines are sent to workers and
+results are sent back as a few flat NumPy arrays per chunk (coordinates plus start
+indices), never as pickled lists of points or GapCorner instances.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import math
+import numbers
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+from offset_poly.offset import MIN_PTS_FOR_POLYGON, MIN_PTS_FOR_POLYLINE, PolyType
+from offset_poly.offset_array import CornerKernel, GapCornerArray, get_float_dtype
+from offset_poly.stats import get_active_stats, time_phase
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    _FArray = npt.NDArray[np.floating[Any]]
+    _IArray = npt.NDArray[np.intp]
+    _BArray = npt.NDArray[np.bool_]
+
+    # flat values and (n + 1,) start indices into those values
+    _Ragged = tuple[npt.NDArray[Any], _IArray]
+
+# below this many total points, starting a process pool costs more than it saves
+_MIN_POINTS_FOR_POOL = 50_000
+
+# send each worker this many chunks so faster workers can pick up slack
+_CHUNKS_PER_WORKER = 4
+
+
+def _pack(
+    arrays: Sequence[npt.ArrayLike],
+    shape: tuple[int, ...] = (),
+    dtype: npt.DTypeLike | None = None,
+) -> _Ragged:
+    """Concatenate arrays into one flat array and the start index of each.
+
+    :param arrays: sequence of arrays with the same trailing shape
+    :param shape: the trailing shape of each array, () for 1D arrays
+    :param dtype: optional dtype of the concatenated array
+    :return: concatenated array and (n + 1,) start indices
+    """
+    arrays_ = [np.reshape(np.asarray(x, dtype=dtype), (-1, *shape)) for x in arrays]
+    bounds = np.zeros(len(arrays_) + 1, dtype=np.intp)
+    _ = np.cumsum([len(x) for x in arrays_], out=bounds[1:])
+    if not arrays_:
+        return np.zeros((0, *shape), dtype=dtype), bounds
+    return np.concatenate(arrays_), bounds
+
+
+def _offset_chunk(
+    polys: _Ragged, offsets: _Ragged, poly_type: PolyType, dtype: npt.DTypeLike
+) -> tuple[GapCornerArray, _IArray]:
+    """Offset each edge of each polyline in a chunk. This runs in a worker.
+
+    :param polys: concatenated (m, 2) points and start index of each polyline
+    :param offsets: concatenated edge offsets and start index of each polyline's
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param dtype: float32 or float64
+    :return: one GapCornerArray for the whole chunk and the start index of each
+        polyline's rows. Pickling one GapCornerArray sends only a few buffers.
+    """
+    (points, ring_bounds), (edge_offsets, edge_offset_bounds) = polys, offsets
+    corners = offset_rings(
+        points, ring_bounds, edge_offsets, poly_type, edge_offset_bounds, dtype=dtype
+    )
+    return corners, ring_bounds
+
+
+def offset_many(
+    polys: Sequence[npt.ArrayLike],
+    offsets: float | Sequence[float | Sequence[float]],
+    poly_type: PolyType,
+    workers: int | None = None,
+    *,
+    dtype: npt.DTypeLike = float,
+) -> list[GapCornerArray]:
+    """Offset each edge of many polylines or polygons in parallel.
+
+    :param polys: sequence of (n, 2) arrays of points
+    :param offsets: one offset (a Python or NumPy scalar, or a 0-d array) for
+        every edge of every polyline, or one item per polyline. Each item is
+        either one offset for every edge or a sequence of offsets, one per edge,
+        as in offset_poly_per_edge.
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param workers: number of worker processes. Default is os.cpu_count(). Pass
+        1 to work in this process.
+    :param dtype: float32 or float64. Points are sent to workers and results are
+        sent back in this dtype, so float32 halves the bytes pickled each way.
+    :return: one GapCornerArray per polyline, in input order
+    :raise ValueError: if the number of offsets does not match the number of polys
+    :raise ValueError: if dtype is not float32 or float64
+
+    Small batches are offset in this process, because starting a process pool
+    would take longer than offsetting them.
+    """
+    if isinstance(offsets, numbers.Real) or getattr(offsets, "ndim", None) == 0:
+        offsets = [cast("float", offsets)] * len(polys)
+    offsets = cast("Sequence[float | Sequence[float]]", offsets)
+    if len(offsets) != len(polys):
+        msg = f"expected {len(polys)} offsets, got {len(offsets)}"
+        raise ValueError(msg)
+    if not polys:
+        return []
+    dtype = get_float_dtype(dtype)
+
+    workers = workers or os.cpu_count() or 1
+    num_points = sum(len(np.reshape(np.asarray(x), (-1, 2))) for x in polys)
+    if workers == 1 or num_points < _MIN_POINTS_FOR_POOL:
+        return split_rings(
+            *_offset_chunk(_pack(polys, (2,), dtype), _pack(offsets), poly_type, dtype)
+        )
+
+    chunk_size = math.ceil(len(polys) / (workers * _CHUNKS_PER_WORKER))
+    starts = range(0, len(polys), chunk_size)
+    results: list[GapCornerArray] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _offset_chunk,
+                _pack(polys[i : i + chunk_size], (2,), dtype),
+                _pack(offsets[i : i + chunk_size]),
+                poly_type,
+                dtype,
+            )
+            for i in starts
+        ]
+        for future in futures:
+            results.extend(split_rings(*future.result()))
+    return results
+
+
+def _get_ring_gaps(
+    corner_ring: _IArray, corner_local: _IArray, ring_lengths: _IArray, offsets: _Ragged
+) -> tuple[_FArray, _FArray]:
+    """Pair edge offsets with corners the way offset_poly_per_edge does.
+
+    :param corner_ring: (k,) ring index of each corner
+    :param corner_local: (k,) index of each corner in its ring
+    :param ring_lengths: (r,) number of input points in each ring
+    :param offsets: concatenated edge offsets (in the dtype of the result) and
+        start index of each ring's
+    :return: (k,) gap_1 and (k,) gap_2 for each corner
+
+    The first len(ring) offsets are used, then repeated if there are fewer
+    offsets than corners. Rings without offsets are not offset.
+    """
+    values, bounds = offsets
+    num_offsets = np.minimum(np.diff(bounds), ring_lengths)[corner_ring]
+    has_offsets = num_offsets > 0
+    num_offsets = np.maximum(num_offsets, 1)
+    beg = bounds[:-1][corner_ring]
+    next_i = corner_local % num_offsets
+    prev_i = (next_i - 1) % num_offsets
+    values = np.append(values, np.zeros(1, dtype=values.dtype))
+    last = len(values) - 1
+    gaps_1 = values[np.where(has_offsets, beg + prev_i, last)]
+    gaps_2 = values[np.where(has_offsets, beg + next_i, last)]
+    return gaps_1, gaps_2
+
+
+def _get_is_polygon(
+    poly_types: PolyType | Sequence[PolyType], num_rings: int
+) -> _BArray:
+    """Flag polygon rings.
+
+    :param poly_types: one PolyType for every ring or a sequence of PolyTypes
+    :param num_rings: number of rings
+    :return: (r,) boolean array. True for polygons, False for polylines.
+    :raise ValueError: if any poly_type is not PolyType.POLYGON or PolyType.POLYLINE
+    """
+    if isinstance(poly_types, PolyType):
+        poly_types = [poly_types] * num_rings
+    if any(x not in {PolyType.POLYGON, PolyType.POLYLINE} for x in poly_types):
+        msg = "poly_types must be PolyType.POLYGON or PolyType.POLYLINE"
+        raise ValueError(msg)
+    is_polygon = np.array([x == PolyType.POLYGON for x in poly_types], dtype=bool)
+    return np.reshape(is_polygon, num_rings)
+
+
+def _wrap_and_anchor_rings(
+    corners: _FArray, corner_ring: _IArray, num_corners: _IArray, is_polygon: _BArray
+) -> _FArray:
+    """Wrap each polygon ring and anchor each polyline ring.
+
+    :param corners: (k, 2) array of unique points of every ring, one after another
+    :param corner_ring: (k,) ring index of each corner
+    :param num_corners: (r,) number of corners in each ring
+    :param is_polygon: (r,) True for polygon rings
+    :return: (k + 2r, 2) array. Ring i is num_corners[i] + 2 windows, the same
+        points _wrap_polygon or _anchor_polyline would return for that ring.
+    """
+    num_rings = len(num_corners)
+    corner_beg = np.concatenate(([0], np.cumsum(num_corners)[:-1]))
+    corner_end = corner_beg + num_corners - 1
+    window_beg = corner_beg + 2 * np.arange(num_rings)
+    windows = np.empty((len(corners) + 2 * num_rings, 2), dtype=corners.dtype)
+    windows[np.arange(len(corners)) + 2 * corner_ring + 1] = corners
+    windows[window_beg] = np.where(
+        is_polygon[:, np.newaxis],
+        corners[corner_end],
+        2 * corners[corner_beg] - corners[np.minimum(corner_beg + 1, corner_end)],
+    )
+    windows[window_beg + num_corners + 1] = np.where(
+        is_polygon[:, np.newaxis],
+        corners[corner_beg],
+        2 * corners[corner_end] - corners[np.maximum(corner_end - 1, corner_beg)],
+    )
+    return windows
+
+
+def offset_rings(  # noqa: PLR0913, PLR0915
+    points: npt.ArrayLike,
+    ring_bounds: npt.ArrayLike,
+    offsets: float | npt.ArrayLike,
+    poly_types: PolyType | Sequence[PolyType],
+    edge_offset_bounds: npt.ArrayLike | None = None,
+    *,
+    dtype: npt.DTypeLike = float,
+) -> GapCornerArray:
+    """Offset each edge of many concatenated polylines and polygons in one pass.
+
+    :param points: (m, 2) array of the points of every ring, one after another
+    :param ring_bounds: (r + 1,) start index of each ring in points, then m
+    :param offsets: one offset for every edge of every ring, an (r,) array with
+        one offset per ring, or, if edge_offset_bounds is given, a flat array of
+        per-edge offsets for every ring (as in offset_poly_per_edge)
+    :param poly_types: PolyType.POLYGON or PolyType.POLYLINE for every ring, or a
+        sequence with one PolyType per ring
+    :param edge_offset_bounds: optional (r + 1,) start index of each ring's edge
+        offsets in offsets
+    :param dtype: float32 or float64. Points and offsets are cast to this, and
+        every result is computed in it.
+    :return: a GapCornerArray with one row per input point. Rows for ring i are
+        ring_bounds[i]:ring_bounds[i + 1], same as the input points.
+    :raise ValueError: if any polygon ring has fewer than three unique points
+    :raise ValueError: if any polyline ring has fewer than two unique points
+    :raise ValueError: if dtype is not float32 or float64
+
+    Cleaning, wrapping, anchoring, and offsetting happen for every ring at once, so
+    there is no per-ring Python overhead. With record_stats, the whole batch
+    counts as one call.
+    """
+    dtype = get_float_dtype(dtype)
+    stats = get_active_stats()
+    with time_phase(stats, "prepare"):
+        pnts = np.reshape(np.asarray(points, dtype=dtype), (-1, 2))
+        bounds = np.asarray(ring_bounds, dtype=np.intp)
+        num_rings = len(bounds) - 1
+        ring_lengths = np.diff(bounds)
+        point_ring = np.repeat(np.arange(num_rings), ring_lengths)
+        is_polygon = _get_is_polygon(poly_types, num_rings)
+
+        # remove coincident adjacent points, but keep the first point of every ring
+        keep = np.ones(len(pnts), dtype=bool)
+        keep[1:] = np.any(pnts[1:] != pnts[:-1], axis=1)
+        keep[bounds[:-1][ring_lengths > 0]] = True
+        unique = pnts[keep]
+        num_unique = np.bincount(point_ring[keep], minlength=num_rings)
+        min_unique = np.where(is_polygon, MIN_PTS_FOR_POLYGON, MIN_PTS_FOR_POLYLINE)
+        if np.any(too_few := num_unique < min_unique):
+            msg = f"too few unique points in ring {int(np.argmax(too_few))}"
+            raise ValueError(msg)
+
+        # drop the closing point of closed polygons
+        unique_beg = np.concatenate(([0], np.cumsum(num_unique)[:-1]))
+        unique_end = unique_beg + num_unique - 1
+        is_closed = is_polygon & np.all(
+            unique[unique_beg] == unique[unique_end], axis=1
+        )
+        is_corner = np.ones(len(unique), dtype=bool)
+        is_corner[unique_end[is_closed]] = False
+        corners = unique[is_corner]
+        num_corners = num_unique - is_closed
+        corner_ring = np.repeat(np.arange(num_rings), num_corners)
+        corner_beg = np.concatenate(([0], np.cumsum(num_corners)[:-1]))
+        corner_end = corner_beg + num_corners - 1
+        corner_local = np.arange(len(corners)) - corner_beg[corner_ring]
+
+        windows = _wrap_and_anchor_rings(corners, corner_ring, num_corners, is_polygon)
+        window_b = np.arange(len(corners)) + 2 * corner_ring + 1
+
+        if edge_offset_bounds is None:
+            ring_offsets = np.broadcast_to(
+                np.asarray(offsets, dtype=dtype), (num_rings,)
+            )
+            ragged = (ring_offsets, np.arange(num_rings + 1))
+        else:
+            edge_offsets = np.asarray(offsets, dtype=dtype)
+            ragged = (edge_offsets, np.asarray(edge_offset_bounds, dtype=np.intp))
+        gaps_1, gaps_2 = _get_ring_gaps(corner_ring, corner_local, ring_lengths, ragged)
+        first = corner_beg[~is_polygon]
+        last = corner_end[~is_polygon]
+        gaps_1[first] = gaps_2[first]
+        gaps_2[last] = gaps_1[last]
+
+    with time_phase(stats, "solve"):
+        kernel = CornerKernel(
+            windows[window_b - 1], windows[window_b], windows[window_b + 1]
+        )
+        xsect, cpts = kernel.solve(gaps_1, gaps_2)
+    if stats is not None:
+        kernel.add_stats(stats, xsect)
+
+    # map each input point to its corner. Closing points map to the first corner.
+    with time_phase(stats, "align"):
+        unique2corner = np.cumsum(is_corner) - 1
+        unique2corner[unique_end[is_closed]] = corner_beg[is_closed]
+        point2corner = unique2corner[np.cumsum(keep) - 1]
+        return GapCornerArray(
+            xsect[point2corner],
+            kernel.angle[point2corner],
+            cpts[point2corner],
+            gaps_1[point2corner],
+            gaps_2[point2corner],
+            windows,
+            (window_b - 1)[point2corner],
+        )
+
+
+def split_rings(
+    corners: GapCornerArray, ring_bounds: npt.ArrayLike
+) -> list[GapCornerArray]:
+    """Split the result of offset_rings into one GapCornerArray per ring.
+
+    :param corners: GapCornerArray returned by offset_rings
+    :param ring_bounds: the ring_bounds passed to offset_rings
+    :return: one GapCornerArray per ring. Columns are views into corners.
+    """
+    bounds = np.asarray(ring_bounds, dtype=np.intp)
+    window_bounds = np.append(corners.corner_index[bounds[:-1]], len(corners.windows))
+    return [
+        GapCornerArray(
+            corners.xsect[beg:end],
+            corners.angle[beg:end],
+            corners.cpts[beg:end],
+            corners.gap_1[beg:end],
+            corners.gap_2[beg:end],
+            corners.windows[win_beg:win_end],
+            corners.corner_index[beg:end] - win_beg,
+        )
+        for (beg, end), (win_beg, win_end) in zip(
+            it.pairwise(bounds), it.pairwise(window_bounds), strict=True
+        )
+    ]
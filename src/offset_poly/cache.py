@@ -0,0 +1,372 @@
+"""Cache offset results for outlines that are offset again and again.
+
+Each result is keyed by a hash of the coordinates, the offsets, the tolerance,
+and the PolyType. When the results held take more than max_bytes, the least
+recently used results are evicted.
+
+~~~python
+cache = OffsetCache(translation_invariant=True)
+for position in positions:
+    corners = cache.offset_polygon(move(glyph, position), 1)
+print(cache)
+~~~
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import hashlib
+import itertools as it
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, cast
+
+from offset_poly.offset import (
+    PolyType,
+    get_view,
+    is_buffer,
+    offset_poly_per_edge,
+    offset_polygon,
+    offset_polyline,
+    take_buffer_offsets,
+    unpack_buffer,
+)
+from offset_poly.offset_corner import GapCorner
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import numpy.typing as npt
+
+    from offset_poly.offset_array import GapCornerArray
+
+    # an (n, 2) NumPy array or a flat buffer of interleaved x, y values
+    _Buffer = npt.NDArray[Any] | memoryview | array[float]
+    _Points = list[tuple[float, float]] | npt.NDArray[Any]
+    _Result = list[GapCorner] | GapCornerArray
+
+_Vec2 = tuple[float, float] | Iterable[float]
+
+# 64MB of results
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+def _get_points(polyline: Sequence[_Vec2] | _Buffer, *, as_array: bool) -> _Points:
+    """Read points as floats, the way the offset functions will read them.
+
+    :param polyline: a sequence of points or a buffer
+    :param as_array: if True, read points into an array for the NumPy backend
+    :return: an (n, 2) float64 array if as_array is True, else a list of (x, y)
+        float tuples
+    """
+    if as_array:
+        import numpy as np  # noqa: PLC0415
+
+        points = np.reshape(np.asarray(polyline, dtype=float), (-1, 2))
+        return np.ascontiguousarray(points)
+    if is_buffer(polyline):
+        polyline = unpack_buffer(polyline)
+    return [(float(x), float(y)) for x, y in cast("Sequence[_Vec2]", polyline)]
+
+
+def _move_to_origin(points: _Points) -> tuple[_Points, tuple[float, float] | None]:
+    """Move points so the first point is at the origin.
+
+    :param points: points from _get_points
+    :return: (moved points, first point), or (points, None) if there are none
+    """
+    if len(points) == 0:
+        return points, None
+    if isinstance(points, list):
+        x_0, y_0 = points[0]
+        return [(x - x_0, y - y_0) for x, y in points], (x_0, y_0)
+    x_0, y_0 = points[0].tolist()
+    return points - points[0], (x_0, y_0)
+
+
+@functools.cache
+def _get_gap_corner_nbytes() -> int:
+    """Measure the bytes held by one GapCorner with xsect and cpts computed.
+
+    :return: size of a sample corner and of every tuple and number its slots
+        hold. Lazy corners that never computed cpts hold less, so this is an
+        upper bound.
+    """
+    corner = GapCorner((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), 1.0, 1.0)
+    _ = corner.xsect, corner.cpts
+    nbytes = sys.getsizeof(corner)
+    seen: set[int] = set()
+    held: list[object] = [getattr(corner, x, None) for x in GapCorner.__slots__]
+    while held:
+        obj = held.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        nbytes += sys.getsizeof(obj)
+        if isinstance(obj, tuple):
+            held.extend(cast("tuple[object, ...]", obj))
+    return nbytes
+
+
+def _get_nbytes(result: _Result) -> int:
+    """Estimate the bytes held by an offset result.
+
+    :param result: a list of GapCorner instances or a GapCornerArray
+    :return: estimated bytes. Repeated corners (from coincident input points)
+        are counted once.
+    """
+    if isinstance(result, list):
+        num_corners = len({id(x) for x in result})
+        return sys.getsizeof(result) + num_corners * _get_gap_corner_nbytes()
+    return result.nbytes
+
+
+def _translate(result: _Result, vec: tuple[float, float]) -> _Result:
+    """Move every point of an offset result.
+
+    :param result: a list of GapCorner instances or a GapCornerArray
+    :param vec: (x, y) distance to move every point
+    :return: a new result. Repeated corners are still the same instance.
+    """
+    if not isinstance(result, list):
+        return result.translate(vec)
+    moved: dict[int, GapCorner] = {}
+    for corner in result:
+        if id(corner) not in moved:
+            moved[id(corner)] = corner.translate(vec)
+    return [moved[id(x)] for x in result]
+
+
+class OffsetCache:
+    """A bounded LRU cache in front of the offset functions.
+
+    :param max_bytes: evict the least recently used results when the results
+        held take more than this many (estimated) bytes. A result larger than
+        max_bytes is returned but not held.
+    :param translation_invariant: if True, move each input so its first point
+        is at the origin before it is keyed and offset, then move the result
+        back. The same outline at different positions then shares one result,
+        which matches an uncached offset to within floating-point rounding.
+        Moved points are keyed on the exact floats x - x0 and y - y0, so two
+        outlines that are equal only up to rounding after the move always miss.
+    :ivar hits: number of calls answered from the cache
+    :ivar misses: number of calls that had to offset
+    :ivar evictions: number of results evicted to stay within max_bytes
+    :ivar nbytes: estimated bytes held by cached results
+    :raise ValueError: if max_bytes is less than 0
+
+    Without translation_invariant, a hit returns the result computed on the
+    miss. GapCornerArray results are shared between callers, so their arrays
+    are made read-only. Lists of GapCorner instances are copied, but the
+    GapCorner instances are shared.
+    """
+
+    __slots__ = (
+        "_entries",
+        "evictions",
+        "hits",
+        "max_bytes",
+        "misses",
+        "nbytes",
+        "translation_invariant",
+    )
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, *, translation_invariant: bool = False
+    ) -> None:
+        """Start with an empty cache."""
+        if max_bytes < 0:
+            msg = f"max_bytes must be at least 0, not {max_bytes}"
+            raise ValueError(msg)
+        self.max_bytes = max_bytes
+        self.translation_invariant = translation_invariant
+        self._entries: collections.OrderedDict[bytes, tuple[_Result, int]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def __repr__(self) -> str:
+        """Show every count."""
+        return (
+            f"OffsetCache(entries={len(self)}, nbytes={self.nbytes}, "
+            + f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached result. Hit, miss, and eviction counts are kept."""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _prepare(
+        self, polyline: Sequence[_Vec2] | _Buffer, *, as_array: bool
+    ) -> tuple[_Points, tuple[float, float] | None]:
+        """Read points and move them to the origin if translation_invariant.
+
+        :param polyline: a sequence of points or a buffer
+        :param as_array: if True, read points into an array
+        :return: (points, origin). origin is None if points were not moved.
+        """
+        points = _get_points(polyline, as_array=as_array)
+        if self.translation_invariant:
+            return _move_to_origin(points)
+        return points, None
+
+    def _store(self, key: bytes, result: _Result) -> None:
+        """Hold a result, then evict least recently used results to fit.
+
+        :param key: hash of the call
+        :param result: offset result
+        """
+        nbytes = _get_nbytes(result)
+        if nbytes > self.max_bytes:
+            return
+        if not isinstance(result, list):
+            for name in type(result).__slots__:
+                getattr(result, name).flags.writeable = False
+        self._entries[key] = (result, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def _get_or_offset(  # noqa: PLR0913, PLR0917
+        self,
+        points: _Points,
+        origin: tuple[float, float] | None,
+        offsets: _Buffer,
+        poly_type: PolyType,
+        tolerance: float,
+        offset: Callable[[_Points], _Result],
+    ) -> _Result:
+        """Return a cached result, or offset points and cache the result.
+
+        :param points: points from _prepare
+        :param origin: where _prepare moved the first point from, if anywhere
+        :param offsets: a buffer of offset values to key on
+        :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+        :param tolerance: maximum distance between coincident adjacent points
+        :param offset: function to offset points on a miss
+        :return: the offset result, moved back to origin
+        """
+        # 128-bit digests, so a collision is far less likely than a bad float
+        digest = hashlib.blake2b(digest_size=16)
+        offsets_ = get_view(offsets).cast("B")
+        if isinstance(points, list):
+            points_ = memoryview(array("d", it.chain.from_iterable(points))).cast("B")
+        else:
+            points_ = get_view(points).cast("B")
+        head = (poly_type.value, isinstance(points, list), len(offsets_), tolerance)
+        digest.update(struct.pack("<i?qd", *head))
+        digest.update(offsets_)
+        digest.update(points_)
+        key = digest.digest()
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            result = offset(points)
+            self._store(key, result)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            result, _ = entry
+        if origin is not None:
+            return _translate(result, origin)
+        if isinstance(result, list):
+            return list(result)
+        return result
+
+    def offset_poly_per_edge(
+        self,
+        polyline: Sequence[_Vec2] | _Buffer,
+        edge_offsets: Iterable[float] | _Buffer,
+        poly_type: PolyType,
+        *,
+        tolerance: float = 0,
+        as_array: bool = False,
+    ) -> list[GapCorner] | GapCornerArray:
+        """Offset each edge of a polyline or polygon, or return a cached result.
+
+        See offset_poly.offset.offset_poly_per_edge.
+        """
+        points, origin = self._prepare(polyline, as_array=as_array)
+        if isinstance(points, list):
+            offsets: array[float] | npt.NDArray[Any] = array(
+                "d", (x for x, _ in zip(edge_offsets, points, strict=False))
+            )
+        else:
+            import numpy as np  # noqa: PLC0415
+
+            offsets = np.ascontiguousarray(
+                take_buffer_offsets(edge_offsets, points), dtype=float
+            )
+        return self._get_or_offset(
+            points,
+            origin,
+            offsets,
+            poly_type,
+            tolerance,
+            lambda x: offset_poly_per_edge(
+                x, offsets, poly_type, tolerance=tolerance, as_array=as_array
+            ),
+        )
+
+    def offset_polyline(
+        self,
+        polyline: Sequence[_Vec2] | _Buffer,
+        offset: float,
+        *,
+        tolerance: float = 0,
+        as_array: bool = False,
+    ) -> list[GapCorner] | GapCornerArray:
+        """Offset polyline edges by a constant amount, or return a cached result.
+
+        See offset_poly.offset.offset_polyline.
+        """
+        points, origin = self._prepare(polyline, as_array=as_array)
+        return self._get_or_offset(
+            points,
+            origin,
+            memoryview(struct.pack("<d", offset)),
+            PolyType.POLYLINE,
+            tolerance,
+            lambda x: offset_polyline(
+                x, offset, tolerance=tolerance, as_array=as_array
+            ),
+        )
+
+    def offset_polygon(
+        self,
+        polyline: Sequence[_Vec2] | _Buffer,
+        offset: float,
+        *,
+        tolerance: float = 0,
+        as_array: bool = False,
+    ) -> list[GapCorner] | GapCornerArray:
+        """Offset polygon edges by a constant amount, or return a cached result.
+
+        See offset_poly.offset.offset_polygon.
+        """
+        points, origin = self._prepare(polyline, as_array=as_array)
+        return self._get_or_offset(
+            points,
+            origin,
+            memoryview(struct.pack("<d", offset)),
+            PolyType.POLYGON,
+            tolerance,
+            lambda x: offset_polygon(x, offset, tolerance=tolerance, as_array=as_array),
+        )
@@ -0,0 +1,259 @@
+"""Offset polyline datasets larger than memory, one chunk at a time.
+
+Points are read from (and xsect points written to) NumPy arrays, which can be
+np.memmap views of flat binary files. Only one chunk of points is held in memory
+at a time.
+
+Rings that fit in a chunk are grouped and offset together with offset_rings.
+A ring larger than a chunk is split into pieces at the start of a run of
+coincident points. Each piece is offset with one neighbor point on either side
+(the previous and next unique points, wrapping around for polygons), so every
+corner sees the same three-point window it would see if the whole ring were
+offset at once.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from offset_poly.batch import offset_rings
+from offset_poly.offset import MIN_PTS_FOR_POLYGON, MIN_PTS_FOR_POLYLINE, PolyType
+from offset_poly.offset_array import get_float_dtype
+
+if TYPE_CHECKING:
+    import os
+
+    import numpy.typing as npt
+
+    _FArray = npt.NDArray[np.floating[Any]]
+
+# about 16MB of float64 xy points
+DEFAULT_CHUNK_POINTS = 1_000_000
+
+
+def _get_run_start(ring: _FArray, index: int, chunk_points: int) -> int:
+    """Find the first run of coincident points that starts at or after index.
+
+    :param ring: (n, 2) array of points
+    :param index: index to start searching from
+    :param chunk_points: number of points to read at a time
+    :return: smallest i >= index where ring[i] != ring[i - 1], or len(ring)
+    """
+    index = max(index, 1)
+    while index < len(ring):
+        block = np.asarray(ring[index - 1 : index + chunk_points])
+        is_new = np.any(block[1:] != block[:-1], axis=1)
+        if np.any(is_new):
+            return index + int(np.argmax(is_new))
+        index += chunk_points
+    return len(ring)
+
+
+def _get_run_end(ring: _FArray, chunk_points: int) -> int:
+    """Find the last point before the last run of coincident points.
+
+    :param ring: (n, 2) array of points
+    :param chunk_points: number of points to read at a time
+    :return: largest i where ring[i] != ring[-1], or -1 if there is none
+    """
+    last = np.asarray(ring[-1])
+    end = len(ring) - 1
+    while end > 0:
+        beg = max(end - chunk_points, 0)
+        is_new = np.any(np.asarray(ring[beg:end]) != last, axis=1)
+        if np.any(is_new):
+            return end - 1 - int(np.argmax(is_new[::-1]))
+        end = beg
+    return -1
+
+
+def _count_runs(ring: _FArray, chunk_points: int) -> int:
+    """Count the runs of coincident adjacent points in a ring.
+
+    :param ring: (n, 2) array of points
+    :param chunk_points: number of points to read at a time
+    :return: number of unique adjacent points
+    """
+    num_breaks = 0
+    for beg in range(0, len(ring) - 1, chunk_points):
+        block = np.asarray(ring[beg : beg + chunk_points + 1])
+        num_breaks += int(np.count_nonzero(np.any(block[1:] != block[:-1], axis=1)))
+    return num_breaks + 1
+
+
+def _get_wrap_points(
+    ring: _FArray, poly_type: PolyType, chunk_points: int
+) -> tuple[_FArray | None, _FArray | None]:
+    """Find the point before the first corner and after the last corner.
+
+    :param ring: (n, 2) array of points
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param chunk_points: number of points to read at a time
+    :return: (prev, next). None, None for a polyline, which is anchored at the
+        ends instead. For a polygon, the last unique point and the first unique
+        point, skipping the closing run if the polygon is closed.
+    :raise ValueError: if there are too few unique points
+    """
+    num_unique = _count_runs(ring, chunk_points)
+    is_closed = num_unique > 1 and np.array_equal(ring[0], ring[-1])
+    if poly_type == PolyType.POLYLINE:
+        if num_unique < MIN_PTS_FOR_POLYLINE:
+            msg = "at least two unique points required for a polyline"
+            raise ValueError(msg)
+        return None, None
+    if num_unique < MIN_PTS_FOR_POLYGON:
+        msg = "at least three unique points required for a polygon"
+        raise ValueError(msg)
+    if not is_closed:
+        return np.asarray(ring[-1]), np.asarray(ring[0])
+    prev_ = ring[_get_run_end(ring, chunk_points)]
+    next_ = ring[_get_run_start(ring, 1, chunk_points)]
+    return np.asarray(prev_), np.asarray(next_)
+
+
+def _offset_large_ring(
+    ring: _FArray, offset: float, poly_type: PolyType, out: _FArray, chunk_points: int
+) -> None:
+    """Offset a ring that does not fit in one chunk, one piece at a time.
+
+    :param ring: (n, 2) array of points
+    :param offset: distance to offset every edge (to the left)
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param out: (n, 2) array to write xsect points into
+    :param chunk_points: approximate number of points in each piece. Pieces are
+        extended to the start of the next run of coincident points.
+    :raise ValueError: if there are too few unique points
+
+    Each piece is offset as a polyline with one extra point at each end. The
+    corners of those extra points are thrown away. The first and last pieces of
+    a polyline have no extra point at the open end, so they are anchored exactly
+    as the whole polyline would be.
+    """
+    wrap_prev, wrap_next = _get_wrap_points(ring, poly_type, chunk_points)
+    beg = 0
+    while beg < len(ring):
+        end = _get_run_start(ring, beg + chunk_points, chunk_points)
+        prev_ = np.asarray(ring[beg - 1]) if beg > 0 else wrap_prev
+        next_ = np.asarray(ring[end]) if end < len(ring) else wrap_next
+        piece = [np.asarray(ring[beg:end])]
+        if prev_ is not None:
+            piece.insert(0, prev_[np.newaxis])
+        if next_ is not None:
+            piece.append(next_[np.newaxis])
+        points = np.concatenate(piece)
+        corners = offset_rings(
+            points, [0, len(points)], offset, PolyType.POLYLINE, dtype=out.dtype
+        )
+        skip = int(prev_ is not None)
+        out[beg:end] = corners.xsect[skip : skip + end - beg]
+        beg = end
+
+
+def offset_rings_chunked(  # noqa: PLR0913
+    points: npt.ArrayLike,
+    ring_bounds: npt.ArrayLike,
+    offsets: float | npt.ArrayLike,
+    poly_type: PolyType,
+    out: _FArray,
+    *,
+    chunk_points: int = DEFAULT_CHUNK_POINTS,
+) -> _FArray:
+    """Offset each edge of many concatenated rings, one chunk at a time.
+
+    :param points: (m, 2) array of the points of every ring, one after another.
+        Pass an np.memmap to offset data that does not fit in memory.
+    :param ring_bounds: (r + 1,) start index of each ring in points, then m
+    :param offsets: one offset for every edge of every ring, or an (r,) array
+        with one offset per ring
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE for every ring
+    :param out: (m, 2) float32 or float64 array to write xsect points into. Pass
+        an np.memmap to write results that do not fit in memory.
+    :param chunk_points: number of points to hold in memory at a time
+    :return: out
+    :raise ValueError: if ring_bounds do not cover points
+    :raise ValueError: if any ring has too few unique points
+
+    out matches offset_rings(points, ring_bounds, offsets, poly_type).xsect.
+    """
+    points_ = np.reshape(np.asarray(points), (-1, 2))
+    bounds = np.asarray(ring_bounds)
+    num_rings = len(bounds) - 1
+    if num_rings < 0 or bounds[0] != 0 or bounds[-1] != len(points_):
+        msg = f"ring_bounds must start at 0 and end at {len(points_)}"
+        raise ValueError(msg)
+    if out.shape != points_.shape:
+        msg = f"out must have shape {points_.shape}, not {out.shape}"
+        raise ValueError(msg)
+    dtype = get_float_dtype(out.dtype)
+    ring_offsets = np.broadcast_to(np.asarray(offsets, dtype=dtype), (num_rings,))
+
+    ring = 0
+    while ring < num_rings:
+        beg = int(bounds[ring])
+        # the last ring that ends within chunk_points of beg
+        last = int(np.searchsorted(bounds, beg + chunk_points, side="right")) - 1
+        if last <= ring:
+            end = int(bounds[ring + 1])
+            _offset_large_ring(
+                points_[beg:end],
+                float(ring_offsets[ring]),
+                poly_type,
+                out[beg:end],
+                chunk_points,
+            )
+            ring += 1
+            continue
+        end = int(bounds[last])
+        corners = offset_rings(
+            points_[beg:end],
+            np.asarray(bounds[ring : last + 1]) - beg,
+            np.asarray(ring_offsets[ring:last]),
+            poly_type,
+            dtype=dtype,
+        )
+        out[beg:end] = corners.xsect
+        ring = last
+    return out
+
+
+def offset_xy_file(  # noqa: PLR0913
+    points_path: str | os.PathLike[str],
+    ring_bounds_path: str | os.PathLike[str],
+    out_path: str | os.PathLike[str],
+    offsets: float | npt.ArrayLike,
+    poly_type: PolyType,
+    *,
+    dtype: npt.DTypeLike = float,
+    chunk_points: int = DEFAULT_CHUNK_POINTS,
+) -> np.memmap[Any, np.dtype[Any]]:
+    """Offset every ring in a flat binary file of xy points.
+
+    :param points_path: file of interleaved x, y values in dtype (as written by
+        ndarray.tofile)
+    :param ring_bounds_path: file of int64 values. The start index of each ring
+        in points, then the number of points.
+    :param out_path: file to write interleaved xsect x, y values to, in dtype.
+        Overwritten if it exists.
+    :param offsets: one offset for every edge of every ring, or an (r,) array
+        with one offset per ring
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE for every ring
+    :param dtype: float32 or float64. The dtype of points_path and out_path.
+    :param chunk_points: number of points to hold in memory at a time
+    :return: the output file, memory mapped
+    :raise ValueError: if ring_bounds do not cover points
+    :raise ValueError: if any ring has too few unique points
+    """
+    dtype = get_float_dtype(dtype)
+    points = np.reshape(np.memmap(points_path, dtype=dtype, mode="r"), (-1, 2))
+    ring_bounds = np.memmap(ring_bounds_path, dtype=np.int64, mode="r")
+    out = np.memmap(out_path, dtype=dtype, mode="w+", shape=points.shape)
+    _ = offset_rings_chunked(
+        points, ring_bounds, offsets, poly_type, out, chunk_points=chunk_points
+    )
+    out.flush()
+    return out
@@ -0,0 +1,687 @@
+"""Offset every polygon or polyline in a file from the command line.
+
+    python -m offset_poly shapes.wkt --offset 0.5 -o offset.wkt
+
+Reads one geometry per line (WKT or GeoJSON), rows of ring,x,y (CSV), an (n, 2)
+or (k, n, 2) array (NPY), or a flat binary xy file with a ring-bounds file (XY).
+Every ring is offset with offset_poly_per_edge. Chunks of geometries are sent to
+worker processes, and results are written in input order as soon as each chunk
+is done, so memory use does not grow with the size of the input. Throughput
+stats are printed to stderr.
+
+Degenerate corners (where a ring doubles back on itself) have no xsect. They are
+dropped from WKT, GeoJSON, and CSV output, which cannot hold nan. NPY and XY
+output keep one (nan, nan) row for each, so rows still line up with input points.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import functools
+import itertools as it
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+from offset_poly.offset import (
+    MIN_PTS_FOR_POLYGON,
+    MIN_PTS_FOR_POLYLINE,
+    PolyType,
+    offset_poly_per_edge,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+
+    import numpy.typing as npt
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_Ring = list[tuple[float, float]]
+
+# a geometry to offset: everything needed to write it back, its rings, poly_type
+_Record = tuple[Any, list[_Ring], PolyType]
+
+_FORMATS = ("wkt", "geojson", "csv", "npy", "xy")
+
+_SUFFIX2FORMAT = {
+    ".wkt": "wkt",
+    ".geojson": "geojson",
+    ".geojsonl": "geojson",
+    ".geojsons": "geojson",
+    ".jsonl": "geojson",
+    ".ndjson": "geojson",
+    ".csv": "csv",
+    ".npy": "npy",
+    ".xy": "xy",
+    ".bin": "xy",
+}
+
+# GeoJSON geometry type -> (nesting depth of rings in coordinates, poly_type)
+_GEOJSON_TYPES = {
+    "LineString": (0, PolyType.POLYLINE),
+    "MultiLineString": (1, PolyType.POLYLINE),
+    "Polygon": (1, PolyType.POLYGON),
+    "MultiPolygon": (2, PolyType.POLYGON),
+}
+
+_WKT_TYPES = {
+    "LINESTRING": PolyType.POLYLINE,
+    "MULTILINESTRING": PolyType.POLYLINE,
+    "POLYGON": PolyType.POLYGON,
+    "MULTIPOLYGON": PolyType.POLYGON,
+}
+
+# the innermost parentheses of a WKT geometry hold the points of one ring
+_WKT_RING = re.compile(r"\(([^()]*)\)")
+
+# keep each worker busy with this many chunks in flight
+_CHUNKS_PER_WORKER = 2
+
+
+def _parse_offsets(value: str) -> tuple[float, ...]:
+    """Parse one offset or a comma-separated list of per-edge offsets.
+
+    :param value: e.g. "1" or "1,2,1,2"
+    :return: tuple of offsets
+    :raise argparse.ArgumentTypeError: if any value is not a float
+    """
+    try:
+        return tuple(float(x) for x in value.split(","))
+    except ValueError as e:
+        msg = f"offsets must be floats separated by commas, not {value!r}"
+        raise argparse.ArgumentTypeError(msg) from e
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Describe the command-line arguments.
+
+    :return: argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m offset_poly",
+        description="Offset every polygon or polyline in a file (to the left).",
+    )
+    _ = parser.add_argument(
+        "input", nargs="?", default="-", help="input file, or - for stdin (default)"
+    )
+    _ = parser.add_argument(
+        "-o", "--output", default="-", help="output file, or - for stdout (default)"
+    )
+    _ = parser.add_argument(
+        "-f",
+        "--format",
+        choices=_FORMATS,
+        help="input and output format. Default is inferred from the input suffix.",
+    )
+    _ = parser.add_argument(
+        "-d",
+        "--offset",
+        type=_parse_offsets,
+        required=True,
+        help="distance to offset every edge, or comma-separated per-edge offsets "
+        + "(repeated if a ring has more edges)",
+    )
+    _ = parser.add_argument(
+        "-t",
+        "--type",
+        choices=("polygon", "polyline"),
+        default="polygon",
+        help="poly type for csv, npy, and xy input. WKT and GeoJSON geometry "
+        + "types are used as they are.",
+    )
+    _ = parser.add_argument(
+        "--ring-bounds",
+        help="xy format only: file of int64 start index of each ring, then the "
+        + "number of points",
+    )
+    _ = parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    _ = parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="geometries per chunk sent to a worker (default: 256)",
+    )
+    _ = parser.add_argument(
+        "-q", "--quiet", action="store_true", help="do not print stats to stderr"
+    )
+    return parser
+
+
+def _get_format(args: argparse.Namespace) -> str:
+    """Use the format argument or infer one from the input file suffix.
+
+    :param args: parsed arguments
+    :return: one of _FORMATS
+    :raise ValueError: if no format is given and the suffix is not known
+    """
+    if args.format:
+        return args.format
+    format_ = _SUFFIX2FORMAT.get(Path(args.input).suffix.lower())
+    if format_ is None:
+        msg = f"cannot infer a format from {args.input!r}. Pass --format."
+        raise ValueError(msg)
+    return format_
+
+
+def _iter_chunks(items: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    """Split an iterable into lists of size items.
+
+    :param items: any iterable. Will only be iterated over once.
+    :param size: number of items in each chunk
+    :yield: lists of up to size items
+    """
+    items = iter(items)
+    while chunk := list(it.islice(items, size)):
+        yield chunk
+
+
+def _imap(func: Callable[[_T], _R], items: Iterable[_T], workers: int) -> Iterator[_R]:
+    """Map func over items in worker processes, in order, with few items in flight.
+
+    :param func: a picklable function
+    :param items: any iterable. Will only be iterated over once.
+    :param workers: number of worker processes. 1 to work in this process.
+    :yield: func(item) for each item, in input order
+    """
+    if workers <= 1:
+        yield from map(func, items)
+        return
+    # multiprocessing is slow to import and not needed for one worker
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[_R]] = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers * _CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _offset_ring(ring: _Ring, offsets: tuple[float, ...], poly_type: PolyType) -> _Ring:
+    """Offset a ring and drop the nan xsects of degenerate corners.
+
+    :param ring: points of one ring
+    :param offsets: per-edge offsets, repeated for rings with more edges
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :return: the xsect points of the ring, without nan points. If a polygon
+        ring is closed (ends where it starts), the result is closed, too.
+        Polyline rings are never closed, because their ends are not joined.
+        An empty list if fewer unique points are left than the poly_type needs,
+        which happens when every corner of a ring is straight or degenerate.
+    """
+    corners = offset_poly_per_edge(ring, it.cycle(offsets), poly_type)
+    xsects = [x.xsect for x in corners if not any(map(math.isnan, x.xsect))]
+    is_polygon = poly_type is PolyType.POLYGON
+    min_pts = MIN_PTS_FOR_POLYGON if is_polygon else MIN_PTS_FOR_POLYLINE
+    if len(set(xsects)) < min_pts:
+        return []
+    is_closed = len(ring) > 1 and ring[0] == ring[-1]
+    is_open = bool(xsects) and xsects[0] != xsects[-1]
+    if is_polygon and is_closed and is_open:
+        xsects.append(xsects[0])
+    return xsects
+
+
+def _offset_chunk(
+    chunk: list[tuple[list[_Ring], PolyType]], offsets: tuple[float, ...]
+) -> list[list[_Ring]]:
+    """Offset every ring of every geometry in a chunk. This runs in a worker.
+
+    :param chunk: (rings, poly_type) for each geometry
+    :param offsets: per-edge offsets, repeated for rings with more edges
+    :return: the xsect points of each ring of each geometry. See _offset_ring.
+    """
+    return [
+        [_offset_ring(ring, offsets, poly_type) for ring in rings]
+        for rings, poly_type in chunk
+    ]
+
+
+def _offset_array_chunk(
+    rings: npt.NDArray[Any], offsets: tuple[float, ...], poly_type: PolyType
+) -> npt.NDArray[Any]:
+    """Offset a (k, n, 2) array of rings with offset_rings. This runs in a worker.
+
+    :param rings: (k, n, 2) array of k rings of n points
+    :param offsets: per-edge offsets, repeated for rings with more edges
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :return: (k, n, 2) array of xsect points. (nan, nan) for degenerate corners.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    from offset_poly.batch import offset_rings  # noqa: PLC0415
+
+    num_rings, num_points = int(rings.shape[0]), int(rings.shape[1])
+    # cycle offsets over the points of each ring, as offset_poly_per_edge does
+    edge_offsets = np.tile(
+        np.resize(np.asarray(offsets, dtype=float), num_points), num_rings
+    )
+    bounds = np.arange(num_rings + 1) * num_points
+    corners = offset_rings(
+        np.reshape(rings, (-1, 2)), bounds, edge_offsets, poly_type, bounds
+    )
+    return np.reshape(corners.xsect, rings.shape)
+
+
+def _iter_offset_records(
+    records: Iterable[_Record], args: argparse.Namespace, stats: list[int]
+) -> Iterator[tuple[Any, list[_Ring]]]:
+    """Offset records in worker processes.
+
+    :param records: (source, rings, poly_type) for each geometry
+    :param args: parsed arguments
+    :param stats: [number of rings, number of points], updated as records are read
+    :yield: (source, offset rings) for each record, in input order
+    """
+    chunks: deque[list[_Record]] = deque()
+    offset_chunk = functools.partial(_offset_chunk, offsets=args.offset)
+
+    def iter_work() -> Iterator[list[tuple[list[_Ring], PolyType]]]:
+        """Send only rings and poly_type to workers. Keep sources here."""
+        for chunk in _iter_chunks(records, args.chunk_size):
+            chunks.append(chunk)
+            for _, rings, _ in chunk:
+                stats[0] += len(rings)
+                stats[1] += sum(map(len, rings))
+            yield [(rings, poly_type) for _, rings, poly_type in chunk]
+
+    for results in _imap(offset_chunk, iter_work(), args.workers):
+        chunk = chunks.popleft()
+        for (source, _, _), rings in zip(chunk, results, strict=True):
+            yield source, rings
+
+
+def _read_wkt(lines: Iterable[str]) -> Iterator[_Record]:
+    """Read one WKT LINESTRING, POLYGON, or MULTI* geometry per line.
+
+    :param lines: lines of text
+    :yield: (wkt text, rings, poly_type) for each non-blank line
+    :raise ValueError: if a line is not one of the supported geometry types
+    """
+    for line in lines:
+        text = line.strip()
+        if not text:
+            continue
+        geom_type = text.split("(", 1)[0].strip().upper()
+        if geom_type not in _WKT_TYPES:
+            msg = f"unsupported WKT geometry: {text[:40]!r}"
+            raise ValueError(msg)
+        rings = [
+            [(float(x), float(y)) for x, y, *_ in map(str.split, ring.split(","))]
+            for ring in _WKT_RING.findall(text)
+        ]
+        yield text, rings, _WKT_TYPES[geom_type]
+
+
+def _drop_empty_rings(
+    results: Iterable[tuple[Any, list[_Ring]]],
+) -> Iterator[tuple[Any, list[_Ring]]]:
+    """Drop every geometry with an empty ring and warn on stderr.
+
+    :param results: (source, offset rings) for each record
+    :yield: (source, offset rings) for each record where no ring is empty
+
+    An empty ring cannot be written as valid WKT or GeoJSON, so the whole
+    geometry is dropped. See _offset_ring.
+    """
+    for i, (source, rings) in enumerate(results, start=1):
+        if all(rings):
+            yield source, rings
+            continue
+        print(  # noqa: T201
+            f"warning: dropped record {i}. Every corner of one of its rings is "
+            + "straight or degenerate, so its offset is not a valid ring.",
+            file=sys.stderr,
+        )
+
+
+def _format_wkt(source: str, rings: list[_Ring]) -> str:
+    """Replace the points of each ring in a WKT geometry.
+
+    :param source: WKT text from _read_wkt
+    :param rings: new points for each ring
+    :return: WKT text with the same structure
+    """
+    rings_ = iter(rings)
+    return _WKT_RING.sub(
+        lambda _: "(" + ", ".join(f"{x} {y}" for x, y in next(rings_)) + ")", source
+    )
+
+
+def _get_geojson_geometry(obj: dict[str, Any]) -> dict[str, Any]:
+    """Find the geometry in a GeoJSON Feature or geometry object.
+
+    :param obj: a parsed GeoJSON object
+    :return: the geometry
+    :raise ValueError: if the geometry type is not supported
+    """
+    geometry = obj["geometry"] if obj.get("type") == "Feature" else obj
+    if geometry.get("type") not in _GEOJSON_TYPES:
+        msg = f"unsupported GeoJSON geometry: {geometry.get('type')!r}"
+        raise ValueError(msg)
+    return geometry
+
+
+def _flatten_rings(coordinates: list[Any], depth: int) -> list[_Ring]:
+    """Collect the rings nested depth lists deep in GeoJSON coordinates.
+
+    :param coordinates: GeoJSON coordinates
+    :param depth: 0 if coordinates is one ring, 1 for a list of rings, ...
+    :return: every ring as a list of (x, y) tuples
+    """
+    if depth == 0:
+        return [[(float(x), float(y)) for x, y, *_ in coordinates]]
+    return [ring for x in coordinates for ring in _flatten_rings(x, depth - 1)]
+
+
+def _nest_rings(
+    coordinates: list[Any], depth: int, rings: Iterator[_Ring]
+) -> list[Any]:
+    """Build GeoJSON coordinates with the structure of coordinates.
+
+    :param coordinates: GeoJSON coordinates to copy the structure of
+    :param depth: 0 if coordinates is one ring, 1 for a list of rings, ...
+    :param rings: new rings, in the order _flatten_rings returned them
+    :return: coordinates with new points
+    """
+    if depth == 0:
+        return [list(x) for x in next(rings)]
+    return [_nest_rings(x, depth - 1, rings) for x in coordinates]
+
+
+def _read_geojson(lines: Iterable[str]) -> Iterator[_Record]:
+    """Read one GeoJSON Feature or geometry per line.
+
+    :param lines: lines of text
+    :yield: (parsed object, rings, poly_type) for each non-blank line
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        geometry = _get_geojson_geometry(obj)
+        depth, poly_type = _GEOJSON_TYPES[geometry["type"]]
+        yield obj, _flatten_rings(geometry["coordinates"], depth), poly_type
+
+
+def _format_geojson(source: dict[str, Any], rings: list[_Ring]) -> str:
+    """Replace the points of each ring in a GeoJSON object.
+
+    :param source: parsed object from _read_geojson. Will be altered.
+    :param rings: new points for each ring
+    :return: one line of GeoJSON
+    :raise ValueError: if source holds a nan or infinite value, which GeoJSON
+        cannot hold
+    """
+    geometry = _get_geojson_geometry(source)
+    depth, _ = _GEOJSON_TYPES[geometry["type"]]
+    geometry["coordinates"] = _nest_rings(geometry["coordinates"], depth, iter(rings))
+    return json.dumps(source, allow_nan=False)
+
+
+def _read_csv(lines: Iterable[str], poly_type: PolyType) -> Iterator[_Record]:
+    """Read ring,x,y rows. Consecutive rows with the same ring id are one ring.
+
+    :param lines: lines of text. A header row is skipped.
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :yield: (ring id, [ring], poly_type) for each ring
+    :raise ValueError: if a row has fewer than three columns
+    """
+    reader = csv.reader(lines)
+
+    def iter_rows() -> Iterator[list[str]]:
+        for row in filter(None, reader):
+            if len(row) < 3:  # noqa: PLR2004
+                msg = f"line {reader.line_num}: expected ring,x,y, not {row!r}"
+                raise ValueError(msg)
+            yield row
+
+    rows = iter_rows()
+    first = next(rows, None)
+    if first is None:
+        return
+    try:
+        _ = float(first[1])
+        rows = it.chain([first], rows)
+    except ValueError:
+        pass
+    for ring_id, ring_rows in it.groupby(rows, key=lambda x: x[0]):
+        yield ring_id, [[(float(x), float(y)) for _, x, y, *_ in ring_rows]], poly_type
+
+
+def _format_csv(source: str, rings: list[_Ring]) -> str:
+    """Write ring,x,y rows for one ring.
+
+    :param source: ring id
+    :param rings: one ring of new points
+    :return: one line per point
+    """
+    (ring,) = rings
+    return "\n".join(f"{source},{x},{y}" for x, y in ring)
+
+
+@contextlib.contextmanager
+def _open_text(path: str, mode: str = "r") -> Generator[IO[str], None, None]:
+    """Open a text file, or use stdin or stdout for "-".
+
+    :param path: file path or "-"
+    :param mode: "r" or "w"
+    :yield: an open text stream
+    """
+    if path == "-":
+        yield sys.stdin if mode == "r" else sys.stdout
+        return
+    with Path(path).open(mode, encoding="utf-8", newline="") as file:
+        yield file
+
+
+def _write_lines(lines: Iterable[str], output: IO[str]) -> None:
+    """Write lines as they come, so output streams.
+
+    :param lines: lines without newlines
+    :param output: writable text stream
+    """
+    for line in lines:
+        _ = output.write(line + "\n")
+
+
+def _run_text(
+    format_: str, args: argparse.Namespace, stats: list[int], output: IO[str]
+) -> None:
+    """Offset WKT, GeoJSON, or CSV input and write the same format.
+
+    :param format_: "wkt", "geojson", or "csv"
+    :param args: parsed arguments
+    :param stats: [number of rings, number of points], updated as input is read
+    :param output: writable text stream
+    """
+    poly_type = PolyType[args.type.upper()]
+    with _open_text(args.input) as lines:
+        if format_ == "wkt":
+            records, formatter = _read_wkt(lines), _format_wkt
+        elif format_ == "geojson":
+            records, formatter = _read_geojson(lines), _format_geojson
+        else:
+            records, formatter = _read_csv(lines, poly_type), _format_csv
+            _ = output.write("ring,x,y\n")
+        results = _drop_empty_rings(_iter_offset_records(records, args, stats))
+        _write_lines(it.starmap(formatter, results), output)
+
+
+def _run_npy(args: argparse.Namespace, stats: list[int]) -> None:
+    """Offset an (n, 2) or (k, n, 2) NPY array and write the same shape.
+
+    :param args: parsed arguments
+    :param stats: [number of rings, number of points]
+    :raise ValueError: if output is stdout or the array is not (n, 2) or (k, n, 2)
+    """
+    import numpy as np  # noqa: PLC0415
+
+    if args.output == "-":
+        msg = "npy output must be written to a file. Pass --output."
+        raise ValueError(msg)
+    points = np.load(args.input, mmap_mode="r")
+    if points.ndim not in {2, 3} or points.shape[-1] != 2:  # noqa: PLR2004
+        msg = f"npy input must have shape (n, 2) or (k, n, 2), not {points.shape}"
+        raise ValueError(msg)
+    rings = np.reshape(points, (-1, points.shape[-2], 2))
+    out = np.lib.format.open_memmap(
+        args.output, mode="w+", dtype=float, shape=points.shape
+    )
+    out_rings = np.reshape(out, rings.shape)
+    offset_chunk = functools.partial(
+        _offset_array_chunk, offsets=args.offset, poly_type=PolyType[args.type.upper()]
+    )
+    starts = range(0, len(rings), args.chunk_size)
+    chunks = (rings[i : i + args.chunk_size] for i in starts)
+    for beg, xsect in zip(
+        starts, _imap(offset_chunk, chunks, args.workers), strict=True
+    ):
+        out_rings[beg : beg + len(xsect)] = xsect
+        stats[0] += len(xsect)
+        stats[1] += len(xsect) * rings.shape[1]
+    out.flush()
+
+
+def _offset_xy_rings(  # noqa: PLR0913
+    rings: tuple[int, int],
+    *,
+    points_path: str,
+    ring_bounds_path: str,
+    out_path: str,
+    offset: float,
+    poly_type: PolyType,
+) -> int:
+    """Offset a run of rings from a flat binary xy file. This runs in a worker.
+
+    :param rings: (first ring, last ring + 1)
+    :param points_path: file of interleaved float64 x, y values
+    :param ring_bounds_path: file of int64 ring start indices, then the number
+        of points
+    :param out_path: existing file to write the xsect points of these rings into
+    :param offset: distance to offset every edge
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :return: number of points offset
+    """
+    import numpy as np  # noqa: PLC0415
+
+    from offset_poly.chunked import offset_rings_chunked  # noqa: PLC0415
+
+    points = np.reshape(np.memmap(points_path, dtype=float, mode="r"), (-1, 2))
+    bounds = np.memmap(ring_bounds_path, dtype=np.int64, mode="r")
+    bounds = np.asarray(bounds[rings[0] : rings[1] + 1])
+    beg, end = int(bounds[0]), int(bounds[-1])
+    out_file = np.memmap(out_path, dtype=float, mode="r+")
+    out = np.reshape(out_file, (-1, 2))
+    _ = offset_rings_chunked(
+        points[beg:end], bounds - beg, offset, poly_type, out[beg:end]
+    )
+    out_file.flush()
+    return end - beg
+
+
+def _run_xy(args: argparse.Namespace, stats: list[int]) -> None:
+    """Offset a flat binary xy file, one run of rings per worker task.
+
+    :param args: parsed arguments
+    :param stats: [number of rings, number of points]
+    :raise ValueError: if there is no ring-bounds file, no output file, or more
+        than one offset
+    :raise ValueError: if ring bounds do not start at 0 and end at the number of
+        points
+
+    Each task offsets whole rings with offset_poly.chunked.offset_rings_chunked
+    and writes them straight into the output file, so no points pass between
+    processes.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    from offset_poly.chunked import DEFAULT_CHUNK_POINTS  # noqa: PLC0415
+
+    if args.ring_bounds is None or args.output == "-" or args.input == "-":
+        msg = "xy format needs an input file, --ring-bounds, and --output"
+        raise ValueError(msg)
+    if len(args.offset) != 1:
+        msg = "xy format takes one offset for every edge"
+        raise ValueError(msg)
+    points = np.reshape(np.memmap(args.input, dtype=float, mode="r"), (-1, 2))
+    bounds = np.memmap(args.ring_bounds, dtype=np.int64, mode="r")
+    num_rings, num_points = len(bounds) - 1, len(points)
+    if num_rings < 0 or bounds[0] != 0 or bounds[-1] != num_points:
+        msg = f"ring_bounds must start at 0 and end at {num_points}"
+        raise ValueError(msg)
+    np.memmap(args.output, dtype=float, mode="w+", shape=points.shape).flush()
+
+    # split into tasks of whole rings, enough to keep every worker busy
+    num_tasks = max(args.workers, 1) * _CHUNKS_PER_WORKER
+    task_points = min(DEFAULT_CHUNK_POINTS, -(-num_points // num_tasks))
+    task_starts = np.arange(0, num_points, task_points)
+    firsts = np.searchsorted(bounds, task_starts, side="right") - 1
+    firsts = np.unique(np.append(firsts, num_rings)).tolist()
+    offset_rings = functools.partial(
+        _offset_xy_rings,
+        points_path=args.input,
+        ring_bounds_path=args.ring_bounds,
+        out_path=args.output,
+        offset=args.offset[0],
+        poly_type=PolyType[args.type.upper()],
+    )
+    tasks = it.pairwise(firsts)
+    stats[1] += sum(_imap(offset_rings, tasks, args.workers))
+    stats[0] += num_rings
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command-line offsetter.
+
+    :param argv: optional command-line arguments. Default is sys.argv[1:].
+    :return: exit status. 0 on success, 1 on a bad input or argument.
+    """
+    args = _get_parser().parse_args(argv)
+    stats = [0, 0]
+    start = time.perf_counter()
+    try:
+        format_ = _get_format(args)
+        if format_ == "npy":
+            _run_npy(args, stats)
+        elif format_ == "xy":
+            _run_xy(args, stats)
+        else:
+            with _open_text(args.output, "w") as output:
+                _run_text(format_, args, stats, output)
+    except (ValueError, OSError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)  # noqa: T201
+        return 1
+    seconds = time.perf_counter() - start
+    if not args.quiet:
+        rings, points = stats
+        rate = points / seconds if seconds else 0
+        print(  # noqa: T201
+            f"offset {rings:,} rings, {points:,} points in {seconds:.2f}s "
+            + f"({rate:,.0f} points/s, workers: {args.workers})",
+            file=sys.stderr,
+        )
+    return 0
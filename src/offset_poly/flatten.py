@@ -0,0 +1,130 @@
+"""Flatten the rounded corners of an offset result into a dense polyline.
+
+Each corner has quadratic Bezier control points (GapCorner.cpts). Each curve is
+split into n equal steps in t, where n is the smallest count that keeps every
+chord within a tolerance of the curve. The second derivative of a quadratic
+Bezier is constant, 2 * (p0 - 2 * p1 + p2), so a chord over a step of 1/n in t
+strays at most |p0 - 2 * p1 + p2| / (4 * n**2) from the curve.
+
+Curves are grouped by n, and every curve in a group is evaluated at once from a
+cached table of Bernstein weights for n steps.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from offset_poly.offset_array import GapCornerArray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+    from offset_poly.offset_array import GapCornerRow
+    from offset_poly.offset_corner import GapCorner
+
+    _FArray = npt.NDArray[np.floating[Any]]
+    _IArray = npt.NDArray[np.intp]
+
+
+@functools.lru_cache(maxsize=256)
+def _get_bernstein_weights(num_steps: int) -> _FArray:
+    """Tabulate quadratic Bernstein weights at num_steps + 1 equal steps in t.
+
+    :param num_steps: number of chords. 0 for a single point at t = 0.
+    :return: read-only (num_steps + 1, 3) array. Row k is the weight of each
+        control point at t = k / num_steps.
+    """
+    time = np.linspace(0, 1, num_steps + 1) if num_steps else np.zeros(1)
+    weights = np.stack(((1 - time) ** 2, 2 * time * (1 - time), time**2), axis=1)
+    weights.flags.writeable = False
+    return weights
+
+
+def get_num_steps(cpts: npt.ArrayLike, tolerance: float) -> _IArray:
+    """Find how many chords each curve needs to stay within tolerance.
+
+    :param cpts: (n, 3, 2) array of quadratic Bezier control points
+    :param tolerance: maximum distance between a chord and its curve. Must be
+        greater than 0.
+    :return: (n,) array of chord counts. 0 where all three control points are
+        the same point (a straight or degenerate corner), else at least 1.
+    :raise ValueError: if tolerance is not greater than 0
+    """
+    if tolerance <= 0:
+        msg = f"tolerance must be greater than 0, not {tolerance}"
+        raise ValueError(msg)
+    cpts_ = np.asarray(cpts)
+    p0, p1, p2 = cpts_[:, 0], cpts_[:, 1], cpts_[:, 2]
+    bend_vec = p0 - 2 * p1 + p2
+    bend = np.hypot(bend_vec[:, 0], bend_vec[:, 1])
+    num_steps = np.ceil(np.sqrt(bend / (4 * tolerance))).astype(np.intp)
+    is_curve = np.any(cpts_ != p0[:, np.newaxis], axis=(1, 2))
+    return np.where(is_curve, np.maximum(num_steps, 1), 0)
+
+
+def flatten_cpts(cpts: npt.ArrayLike, tolerance: float) -> tuple[_FArray, _IArray]:
+    """Flatten quadratic Bezier curves into points.
+
+    :param cpts: (n, 3, 2) array of quadratic Bezier control points
+    :param tolerance: maximum distance between a chord and its curve. Must be
+        greater than 0.
+    :return: (points, bounds). points is an (m, 2) array in the dtype of cpts (or
+        float64 for integer input). Curve k is points[bounds[k] : bounds[k + 1]],
+        from p0 to p2, or just p0 if all control points are the same point.
+    :raise ValueError: if tolerance is not greater than 0
+    """
+    cpts_ = np.asarray(cpts)
+    if not np.issubdtype(cpts_.dtype, np.floating):
+        cpts_ = cpts_.astype(float)
+    num_steps = get_num_steps(cpts_, tolerance)
+    bounds = np.zeros(len(cpts_) + 1, dtype=np.intp)
+    bounds[1:] = np.cumsum(num_steps + 1)
+    points = np.empty((bounds[-1], 2), dtype=cpts_.dtype)
+    step_counts: list[int] = np.unique(num_steps).tolist()
+    for steps in step_counts:
+        curves = np.flatnonzero(num_steps == steps)
+        weights = _get_bernstein_weights(steps).astype(cpts_.dtype, copy=False)
+        rows = np.reshape(bounds[curves, np.newaxis] + np.arange(steps + 1), -1)
+        curve_pnts = np.einsum("tk,nkd->ntd", weights, cpts_[curves])
+        points[rows] = np.reshape(curve_pnts, (-1, 2))
+    return points, bounds
+
+
+def flatten_corners(
+    corners: GapCornerArray | Iterable[GapCorner | GapCornerRow], tolerance: float
+) -> _FArray:
+    """Flatten every rounded corner of an offset result into one polyline.
+
+    :param corners: a GapCornerArray, or GapCorner instances from any of the
+        offset functions
+    :param tolerance: maximum distance between a chord and its curve. Must be
+        greater than 0.
+    :return: (m, 2) array of points along each corner curve in order. Repeated
+        corners (from coincident input points) are flattened once. If the result
+        is closed (the last corner repeats the first), the polyline ends at its
+        first point instead of tracing the first curve again.
+    :raise ValueError: if tolerance is not greater than 0
+    """
+    if isinstance(corners, GapCornerArray):
+        cpts = corners.cpts
+    else:
+        cpts = np.reshape(np.array([x.cpts for x in corners], dtype=float), (-1, 3, 2))
+    if len(cpts) > 1:
+        is_new = np.ones(len(cpts), dtype=bool)
+        is_new[1:] = np.any(cpts[1:] != cpts[:-1], axis=(1, 2))
+        cpts = cpts[is_new]
+    is_closed = len(cpts) > 1 and np.array_equal(cpts[0], cpts[-1])
+    if is_closed:
+        cpts = cpts[:-1]
+    points, _ = flatten_cpts(cpts, tolerance)
+    if is_closed:
+        return np.concatenate((points, points[:1]))
+    return points
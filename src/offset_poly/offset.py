@@ -8,24 +8,51 @@ from __future__ import annotations
 
 import enum
 import itertools as it
+from array import array
+from collections import deque
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal, TypeGuard, TypeVar, cast, overload
 
 from vec2_math import vadd, vsub
 
-from offset_poly.offset_corner import GapCorner, gap_corner
+from offset_poly.offset_corner import (
+    DEFAULT_ARC_TOLERANCE,
+    DEFAULT_MITER_LIMIT,
+    GapCorner,
+    JoinType,
+    iter_fused_gap_corners,
+    iter_gap_corners,
+)
 from offset_poly.prepare_poly import (
-    align_closing_points,
-    remove_coincident_adjacent_points,
+    are_coincident,
+    expand_runs,
+    get_point_runs,
+    iter_point_runs,
+    snap_points,
 )
+from offset_poly.stats import get_active_stats, time_phase
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
+    from types import ModuleType
+
+    import numpy.typing as npt
+
+    from offset_poly.offset_array import GapCornerArray
+
+    # an (n, 2) NumPy array or a flat buffer of interleaved x, y values
+    _Buffer = npt.NDArray[Any] | memoryview | array[float]
 
 _Vec2 = tuple[float, float] | Iterable[float]
 
-_MIN_PTS_FOR_POLYGON = 3
-_MIN_PTS_FOR_POLYLINE = 2
+_T = TypeVar("_T")
+
+MIN_PTS_FOR_POLYGON = 3
+MIN_PTS_FOR_POLYLINE = 2
+
+# Below this many corners, compute every corner eagerly with the fused kernel.
+# Above it, lazy GapCorners share offset edges and hold about half the memory.
+_MAX_CORNERS_FOR_FUSED = 256
 
 
 class PolyType(enum.Enum):
@@ -35,16 +62,18 @@ class PolyType(enum.Enum):
     POLYGON = enum.auto()
 
 
-def _wrap_polygon(polyline: Sequence[_Vec2]) -> list[_Vec2]:
+def _wrap_polygon(polyline: Sequence[_Vec2], tolerance: float = 0) -> list[_Vec2]:
     """Wrap a polyline around to the beginning if it is closed.
 
     :param polyline: polyline
+    :param tolerance: maximum distance between the first and last points of a
+        closed polyline
     :return: polyline with last point repeated if it is closed
 
     From A, B, C, A to C, A, B, C, A
     """
     points = list(polyline)
-    if points[0] == points[-1]:
+    if are_coincident(points[0], points[-1], tolerance):
         points = points[:-1]
     return points[-1:] + points + points[:1]
 
@@ -74,38 +103,372 @@ def _anchor_polyline(polyline: Sequence[_Vec2]) -> list[_Vec2]:
     return [pnt_beg, *list(polyline), pnt_end]
 
 
-def offset_poly_per_vert(
-    polyline: Sequence[_Vec2],
-    vert_offsets: Iterable[tuple[float, float]],
+def is_buffer(obj: object) -> TypeGuard[_Buffer]:
+    """Return True if obj exposes its memory through the buffer protocol.
+
+    :param obj: anything
+    :return: True for NumPy arrays, array.array, memoryview, and other buffers.
+        False for lists and tuples.
+    """
+    try:
+        _ = memoryview(obj)  # pyright: ignore[reportArgumentType]
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def get_view(buffer: _Buffer) -> memoryview:
+    """Get a memoryview of a buffer.
+
+    :param buffer: a NumPy array, array.array, or memoryview
+    :return: a memoryview of buffer
+
+    The NumPy stubs only declare the buffer protocol for Python 3.12+.
+    """
+    return memoryview(buffer)  # pyright: ignore[reportArgumentType]
+
+
+def _get_float_format(view: memoryview) -> Literal["d", "f"] | None:
+    """Get the struct format of a buffer of doubles or floats.
+
+    :param view: a memoryview
+    :return: "d" or "f", or None if view does not hold C doubles or floats
+    """
+    fmt = view.format
+    if fmt in ("d", "f"):
+        return fmt
+    return None
+
+
+def _as_points(polyline: Sequence[_Vec2] | _Buffer) -> Sequence[_Vec2]:
+    """Unpack a buffer of points. Pass a sequence of points through.
+
+    :param polyline: a sequence of points or a buffer
+    :return: polyline, or a list of (x, y) tuples if polyline is a buffer
+    """
+    if is_buffer(polyline):
+        return unpack_buffer(polyline)
+    return cast("Sequence[_Vec2]", polyline)
+
+
+def _get_array_engine() -> ModuleType:
+    """Import the NumPy backend for as_array=True.
+
+    :return: offset_poly.offset_array
+    :raise ImportError: if NumPy is not installed
+    """
+    from offset_poly import offset_array  # noqa: PLC0415
+
+    return offset_array
+
+
+def _get_array_dtype(
+    dtype: npt.DTypeLike | None, out: _Buffer | None, *, as_array: bool
+) -> npt.DTypeLike:
+    """Choose the dtype the NumPy backend computes in.
+
+    :param dtype: dtype passed to a public offset function, or None
+    :param out: out buffer passed with it, or None
+    :param as_array: as_array passed with it
+    :return: dtype if given, else float32 if out holds float32 values, else
+        float64
+    :raise ValueError: if dtype is given without as_array
+    """
+    if dtype is not None:
+        if not as_array:
+            msg = "dtype requires as_array=True. GapCorner computes in Python floats."
+            raise ValueError(msg)
+        return dtype
+    if as_array and is_buffer(out) and get_view(out).format == "f":
+        return "float32"
+    return float
+
+
+def _snap_polyline(
+    polyline: Sequence[_Vec2] | _Buffer, tolerance: float, *, snap: bool
+) -> Sequence[_Vec2] | _Buffer:
+    """Snap coincident points, adjacent or not, if snap is True.
+
+    :param polyline: a sequence of points or a buffer
+    :param tolerance: maximum distance between points snapped together
+    :param snap: if False, return polyline unchanged
+    :return: polyline, or a list of snapped points. See prepare_poly.snap_points.
+    """
+    if not snap:
+        return polyline
+    return snap_points(_as_points(polyline), tolerance)
+
+
+def unpack_buffer(buffer: _Buffer) -> list[tuple[float, float]]:
+    """Read points from an (n, 2) buffer or a flat buffer of interleaved x, y.
+
+    :param buffer: any buffer of numbers. It need not be contiguous.
+    :return: a list of (x, y) tuples
+    :raise ValueError: if a flat buffer has an odd length
+    """
+    view = get_view(buffer)
+    fmt = _get_float_format(view)
+    if fmt is not None and view.c_contiguous:
+        flat: Sequence[float] = view.cast("B").cast(fmt)
+    elif view.ndim > 1:
+        # not C-contiguous, or not floats. Let memoryview convert each value.
+        rows = cast("list[list[float]]", view.tolist())
+        return [(x, y) for x, y in rows]
+    else:
+        flat = cast("list[float]", view.tolist())
+    return list(zip(flat[::2], flat[1::2], strict=True))
+
+
+def take_buffer_offsets(
+    offsets: Iterable[_T] | _Buffer, polyline: Sequence[_Vec2] | _Buffer
+) -> list[_T] | _Buffer:
+    """Take at most one offset per point before passing them to the NumPy backend.
+
+    :param offsets: a buffer of offsets or any (possibly infinite) iterable
+    :param polyline: a sequence of points or a buffer of x, y values
+    :return: offsets if offsets is a buffer, else a list of one item per point
+        (or fewer, if offsets runs out first)
+    """
+    if is_buffer(offsets):
+        return offsets
+    if is_buffer(polyline):
+        view = get_view(polyline)
+        num_points = view.nbytes // view.itemsize // 2
+    else:
+        num_points = len(cast("Sequence[_Vec2]", polyline))
+    return list(it.islice(cast("Iterable[_T]", offsets), num_points))
+
+
+def _write_xsects(corners: Sequence[GapCorner], out: _Buffer) -> None:
+    """Write the xsect of each corner into a caller-provided buffer.
+
+    :param corners: GapCorner instances
+    :param out: writable, C-contiguous buffer of len(corners) * 2 floats
+    :raise ValueError: if out cannot hold every xsect point
+    """
+    view = get_view(out)
+    fmt = _get_float_format(view)
+    size = len(corners) * 2
+    if (
+        fmt is None
+        or view.readonly
+        or not view.c_contiguous
+        or view.nbytes != size * view.itemsize
+    ):
+        msg = f"out must be a writable, C-contiguous buffer of {size} floats"
+        raise ValueError(msg)
+    flat = view.cast("B").cast(fmt)
+    flat[:] = array(fmt, it.chain.from_iterable(x.xsect for x in corners))
+
+
+def _join_corners(
+    corners: Sequence[GapCorner],
+    join: JoinType,
+    miter_limit: float,
+    arc_tolerance: float,
+) -> list[tuple[float, float]]:
+    """Join the offset edges at each unique corner.
+
+    :param corners: GapCorner instances from offset_poly_per_vert. Runs of
+        coincident points share one instance.
+    :param join: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+    :param miter_limit: see GapCorner.get_join
+    :param arc_tolerance: see GapCorner.get_join
+    :return: the points of each corner join in order. If the last corner is the
+        first corner (a closed polygon), the first point is repeated at the end.
+    """
+    unique = [x for i, x in enumerate(corners) if i == 0 or x is not corners[i - 1]]
+    is_closed = len(unique) > 1 and unique[-1] is unique[0]
+    if is_closed:
+        unique = unique[:-1]
+    points = list(
+        it.chain.from_iterable(
+            x.get_join(join, miter_limit, arc_tolerance) for x in unique
+        )
+    )
+    if is_closed:
+        points.append(points[0])
+    return points
+
+
+def _offset_joined(  # noqa: PLR0913
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
     poly_type: PolyType,
+    join: JoinType,
+    *,
+    tolerance: float,
+    out: _Buffer | None,
+    miter_limit: float,
+    arc_tolerance: float,
+    as_array: bool,
+    dtype: npt.DTypeLike,
+) -> list[tuple[float, float]] | npt.NDArray[Any]:
+    """Offset edges by a constant amount and join them at each corner.
+
+    :param polyline: polyline. A sequence of points or a buffer.
+    :param offset: distance to offset from each edge
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param join: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+    :param tolerance: maximum distance between coincident adjacent points
+    :param out: must be None. Joined output has a variable length.
+    :param miter_limit: see GapCorner.get_join
+    :param arc_tolerance: see GapCorner.get_join
+    :param as_array: if True, join with the NumPy backend
+    :param dtype: float32 or float64, if as_array is True
+    :return: a list of points, or an (m, 2) array if as_array is True
+    :raise ValueError: if out is given
+    """
+    if out is not None:
+        msg = "out cannot be used with join. Joined output has a variable length."
+        raise ValueError(msg)
+    if as_array:
+        return _get_array_engine().offset_joined_array(
+            polyline,
+            offset,
+            poly_type,
+            join,
+            miter_limit=miter_limit,
+            arc_tolerance=arc_tolerance,
+            tolerance=tolerance,
+            dtype=dtype,
+        )
+    corners = offset_poly_per_edge(
+        polyline, it.cycle([offset]), poly_type, tolerance=tolerance
+    )
+    return _join_corners(corners, join, miter_limit, arc_tolerance)
+
+
+def _get_gap_pairs(
+    vert_offsets: Iterable[tuple[float, float]], num_corners: int, poly_type: PolyType
+) -> list[tuple[float, float]]:
+    """Cycle gap pairs to one per corner.
+
+    :param vert_offsets: iterable of (gap_1, gap_2) tuples
+    :param num_corners: number of unique corners
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :return: one (gap_1, gap_2) pair per corner. The outer gaps of a polyline's
+        endpoints are set to match the inner gaps, because the anchor edges have
+        no offsets of their own.
+    """
+    gaps = it.cycle(vert_offsets or [(0, 0)])
+    gap_pairs = [next(gaps) for _ in range(num_corners)]
+    if poly_type == PolyType.POLYLINE:
+        gap_pairs[0] = (gap_pairs[0][1], gap_pairs[0][1])
+        gap_pairs[-1] = (gap_pairs[-1][0], gap_pairs[-1][0])
+    return gap_pairs
+
+
+def _offset_corners(
+    points: Sequence[_Vec2], gap_pairs: Sequence[tuple[float, float]]
 ) -> list[GapCorner]:
+    """Offset each corner with the kernel that is faster at this size.
+
+    :param points: unique points, wrapped or anchored
+    :param gap_pairs: one (gap_1, gap_2) pair per corner
+    :return: one GapCorner per corner
+    """
+    if len(gap_pairs) <= _MAX_CORNERS_FOR_FUSED:
+        return list(iter_fused_gap_corners(points, gap_pairs))
+    return list(iter_gap_corners(points, gap_pairs))
+
+
+@overload
+def offset_poly_per_vert(
+    polyline: Sequence[_Vec2] | _Buffer,
+    vert_offsets: Iterable[tuple[float, float]] | _Buffer,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    as_array: Literal[False] = False,
+    dtype: None = None,
+) -> list[GapCorner]: ...
+
+
+@overload
+def offset_poly_per_vert(
+    polyline: Sequence[_Vec2] | _Buffer,
+    vert_offsets: Iterable[tuple[float, float]] | _Buffer,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    as_array: Literal[True],
+    dtype: npt.DTypeLike | None = None,
+) -> GapCornerArray: ...
+
+
+def offset_poly_per_vert(  # noqa: PLR0913
+    polyline: Sequence[_Vec2] | _Buffer,
+    vert_offsets: Iterable[tuple[float, float]] | _Buffer,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    as_array: bool = False,
+    dtype: npt.DTypeLike | None = None,
+) -> list[GapCorner] | GapCornerArray:
     """Offset each corner of a polyline or polygon.
 
-    :param polyline: polyline
+    :param polyline: polyline. A sequence of points or a buffer (an (n, 2)
+        NumPy array, array.array("d"), or memoryview of interleaved x, y).
     :param vert_offsets: iterable of (gap_1, gap_2) tuples. One pair per corner.
     :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
-    :return: polyline offset by vert_offsets
+    :param tolerance: optional maximum distance between coincident adjacent
+        points. Use a small tolerance for inputs with jitter, which would
+        otherwise give near-zero-length edges and huge or nan offsets.
+    :param snap: if True, first snap every point to the first earlier point
+        within tolerance, adjacent or not. See prepare_poly.snap_points.
+        Snapping runs in Python, even with as_array.
+    :param out: optional writable buffer of n * 2 floats. If given, the xsect of
+        each corner is written into it.
+    :param as_array: if True, offset with the NumPy backend and return a
+        GapCornerArray. See offset_array.offset_poly_per_vert_array.
+    :param dtype: optional float32 or float64 for the NumPy backend. Requires
+        as_array. Default is the dtype of out if out holds float32 values, else
+        float64.
+    :return: polyline offset by vert_offsets. A list of GapCorner instances, or
+        a GapCornerArray if as_array is True.
     :raise ValueError: if fewer than three points are given for a polygon
     :raise ValueError: if fewer than two points are given for a polyline
+    :raise ValueError: if out cannot hold every xsect point
+    :raise ValueError: if dtype is given without as_array
+    :raise ValueError: if snap is True and tolerance is not greater than 0
+    :raise ImportError: if as_array is True and NumPy is not installed
 
     This is the engine of the offset_polyline and offset_polygon
     functions. You can use it directly, but it's going to be tricky if
     you have zero-length segments or closed points. These points will
     be removed before the gaps are applied, so you'll have to pass
     exactly enough for gap pairs for the segments that are retained.
+
+    With as_array, buffer input is offset without converting any point to
+    Python floats, and out can hold the xsect array itself. Without as_array,
+    buffer input is unpacked into tuples.
     """
-    points = remove_coincident_adjacent_points(polyline)
+    dtype = _get_array_dtype(dtype, out, as_array=as_array)
+    polyline = _snap_polyline(polyline, tolerance, snap=snap)
+    if as_array:
+        vert_offsets = take_buffer_offsets(vert_offsets, polyline)
+        return _get_array_engine().offset_poly_per_vert_array(
+            polyline, vert_offsets, poly_type, tolerance=tolerance, dtype=dtype, out=out
+        )
+    polyline = _as_points(polyline)
 
     def handle_polygon(points: list[_Vec2]) -> list[_Vec2]:
         """Wrap points where poly_tyoe is a polygon."""
-        if len(points) < _MIN_PTS_FOR_POLYGON:
+        if len(points) < MIN_PTS_FOR_POLYGON:
             msg = "at least three unique points required for a polygon"
             raise ValueError(msg)
-        return _wrap_polygon(points)
+        return _wrap_polygon(points, tolerance)
 
     def handle_polyline(points: list[_Vec2]) -> list[_Vec2]:
         """Anchor points where poly_type is a polyline."""
-        if len(points) < _MIN_PTS_FOR_POLYLINE:
+        if len(points) < MIN_PTS_FOR_POLYLINE:
             msg = "at least two unique points required for a polyline"
             raise ValueError(msg)
         return _anchor_polyline(points)
@@ -119,61 +482,391 @@ def offset_poly_per_vert(
     if poly_type_handler is None:
         msg = "poly_type must be PolyType.POLYGON or PolyType.POLYLINE, not {poly_type}"
         raise ValueError(msg)
-    points = poly_type_handler(points)
-
-    offset_points: list[GapCorner] = []
-    abcs = list(zip(points, points[1:], points[2:], strict=False))
-    gaps = it.cycle(vert_offsets or [(0, 0)])
 
-    for i, (pnt_a, pnt_b, pnt_c) in enumerate(abcs):
-        gap_1, gap_2 = next(gaps)
-        if poly_type == PolyType.POLYLINE and i == 0:
-            offset_points.append(gap_corner(pnt_a, pnt_b, pnt_c, gap_2))
-            continue
-        if poly_type == PolyType.POLYLINE and i == len(abcs) - 1:
-            offset_points.append(gap_corner(pnt_a, pnt_b, pnt_c, gap_1))
-            continue
-        offset_points.append(gap_corner(pnt_a, pnt_b, pnt_c, gap_1, gap_2))
+    stats = get_active_stats()
+    with time_phase(stats, "prepare"):
+        kept, run_lengths = get_point_runs(polyline, tolerance)
+        points = poly_type_handler(list(map(polyline.__getitem__, kept)))
 
-    return align_closing_points(polyline, offset_points)
+    if is_buffer(vert_offsets):
+        vert_offsets = unpack_buffer(vert_offsets)
+    gap_pairs = _get_gap_pairs(
+        cast("Iterable[tuple[float, float]]", vert_offsets), len(points) - 2, poly_type
+    )
+    with time_phase(stats, "solve"):
+        offset_points = _offset_corners(points, gap_pairs)
+    with time_phase(stats, "align"):
+        corners = expand_runs(offset_points, run_lengths)
+    if stats is not None:
+        stats.add_angles(x.angle for x in offset_points)
+    if out is not None:
+        _write_xsects(corners, out)
+    return corners
+
+
+@overload
+def offset_poly_per_edge(
+    polyline: Sequence[_Vec2] | _Buffer,
+    edge_offsets: Iterable[float] | _Buffer,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    as_array: Literal[False] = False,
+    dtype: None = None,
+) -> list[GapCorner]: ...
 
 
+@overload
 def offset_poly_per_edge(
-    polyline: Sequence[_Vec2], edge_offsets: Iterable[float], poly_type: PolyType
-) -> list[GapCorner]:
+    polyline: Sequence[_Vec2] | _Buffer,
+    edge_offsets: Iterable[float] | _Buffer,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    as_array: Literal[True],
+    dtype: npt.DTypeLike | None = None,
+) -> GapCornerArray: ...
+
+
+def offset_poly_per_edge(  # noqa: PLR0913
+    polyline: Sequence[_Vec2] | _Buffer,
+    edge_offsets: Iterable[float] | _Buffer,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    as_array: bool = False,
+    dtype: npt.DTypeLike | None = None,
+) -> list[GapCorner] | GapCornerArray:
     """Offset each edge of a polyline or polygon.
 
-    :param polyline: polyline
+    :param polyline: polyline. A sequence of points or a buffer. See
+        offset_poly_per_vert.
     :param edge_offsets: iterable of offsets. One per edge.
     :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param tolerance: optional maximum distance between coincident adjacent
+        points. See offset_poly_per_vert.
+    :param snap: optionally snap points that are not adjacent. See
+        offset_poly_per_vert.
+    :param out: optional writable buffer for xsect points. See
+        offset_poly_per_vert.
+    :param as_array: if True, return a GapCornerArray. See offset_poly_per_vert.
+    :param dtype: optional float32 or float64. See offset_poly_per_vert.
     :return: polyline offset by edge_offsets
 
     This function allows each edge of a polygon or polyline to be offset by
     a different amount. You will end up with a ValueError in gap_corner
     if you try to offset consecutive, parallel edges by different amounts.
     """
+    dtype = _get_array_dtype(dtype, out, as_array=as_array)
+    polyline = _snap_polyline(polyline, tolerance, snap=snap)
+    if as_array:
+        edge_offsets = take_buffer_offsets(edge_offsets, polyline)
+        return _get_array_engine().offset_poly_per_edge_array(
+            polyline, edge_offsets, poly_type, tolerance=tolerance, dtype=dtype, out=out
+        )
+    polyline = _as_points(polyline)
     next_edges = [x for x, _ in zip(edge_offsets, polyline, strict=False)]
     prev_edges = [next_edges[-1], *next_edges[:-1]]
     return offset_poly_per_vert(
-        polyline, zip(prev_edges, next_edges, strict=True), poly_type
+        polyline,
+        zip(prev_edges, next_edges, strict=True),
+        poly_type,
+        tolerance=tolerance,
+        out=out,
     )
 
 
-def offset_polyline(polyline: Sequence[_Vec2], offset: float) -> list[GapCorner]:
+@overload
+def offset_polyline(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    join: None = None,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[False] = False,
+    dtype: None = None,
+) -> list[GapCorner]: ...
+
+
+@overload
+def offset_polyline(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    join: None = None,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[True],
+    dtype: npt.DTypeLike | None = None,
+) -> GapCornerArray: ...
+
+
+@overload
+def offset_polyline(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: None = None,
+    join: JoinType,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[False] = False,
+    dtype: None = None,
+) -> list[tuple[float, float]]: ...
+
+
+@overload
+def offset_polyline(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: None = None,
+    join: JoinType,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[True],
+    dtype: npt.DTypeLike | None = None,
+) -> npt.NDArray[Any]: ...
+
+
+def offset_polyline(  # noqa: PLR0913
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    join: JoinType | None = None,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: bool = False,
+    dtype: npt.DTypeLike | None = None,
+) -> list[GapCorner] | GapCornerArray | list[tuple[float, float]] | npt.NDArray[Any]:
     """Offset polygon edges (to the left) by a constant amount.
 
-    :param polyline: polyline
+    :param polyline: polyline. A sequence of points or a buffer. See
+        offset_poly_per_vert.
     :param offset: distance to offset from each edge
-    :return: polyline offset by offset
+    :param tolerance: optional maximum distance between coincident adjacent
+        points. See offset_poly_per_vert.
+    :param snap: optionally snap points that are not adjacent. See
+        offset_poly_per_vert.
+    :param out: optional writable buffer for xsect points. See
+        offset_poly_per_vert.
+    :param join: optional JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND. If
+        given, offset edges are joined at each corner, and the points of every
+        join are returned instead of one GapCorner per point.
+    :param miter_limit: see GapCorner.get_join
+    :param arc_tolerance: see GapCorner.get_join
+    :param as_array: if True, return a GapCornerArray (or an (m, 2) array of
+        joined points). See offset_poly_per_vert.
+    :param dtype: optional float32 or float64. See offset_poly_per_vert.
+    :return: polyline offset by offset. If join is given, a list of points. See
+        PreparedPoly.offset_joined.
+    :raise ValueError: if join and out are both given
+    :raise ValueError: if dtype is given without as_array
     """
-    return offset_poly_per_edge(polyline, it.cycle([offset]), PolyType.POLYLINE)
+    dtype = _get_array_dtype(dtype, out, as_array=as_array)
+    polyline = _snap_polyline(polyline, tolerance, snap=snap)
+    if join is not None:
+        return _offset_joined(
+            polyline,
+            offset,
+            PolyType.POLYLINE,
+            join,
+            tolerance=tolerance,
+            out=out,
+            miter_limit=miter_limit,
+            arc_tolerance=arc_tolerance,
+            as_array=as_array,
+            dtype=dtype,
+        )
+    if as_array:
+        return _get_array_engine().offset_polyline_array(
+            polyline, offset, tolerance=tolerance, dtype=dtype, out=out
+        )
+    return offset_poly_per_edge(
+        polyline, it.cycle([offset]), PolyType.POLYLINE, tolerance=tolerance, out=out
+    )
 
 
-def offset_polygon(polyline: Sequence[_Vec2], offset: float) -> list[GapCorner]:
+@overload
+def offset_polygon(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    join: None = None,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[False] = False,
+    dtype: None = None,
+) -> list[GapCorner]: ...
+
+
+@overload
+def offset_polygon(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    join: None = None,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[True],
+    dtype: npt.DTypeLike | None = None,
+) -> GapCornerArray: ...
+
+
+@overload
+def offset_polygon(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: None = None,
+    join: JoinType,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[False] = False,
+    dtype: None = None,
+) -> list[tuple[float, float]]: ...
+
+
+@overload
+def offset_polygon(
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: None = None,
+    join: JoinType,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: Literal[True],
+    dtype: npt.DTypeLike | None = None,
+) -> npt.NDArray[Any]: ...
+
+
+def offset_polygon(  # noqa: PLR0913
+    polyline: Sequence[_Vec2] | _Buffer,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    snap: bool = False,
+    out: _Buffer | None = None,
+    join: JoinType | None = None,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    as_array: bool = False,
+    dtype: npt.DTypeLike | None = None,
+) -> list[GapCorner] | GapCornerArray | list[tuple[float, float]] | npt.NDArray[Any]:
     """Offset polygon edges (to the left) by a constant amount.
 
-    :param polyline: polyline
+    :param polyline: polyline. A sequence of points or a buffer. See
+        offset_poly_per_vert.
     :param offset: distance to offset from each edge
-    :return: polygon offset by offset
+    :param tolerance: optional maximum distance between coincident adjacent
+        points. See offset_poly_per_vert.
+    :param snap: optionally snap points that are not adjacent. See
+        offset_poly_per_vert.
+    :param out: optional writable buffer for xsect points. See
+        offset_poly_per_vert.
+    :param join: optional JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND. If
+        given, offset edges are joined at each corner, and the points of every
+        join are returned instead of one GapCorner per point.
+    :param miter_limit: see GapCorner.get_join
+    :param arc_tolerance: see GapCorner.get_join
+    :param as_array: if True, return a GapCornerArray (or an (m, 2) array of
+        joined points). See offset_poly_per_vert.
+    :param dtype: optional float32 or float64. See offset_poly_per_vert.
+    :return: polygon offset by offset. If join is given, a list of points. See
+        PreparedPoly.offset_joined.
+    :raise ValueError: if join and out are both given
+    :raise ValueError: if dtype is given without as_array
     """
-    return offset_poly_per_edge(polyline, it.cycle([offset]), PolyType.POLYGON)
+    dtype = _get_array_dtype(dtype, out, as_array=as_array)
+    polyline = _snap_polyline(polyline, tolerance, snap=snap)
+    if join is not None:
+        return _offset_joined(
+            polyline,
+            offset,
+            PolyType.POLYGON,
+            join,
+            tolerance=tolerance,
+            out=out,
+            miter_limit=miter_limit,
+            arc_tolerance=arc_tolerance,
+            as_array=as_array,
+            dtype=dtype,
+        )
+    if as_array:
+        return _get_array_engine().offset_polygon_array(
+            polyline, offset, tolerance=tolerance, dtype=dtype, out=out
+        )
+    return offset_poly_per_edge(
+        polyline, it.cycle([offset]), PolyType.POLYGON, tolerance=tolerance, out=out
+    )
+
+
+def iter_offset_polyline(
+    polyline: Iterable[_Vec2], offset: float
+) -> Iterator[GapCorner]:
+    """Offset polyline edges (to the left) by a constant amount, one at a time.
+
+    :param polyline: any iterable of points. Will only be iterated over once.
+    :param offset: distance to offset from each edge
+    :yield: the same GapCorner instances offset_polyline would return
+    :raise ValueError: if fewer than two unique points are given
+
+    Holds only a three-point window (plus the repeat count of each point in that
+    window) in memory, so this will work on an unbounded stream of points. Like
+    offset_polyline, the polyline is left open even if the first and last points
+    are identical.
+    """
+    run_lengths: deque[int] = deque()
+
+    def iter_anchored() -> Iterator[tuple[float, float]]:
+        """Yield unique points with an extended edge at each end."""
+        runs = iter_point_runs(polyline)
+        first_two = list(it.islice(runs, 2))
+        if len(first_two) < MIN_PTS_FOR_POLYLINE:
+            msg = "at least two unique points required for a polyline"
+            raise ValueError(msg)
+        (pnt_a, _), (pnt_b, _) = first_two
+        yield vadd(pnt_a, vsub(pnt_a, pnt_b))
+        for pnt, count in first_two:
+            run_lengths.append(count)
+            yield pnt
+        for pnt, count in runs:
+            run_lengths.append(count)
+            yield pnt
+            pnt_a, pnt_b = pnt_b, pnt
+        yield vsub(pnt_b, vsub(pnt_a, pnt_b))
+
+    corners = iter_gap_corners(iter_anchored(), it.repeat((offset, offset)))
+    for corner in corners:
+        yield from it.repeat(corner, run_lengths.popleft())
@@ -0,0 +1,968 @@
+"""Offset a polyline or polygon with NumPy arrays.
+
+This is an optional backend for large inputs. It computes the same values as
+GapCorner (xsect, angle, cpts) for every corner of a polyline in one batched pass
+instead of building one GapCorner instance per corner.
+
+NumPy is not a dependency of offset_poly. Install it with the `numpy` extra to use
+this module.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError as _e:
+    _msg = "offset_poly.offset_array requires numpy. Install offset-poly[numpy]."
+    raise ImportError(_msg) from _e
+
+from offset_poly.offset import MIN_PTS_FOR_POLYGON, MIN_PTS_FOR_POLYLINE, PolyType
+from offset_poly.offset_corner import (
+    ABS_TOL,
+    DEFAULT_ARC_TOLERANCE,
+    DEFAULT_MITER_LIMIT,
+    JoinType,
+)
+from offset_poly.prepare_poly import get_point_runs, get_run_index
+from offset_poly.stats import NEAR_PARALLEL_TOL, get_active_stats, time_phase
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import numpy.typing as npt
+
+    from offset_poly.stats import OffsetStats
+
+    _FArray = npt.NDArray[np.floating[Any]]
+    _IArray = npt.NDArray[np.intp]
+    _BArray = npt.NDArray[np.bool_]
+
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def get_float_dtype(dtype: npt.DTypeLike) -> np.dtype[Any]:
+    """Check that a dtype is one the kernel can compute in.
+
+    :param dtype: anything np.dtype accepts
+    :return: np.dtype(dtype)
+    :raise ValueError: if dtype is not float32 or float64
+    """
+    dtype_ = np.dtype(dtype)
+    if dtype_ not in _FLOAT_DTYPES:
+        msg = f"dtype must be float32 or float64, not {dtype_}"
+        raise ValueError(msg)
+    return dtype_
+
+
+def _get_out(
+    out: npt.ArrayLike | None, num_points: int, dtype: np.dtype[Any]
+) -> _FArray | None:
+    """View a caller-provided buffer as an (n, 2) array of xsect points.
+
+    :param out: None or a writable, C-contiguous buffer of num_points * 2 values
+        in dtype. A NumPy array, array.array, or memoryview of interleaved xy.
+    :param num_points: number of input points
+    :param dtype: dtype of the result
+    :return: None or an (n, 2) view of out
+    :raise ValueError: if xsect points cannot be written into out without a copy
+    """
+    if out is None:
+        return None
+    out_ = np.asarray(out)
+    is_usable = (
+        out_.dtype == dtype
+        and out_.size == num_points * 2
+        and out_.flags.c_contiguous
+        and out_.flags.writeable
+    )
+    if not is_usable:
+        msg = (
+            f"out must be a writable, C-contiguous {dtype} buffer "
+            + f"of {num_points * 2} values"
+        )
+        raise ValueError(msg)
+    return np.reshape(out_, (num_points, 2))
+
+
+def _get_abs_tol(dtype: npt.DTypeLike) -> float:
+    """Return the tolerance for straight and degenerate angles at a precision.
+
+    :param dtype: float32 or float64
+    :return: 1e-6 (the GapCorner tolerance) or, for float32, a tolerance large
+        enough that rounding error in arctan2 does not flip a straight corner
+        into a very sharp or very flat one
+
+    Float32 angles near 0 or pi are only good to a few multiples of
+    np.finfo(np.float32).eps (about 1.2e-7), which is too close to 1e-6.
+    """
+    return max(ABS_TOL, float(np.finfo(dtype).eps) * 2**10)
+
+
+def _get_unit_normals(vecs: _FArray) -> tuple[_FArray, _BArray]:
+    """Rotate vectors 90 degrees counterclockwise and scale them to length 1.
+
+    :param vecs: (n, 2) array of segment vectors
+    :return: (n, 2) array of unit vectors to the left of each segment and an (n,)
+        mask where segments have zero length. Zero-length normals are (0, 0).
+    """
+    norms = np.sqrt(vecs[:, 0] ** 2 + vecs[:, 1] ** 2)
+    is_zero = norms == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(is_zero, 0, 1 / norms)
+    return np.stack((-vecs[:, 1] * scale, vecs[:, 0] * scale), axis=1), is_zero
+
+
+def _project_to_segments(seg_a: _FArray, seg_b: _FArray, points: _FArray) -> _FArray:
+    """Find the closest point on each line segment to each point.
+
+    :param seg_a: (n, 2) array of segment start points
+    :param seg_b: (n, 2) array of segment end points
+    :param points: (n, 2) array of points
+    :return: (n, 2) array of closest points on segments
+    """
+    vec_ab = seg_b - seg_a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        time = np.einsum("ij,ij->i", points - seg_a, vec_ab) / np.einsum(
+            "ij,ij->i", vec_ab, vec_ab
+        )
+    return seg_a + vec_ab * time.clip(0, 1)[:, np.newaxis]
+
+
+class CornerKernel:
+    """Everything about a batch of corners that does not depend on the gaps.
+
+    :param pnts_a: (n, 2) array of previous points
+    :param pnts_b: (n, 2) array of corner points
+    :param pnts_c: (n, 2) array of next points
+    :param normals_ab: optional precomputed unit normals (and zero-length mask) of
+        each ab. Pass these to share normals between corners of the same polyline.
+    :param normals_bc: optional precomputed unit normals of each bc
+
+    Every array is computed in the dtype of pnts_b, and straight and degenerate
+    angles are found with a tolerance for that precision.
+
+    With unit normals n_ab and n_bc, xsect - pnt_b is the q where
+    n_ab . q = gap_1 and n_bc . q = gap_2. That is linear in the gaps, so
+    everything but the last multiply and add can be computed once.
+    """
+
+    __slots__ = (
+        "angle",
+        "det",
+        "is_corner",
+        "is_degenerate",
+        "is_straight",
+        "normals_ab",
+        "normals_bc",
+        "pnts_a",
+        "pnts_b",
+        "pnts_c",
+        "zero_ab",
+        "zero_bc",
+    )
+
+    def __init__(
+        self,
+        pnts_a: _FArray,
+        pnts_b: _FArray,
+        pnts_c: _FArray,
+        normals_ab: tuple[_FArray, _BArray] | None = None,
+        normals_bc: tuple[_FArray, _BArray] | None = None,
+    ) -> None:
+        """Compute angles and unit normals for each corner."""
+        self.pnts_a, self.pnts_b, self.pnts_c = pnts_a, pnts_b, pnts_c
+        vec_ab = pnts_b - pnts_a
+        vec_bc = pnts_c - pnts_b
+        self.angle = np.arctan2(
+            vec_ab[:, 0] * vec_bc[:, 1] - vec_ab[:, 1] * vec_bc[:, 0],
+            vec_ab[:, 0] * vec_bc[:, 0] + vec_ab[:, 1] * vec_bc[:, 1],
+        )
+        abs_tol = _get_abs_tol(pnts_b.dtype)
+        self.is_degenerate = np.isclose(
+            self.angle % (math.pi * 2), math.pi, rtol=0, atol=abs_tol
+        )
+        self.is_straight = np.isclose(self.angle, 0, rtol=0, atol=abs_tol)
+        self.is_straight &= ~self.is_degenerate
+        self.is_corner = ~(self.is_straight | self.is_degenerate)
+        self.normals_ab, self.zero_ab = normals_ab or _get_unit_normals(vec_ab)
+        self.normals_bc, self.zero_bc = normals_bc or _get_unit_normals(vec_bc)
+        n1x, n1y = np.transpose(self.normals_ab)
+        n2x, n2y = np.transpose(self.normals_bc)
+        self.det = n1x * n2y - n1y * n2x
+
+    def check_gaps(self, gaps_1: _FArray, gaps_2: _FArray) -> None:
+        """Raise an error if gaps cannot be applied to these corners.
+
+        :param gaps_1: (n,) array of distances to offset from each ab
+        :param gaps_2: (n,) array of distances to offset from each bc
+        :raise ValueError: if trying to offset a zero-length segment
+        :raise ValueError: if any angle abc is zero and gap_1 != gap_2
+        """
+        if np.any(self.zero_ab & (gaps_1 != 0)) or np.any(self.zero_bc & (gaps_2 != 0)):
+            msg = "cannot scale a zero-length vector to a nonzero length"
+            raise ValueError(msg)
+        if np.any(self.is_straight & (gaps_1 != gaps_2)):
+            msg = "gaps must be equal for straight corners"
+            raise ValueError(msg)
+
+    def get_miters(self, gaps_1: _FArray, gaps_2: _FArray) -> _FArray:
+        """Return xsect - pnt_b for each corner.
+
+        :param gaps_1: (n,) array of distances to offset from each ab
+        :param gaps_2: (n,) array of distances to offset from each bc
+        :return: (n, 2) array of vectors from each pnt_b to its xsect
+        """
+        n1x, n1y = np.transpose(self.normals_ab)
+        n2x, n2y = np.transpose(self.normals_bc)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            miters = np.stack(
+                (
+                    (n2y * gaps_1 - n1y * gaps_2) / self.det,
+                    (n1x * gaps_2 - n2x * gaps_1) / self.det,
+                ),
+                axis=1,
+            )
+        miters[self.is_straight] = (
+            self.normals_ab[self.is_straight] * gaps_1[self.is_straight, np.newaxis]
+        )
+        miters[self.is_degenerate] = np.nan
+        return miters
+
+    def solve(self, gaps_1: _FArray, gaps_2: _FArray) -> tuple[_FArray, _FArray]:
+        """Offset each corner.
+
+        :param gaps_1: (n,) array of distances to offset from each ab
+        :param gaps_2: (n,) array of distances to offset from each bc
+        :return: xsect (n, 2) and cpts (n, 3, 2) arrays
+        :raise ValueError: if gaps cannot be applied to these corners
+        """
+        self.check_gaps(gaps_1, gaps_2)
+        miters = self.get_miters(gaps_1, gaps_2)
+        xsect = self.pnts_b + miters
+
+        # cpts are projected from the xsect on the inside of the corner
+        side = np.where(self.angle > 0, 1, -1).astype(miters.dtype)
+        inside = self.pnts_b + miters * side[:, np.newaxis]
+        cp_a = _project_to_segments(self.pnts_a, self.pnts_b, inside)
+        cp_c = _project_to_segments(self.pnts_b, self.pnts_c, inside)
+        cpts = np.stack((cp_a, self.pnts_b, cp_c), axis=1)
+        cpts[~self.is_corner] = self.pnts_b[~self.is_corner, np.newaxis]
+        return xsect, cpts
+
+    def add_stats(self, stats: OffsetStats, xsect: _FArray) -> None:
+        """Count straight, degenerate, near-parallel, and nan corners.
+
+        :param stats: the active OffsetStats
+        :param xsect: (n, 2) array of xsect points from solve
+        """
+        from_straight = np.abs(self.angle)
+        from_degenerate = np.abs(self.angle % (math.pi * 2) - math.pi)
+        is_near = np.minimum(from_straight, from_degenerate) <= NEAR_PARALLEL_TOL
+        stats.add_corners(
+            len(self.angle),
+            int(np.count_nonzero(self.is_straight)),
+            int(np.count_nonzero(self.is_degenerate)),
+            int(np.count_nonzero(is_near & self.is_corner)),
+            int(np.count_nonzero(np.isnan(xsect).any(axis=1))),
+        )
+
+    def _get_join_steps(
+        self,
+        gaps_1: _FArray,
+        gaps_2: _FArray,
+        miters: _FArray,
+        join_type: JoinType,
+        limits: tuple[float, float],
+    ) -> tuple[_IArray, _FArray]:
+        """Count the chords around the outside of each corner.
+
+        :param gaps_1: (n,) array of distances to offset from each ab
+        :param gaps_2: (n,) array of distances to offset from each bc
+        :param miters: (n, 2) array of vectors from each pnt_b to its xsect
+        :param join_type: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+        :param limits: (miter_limit, arc_tolerance). See GapCorner.get_join.
+        :return: (n,) number of chords at each corner (0 where the corner joins
+            at its xsect) and (n,) sweep angle around each corner
+        :raise ValueError: if join_type is not a JoinType
+        """
+        gap_sums = gaps_1 + gaps_2
+        is_outside = self.is_degenerate | (self.is_corner & (self.angle * gap_sums < 0))
+        sweep = np.where(self.is_degenerate, -np.copysign(np.pi, gap_sums), self.angle)
+        radii = np.maximum(np.abs(gaps_1), np.abs(gaps_2))
+        miter_limit, arc_tolerance = limits
+        if join_type == JoinType.MITER:
+            too_long = ~(np.hypot(miters[:, 0], miters[:, 1]) <= miter_limit * radii)
+            return (is_outside & too_long).astype(np.intp), sweep
+        if join_type == JoinType.BEVEL:
+            return is_outside.astype(np.intp), sweep
+        if join_type == JoinType.ROUND:
+            with np.errstate(divide="ignore"):
+                ratio = np.minimum(arc_tolerance / radii, 1)
+            max_step = 2 * np.arccos(1 - ratio)
+            num_steps = np.maximum(np.ceil(np.abs(sweep) / max_step), 1)
+            return np.where(is_outside, num_steps, 0).astype(np.intp), sweep
+        msg = f"join_type must be a JoinType, not {join_type}"
+        raise ValueError(msg)
+
+    def get_joins(
+        self,
+        gaps_1: _FArray,
+        gaps_2: _FArray,
+        join_type: JoinType,
+        limits: tuple[float, float] = (DEFAULT_MITER_LIMIT, DEFAULT_ARC_TOLERANCE),
+    ) -> tuple[_FArray, _IArray]:
+        """Join the offset edges at each corner.
+
+        :param gaps_1: (n,) array of distances to offset from each ab
+        :param gaps_2: (n,) array of distances to offset from each bc
+        :param join_type: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+        :param limits: (miter_limit, arc_tolerance). See GapCorner.get_join.
+        :return: (m, 2) array of points and (n + 1,) start index of each corner
+            in points, then m. Corner k is points[bounds[k] : bounds[k + 1]].
+        :raise ValueError: if gaps cannot be applied to these corners
+        :raise ValueError: if join_type is not a JoinType
+
+        The output is allocated once, after counting the points at each corner.
+        Corners that join at their xsect take one row. The rest take one row
+        more than their number of chords.
+        """
+        self.check_gaps(gaps_1, gaps_2)
+        miters = self.get_miters(gaps_1, gaps_2)
+        num_steps, sweep = self._get_join_steps(
+            gaps_1, gaps_2, miters, join_type, limits
+        )
+        bounds = np.zeros(len(num_steps) + 1, dtype=np.intp)
+        bounds[1:] = np.cumsum(num_steps + 1)
+        points = np.empty((bounds[-1], 2), dtype=miters.dtype)
+
+        is_xsect = num_steps == 0
+        points[bounds[:-1][is_xsect]] = self.pnts_b[is_xsect] + miters[is_xsect]
+
+        owner = np.repeat(np.flatnonzero(~is_xsect), num_steps[~is_xsect] + 1)
+        rows = np.flatnonzero(np.repeat(~is_xsect, num_steps + 1))
+        time = ((rows - bounds[owner]) / num_steps[owner]).astype(miters.dtype)
+        side = np.copysign(1, gaps_1 + gaps_2)[owner]
+        start_normals = self.normals_ab[owner] * side[:, np.newaxis]
+        start = np.arctan2(start_normals[:, 1], start_normals[:, 0])
+        theta = start + sweep[owner] * time
+        radius_1, radius_2 = np.abs(gaps_1[owner]), np.abs(gaps_2[owner])
+        radii = radius_1 + (radius_2 - radius_1) * time
+        points[rows] = self.pnts_b[owner] + radii[:, np.newaxis] * np.stack(
+            (np.cos(theta), np.sin(theta)), axis=1
+        )
+
+        # the ends of the offset edges, without rounding error from cos and sin
+        is_join = ~is_xsect
+        pnts_b = self.pnts_b[is_join]
+        ab_ends = self.normals_ab[is_join] * gaps_1[is_join, np.newaxis]
+        bc_ends = self.normals_bc[is_join] * gaps_2[is_join, np.newaxis]
+        points[bounds[:-1][is_join]] = pnts_b + ab_ends
+        points[bounds[1:][is_join] - 1] = pnts_b + bc_ends
+        return points, bounds
+
+
+def gap_corner_arrays(  # noqa: PLR0913
+    pnts_a: npt.ArrayLike,
+    pnts_b: npt.ArrayLike,
+    pnts_c: npt.ArrayLike,
+    gaps_1: npt.ArrayLike,
+    gaps_2: npt.ArrayLike | None = None,
+    *,
+    dtype: npt.DTypeLike = float,
+) -> tuple[_FArray, _FArray, _FArray]:
+    """Offset (to the left) every corner defined by three arrays of points.
+
+    :param pnts_a: (n, 2) array of previous points
+    :param pnts_b: (n, 2) array of corner points
+    :param pnts_c: (n, 2) array of next points
+    :param gaps_1: (n,) distances to offset from each ab (or one distance for all)
+    :param gaps_2: optional (n,) distances to offset from each bc. If not given,
+        gaps_1 is used
+    :param dtype: float32 or float64. Inputs are cast to this and every result
+        is computed in it.
+    :return: xsect (n, 2), angle (n,), and cpts (n, 3, 2) arrays matching
+        GapCorner.xsect, GapCorner.angle, and GapCorner.cpts for each corner
+    :raise ValueError: if any angle abc is zero and gap_1 != gap_2
+    :raise ValueError: if dtype is not float32 or float64
+
+    Unlike GapCorner, which waits until xsect is requested, this will raise a
+    ValueError as soon as it finds a straight corner with unequal gaps.
+    """
+    dtype = get_float_dtype(dtype)
+    a = np.reshape(np.asarray(pnts_a, dtype=dtype), (-1, 2))
+    b = np.reshape(np.asarray(pnts_b, dtype=dtype), (-1, 2))
+    c = np.reshape(np.asarray(pnts_c, dtype=dtype), (-1, 2))
+    g1 = np.broadcast_to(np.asarray(gaps_1, dtype=dtype), (len(b),))
+    g2 = g1 if gaps_2 is None else np.broadcast_to(np.asarray(gaps_2, dtype), g1.shape)
+    kernel = CornerKernel(a, b, c)
+    xsect, cpts = kernel.solve(g1, g2)
+    return xsect, kernel.angle, cpts
+
+
+class GapCornerRow:
+    """A read-only, GapCorner-compatible view of one row of a GapCornerArray.
+
+    Nothing is computed or copied until an attribute is requested.
+    """
+
+    __slots__ = ("_corners", "_index")
+
+    def __init__(self, corners: GapCornerArray, index: int) -> None:
+        """Point to row index of corners."""
+        self._corners = corners
+        self._index = index
+
+    def _window_point(self, shift: int) -> tuple[float, float]:
+        """Return pnt_a, pnt_b, or pnt_c for shift 0, 1, or 2."""
+        i = int(self._corners.corner_index[self._index]) + shift
+        x, y = self._corners.windows[i].tolist()
+        return x, y
+
+    @property
+    def pnt_a(self) -> tuple[float, float]:
+        """The previous point."""
+        return self._window_point(0)
+
+    @property
+    def pnt_b(self) -> tuple[float, float]:
+        """The corner point."""
+        return self._window_point(1)
+
+    @property
+    def pnt_c(self) -> tuple[float, float]:
+        """The next point."""
+        return self._window_point(2)
+
+    @property
+    def gap_1(self) -> float:
+        """The distance ab is offset."""
+        return float(self._corners.gap_1[self._index])
+
+    @property
+    def gap_2(self) -> float:
+        """The distance bc is offset."""
+        return float(self._corners.gap_2[self._index])
+
+    @property
+    def angle(self) -> float:
+        """The signed ccw angle at corner abc."""
+        return float(self._corners.angle[self._index])
+
+    @property
+    def xsect(self) -> tuple[float, float]:
+        """The intersection of left-offset segments ab and bc."""
+        x, y = self._corners.xsect[self._index].tolist()
+        return x, y
+
+    @property
+    def cpts(
+        self,
+    ) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float]]:
+        """Return control points for a Bezier curve at the corner."""
+        (ax, ay), (bx, by), (cx, cy) = self._corners.cpts[self._index].tolist()
+        return (ax, ay), (bx, by), (cx, cy)
+
+
+class GapCornerArray:
+    """Columnar offset results. One row per input point.
+
+    :param xsect: (n, 2) array of intersections of left-offset segments ab and bc
+    :param angle: (n,) array of signed ccw angles at each corner abc
+    :param cpts: (n, 3, 2) array of Bezier control points for each corner
+    :param gap_1: (n,) array of distances each ab is offset
+    :param gap_2: (n,) array of distances each bc is offset
+    :param windows: (m + 2, 2) array of unique points. Corner k is windows[k: k+3]
+    :param corner_index: (n,) array mapping each row to its corner in windows
+
+    Each attribute is a contiguous NumPy array, so the whole result can be passed
+    on as a buffer. Indexing or iterating returns GapCornerRow views, which have
+    the same attributes as GapCorner.
+    """
+
+    __slots__ = ("angle", "corner_index", "cpts", "gap_1", "gap_2", "windows", "xsect")
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        xsect: _FArray,
+        angle: _FArray,
+        cpts: _FArray,
+        gap_1: _FArray,
+        gap_2: _FArray,
+        windows: _FArray,
+        corner_index: _IArray,
+    ) -> None:
+        """Store each column as a contiguous array."""
+        self.xsect = np.ascontiguousarray(xsect)
+        self.angle = np.ascontiguousarray(angle)
+        self.cpts = np.ascontiguousarray(cpts)
+        self.gap_1 = np.ascontiguousarray(gap_1)
+        self.gap_2 = np.ascontiguousarray(gap_2)
+        self.windows = np.ascontiguousarray(windows)
+        self.corner_index = np.ascontiguousarray(corner_index)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.xsect)
+
+    def __getitem__(self, index: int) -> GapCornerRow:
+        """Return a GapCornerRow view of one row.
+
+        :raise IndexError: if index is out of range
+        """
+        if not -len(self) <= index < len(self):
+            msg = "GapCornerArray index out of range"
+            raise IndexError(msg)
+        return GapCornerRow(self, index % len(self))
+
+    def __iter__(self) -> Iterator[GapCornerRow]:
+        """Yield a GapCornerRow view of each row."""
+        return (GapCornerRow(self, i) for i in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by all columns."""
+        return sum(getattr(self, x).nbytes for x in self.__slots__)
+
+    def translate(self, vec: npt.ArrayLike) -> GapCornerArray:
+        """Return a copy of every row moved by a vector.
+
+        :param vec: (x, y) distance to move every point
+        :return: a new GapCornerArray. xsect, cpts, and windows are moved. Other
+            columns are copied unchanged.
+        """
+        shift = np.asarray(vec, dtype=self.xsect.dtype)
+        return GapCornerArray(
+            self.xsect + shift,
+            np.copy(self.angle),
+            self.cpts + shift,
+            np.copy(self.gap_1),
+            np.copy(self.gap_2),
+            self.windows + shift,
+            np.copy(self.corner_index),
+        )
+
+
+def _wrap_polygon(points: _FArray, tolerance: float = 0) -> _FArray:
+    """Wrap a polyline around to the beginning if it is closed.
+
+    :param points: (n, 2) array of unique adjacent points
+    :param tolerance: maximum distance between the first and last points of a
+        closed polyline
+    :return: points with last point repeated if it is closed
+
+    From A, B, C, A to C, A, B, C, A
+    """
+    if np.hypot(*(points[0] - points[-1])) <= tolerance:
+        points = points[:-1]
+    return np.concatenate((points[-1:], points, points[:1]))
+
+
+def _anchor_polyline(points: _FArray) -> _FArray:
+    """Add edges to endpoints of an open polyline.
+
+    :param points: (n, 2) array of unique adjacent points
+    :return: polyline with extended edges at the beginning and end
+
+    From A, B, C to (A + (A - B)), A, B, C, (C - (B - C))
+    """
+    pnt_beg = points[0] + (points[0] - points[1])
+    pnt_end = points[-1] - (points[-2] - points[-1])
+    return np.concatenate((pnt_beg[np.newaxis], points, pnt_end[np.newaxis]))
+
+
+def _prepare_windows(
+    polyline: npt.ArrayLike,
+    poly_type: PolyType,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+) -> tuple[_FArray, _IArray]:
+    """Remove coincident points then wrap or anchor a polyline.
+
+    :param polyline: (n, 2) array of points
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param tolerance: maximum distance between coincident adjacent points
+    :param dtype: float32 or float64
+    :return: (m + 2, 2) array of points where corner k is windows[k: k+3] and an
+        (n,) array mapping each input point to its corner
+    :raise ValueError: if fewer than three points are given for a polygon
+    :raise ValueError: if fewer than two points are given for a polyline
+    """
+    points = np.reshape(np.asarray(polyline, dtype=get_float_dtype(dtype)), (-1, 2))
+    kept, run_lengths = get_point_runs(points, tolerance)
+    unique = points[kept]
+
+    if poly_type == PolyType.POLYGON:
+        if len(unique) < MIN_PTS_FOR_POLYGON:
+            msg = "at least three unique points required for a polygon"
+            raise ValueError(msg)
+        windows = _wrap_polygon(unique, tolerance)
+    elif poly_type == PolyType.POLYLINE:
+        if len(unique) < MIN_PTS_FOR_POLYLINE:
+            msg = "at least two unique points required for a polyline"
+            raise ValueError(msg)
+        windows = _anchor_polyline(unique)
+    else:
+        msg = (
+            f"poly_type must be PolyType.POLYGON or PolyType.POLYLINE, not {poly_type}"
+        )
+        raise ValueError(msg)
+
+    return windows, get_run_index(run_lengths, len(windows) - 2)
+
+
+class PreparedPoly:
+    """A polyline or polygon prepared for repeated offsets.
+
+    :param polyline: (n, 2) array of points
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param tolerance: optional maximum distance between coincident adjacent
+        points. See offset.offset_poly_per_vert.
+    :param dtype: float32 or float64. Points are cast to this, and every offset
+        is computed in it. Float32 halves the memory of every array for previews
+        that do not need double precision.
+    :raise ValueError: if fewer than three points are given for a polygon
+    :raise ValueError: if fewer than two points are given for a polyline
+    :raise ValueError: if dtype is not float32 or float64
+
+    Removing coincident points, wrapping or anchoring, mapping input points to
+    corners, and finding edge vectors, unit normals, and angles all happen once
+    here. Each offset after that is only the O(n) arithmetic that depends on the
+    gaps.
+    """
+
+    __slots__ = (
+        "_kernel",
+        "angle",
+        "corner_index",
+        "edge_vecs",
+        "normals",
+        "poly_type",
+        "windows",
+    )
+
+    def __init__(
+        self,
+        polyline: npt.ArrayLike,
+        poly_type: PolyType,
+        *,
+        tolerance: float = 0,
+        dtype: npt.DTypeLike = float,
+    ) -> None:
+        """Clean the points and compute everything that does not depend on gaps."""
+        self.poly_type = poly_type
+        with time_phase(get_active_stats(), "prepare"):
+            self.windows, self.corner_index = _prepare_windows(
+                polyline, poly_type, tolerance, dtype
+            )
+        self.edge_vecs = np.diff(self.windows, axis=0)
+        self.normals, is_zero = _get_unit_normals(self.edge_vecs)
+        self._kernel = CornerKernel(
+            self.windows[:-2],
+            self.windows[1:-1],
+            self.windows[2:],
+            (self.normals[:-1], is_zero[:-1]),
+            (self.normals[1:], is_zero[1:]),
+        )
+        self.angle = self._kernel.angle
+
+    def __len__(self) -> int:
+        """Return the number of input points."""
+        return len(self.corner_index)
+
+    @property
+    def num_corners(self) -> int:
+        """The number of unique corners."""
+        return len(self.windows) - 2
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """The dtype of every computed array."""
+        return self.windows.dtype
+
+    def offset_per_vert(
+        self, vert_offsets: npt.ArrayLike, out: npt.ArrayLike | None = None
+    ) -> GapCornerArray:
+        """Offset each corner.
+
+        :param vert_offsets: (m, 2) array of (gap_1, gap_2) pairs. One pair per
+            corner. Pairs are repeated if there are fewer pairs than corners.
+        :param out: optional writable buffer of n * 2 values in self.dtype. If
+            given, xsect points are written into it, and the xsect column of the
+            result is a view of it.
+        :return: one GapCornerArray row per input point
+        :raise ValueError: if out cannot hold every xsect point
+        """
+        out_ = _get_out(out, len(self), self.dtype)
+        gaps = np.reshape(np.asarray(vert_offsets, dtype=self.dtype), (-1, 2))
+        if gaps.size == 0:
+            gaps = np.zeros((1, 2), dtype=self.dtype)
+        gaps = np.resize(gaps, (self.num_corners, 2))
+        if self.poly_type == PolyType.POLYLINE:
+            gaps[0, 0] = gaps[0, 1]
+            gaps[-1, 1] = gaps[-1, 0]
+
+        stats = get_active_stats()
+        with time_phase(stats, "solve"):
+            xsect, cpts = self._kernel.solve(gaps[:, 0], gaps[:, 1])
+        if stats is not None:
+            self._kernel.add_stats(stats, xsect)
+        index = self.corner_index
+        with time_phase(stats, "align"):
+            return GapCornerArray(
+                np.take(xsect, index, axis=0, out=out_),
+                self.angle[index],
+                cpts[index],
+                gaps[index, 0],
+                gaps[index, 1],
+                self.windows,
+                index,
+            )
+
+    def offset_per_edge(
+        self, edge_offsets: npt.ArrayLike, out: npt.ArrayLike | None = None
+    ) -> GapCornerArray:
+        """Offset each edge.
+
+        :param edge_offsets: (m,) array of offsets. One per edge. Offsets are
+            repeated if there are fewer offsets than edges. A single float offsets
+            every edge.
+        :param out: optional writable buffer for xsect points. See offset_per_vert.
+        :return: one GapCornerArray row per input point
+        """
+        next_edges = np.atleast_1d(np.asarray(edge_offsets, dtype=self.dtype))
+        next_edges = next_edges[: len(self)]
+        prev_edges = np.roll(next_edges, 1)
+        gaps = np.stack((prev_edges, next_edges), axis=1)
+        return self.offset_per_vert(gaps, out)
+
+    def offset(self, offset: float, out: npt.ArrayLike | None = None) -> GapCornerArray:
+        """Offset every edge (to the left) by a constant amount.
+
+        :param offset: distance to offset from each edge
+        :param out: optional writable buffer for xsect points. See offset_per_vert.
+        :return: one GapCornerArray row per input point
+        """
+        return self.offset_per_edge(offset, out)
+
+    def offset_joined(
+        self,
+        offset: float,
+        join_type: JoinType,
+        *,
+        miter_limit: float = DEFAULT_MITER_LIMIT,
+        arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    ) -> _FArray:
+        """Offset every edge (to the left) and join the edges at each corner.
+
+        :param offset: distance to offset from each edge
+        :param join_type: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+        :param miter_limit: see GapCorner.get_join
+        :param arc_tolerance: see GapCorner.get_join
+        :return: (m, 2) array of the points of each unique corner join in order.
+            If the input is closed, the first point is repeated at the end.
+        :raise ValueError: if join_type is not a JoinType
+        """
+        gaps = np.full(self.num_corners, offset, dtype=self.dtype)
+        stats = get_active_stats()
+        with time_phase(stats, "solve"):
+            points, _ = self._kernel.get_joins(
+                gaps, gaps, join_type, (miter_limit, arc_tolerance)
+            )
+        if stats is not None:
+            self._kernel.add_stats(stats, self._kernel.get_miters(gaps, gaps))
+        if len(self) > 1 and self.corner_index[0] == self.corner_index[-1]:
+            return np.concatenate((points, points[:1]))
+        return points
+
+    def offset_multi(self, distances: npt.ArrayLike) -> _FArray:
+        """Offset every edge (to the left) by each of several constant amounts.
+
+        :param distances: (k,) array of distances to offset from each edge
+        :return: (k, n, 2) array of xsect points. One ring per distance.
+
+        For a constant offset, every xsect is pnt_b + distance * (the xsect of a
+        unit offset - pnt_b), so corners are only solved once. With record_stats,
+        each distance counts as one call.
+        """
+        ones = np.ones(self.num_corners, dtype=self.dtype)
+        distances_ = np.atleast_1d(np.asarray(distances, dtype=self.dtype))
+        stats = get_active_stats()
+        with time_phase(stats, "solve"):
+            unit_miters = self._kernel.get_miters(ones, ones)
+        if stats is not None:
+            for _ in distances_:
+                self._kernel.add_stats(stats, unit_miters)
+        with time_phase(stats, "align"):
+            miters = unit_miters[self.corner_index]
+            pnts_b = self.windows[1:-1][self.corner_index]
+            return pnts_b + distances_[:, np.newaxis, np.newaxis] * miters
+
+
+def offset_poly_per_vert_array(  # noqa: PLR0913
+    polyline: npt.ArrayLike,
+    vert_offsets: npt.ArrayLike,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+    out: npt.ArrayLike | None = None,
+) -> GapCornerArray:
+    """Offset each corner of a polyline or polygon.
+
+    :param polyline: (n, 2) array of points
+    :param vert_offsets: (m, 2) array of (gap_1, gap_2) pairs. One pair per corner.
+        Pairs are repeated if there are fewer pairs than corners.
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param tolerance: optional maximum distance between coincident adjacent
+        points
+    :param dtype: float32 or float64. See PreparedPoly.
+    :param out: optional writable buffer of n * 2 values in dtype. If given,
+        xsect points are written into it. See PreparedPoly.offset_per_vert.
+    :return: one GapCornerArray row matching each GapCorner instance returned by
+        offset_poly_per_vert
+    :raise ValueError: if fewer than three points are given for a polygon
+    :raise ValueError: if fewer than two points are given for a polyline
+    """
+    prepared = PreparedPoly(polyline, poly_type, tolerance=tolerance, dtype=dtype)
+    return prepared.offset_per_vert(vert_offsets, out)
+
+
+def offset_poly_per_edge_array(  # noqa: PLR0913
+    polyline: npt.ArrayLike,
+    edge_offsets: npt.ArrayLike,
+    poly_type: PolyType,
+    *,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+    out: npt.ArrayLike | None = None,
+) -> GapCornerArray:
+    """Offset each edge of a polyline or polygon.
+
+    :param polyline: (n, 2) array of points
+    :param edge_offsets: (m,) array of offsets. One per edge. Offsets are repeated
+        if there are fewer offsets than edges. A single float offsets every edge.
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param tolerance: optional maximum distance between coincident adjacent
+        points
+    :param dtype: float32 or float64. See PreparedPoly.
+    :param out: optional writable buffer of n * 2 values in dtype. If given,
+        xsect points are written into it. See PreparedPoly.offset_per_vert.
+    :return: one GapCornerArray row matching each GapCorner instance returned by
+        offset_poly_per_edge
+    """
+    prepared = PreparedPoly(polyline, poly_type, tolerance=tolerance, dtype=dtype)
+    return prepared.offset_per_edge(edge_offsets, out)
+
+
+def offset_polyline_array(
+    polyline: npt.ArrayLike,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+    out: npt.ArrayLike | None = None,
+) -> GapCornerArray:
+    """Offset polyline edges (to the left) by a constant amount.
+
+    :param polyline: (n, 2) array of points
+    :param offset: distance to offset from each edge
+    :param tolerance: optional maximum distance between coincident adjacent
+        points
+    :param dtype: float32 or float64. See PreparedPoly.
+    :param out: optional writable buffer of n * 2 values in dtype. If given,
+        xsect points are written into it. See PreparedPoly.offset_per_vert.
+    :return: one GapCornerArray row per point
+    """
+    return offset_poly_per_edge_array(
+        polyline, offset, PolyType.POLYLINE, tolerance=tolerance, dtype=dtype, out=out
+    )
+
+
+def offset_polygon_array(
+    polyline: npt.ArrayLike,
+    offset: float,
+    *,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+    out: npt.ArrayLike | None = None,
+) -> GapCornerArray:
+    """Offset polygon edges (to the left) by a constant amount.
+
+    :param polyline: (n, 2) array of points
+    :param offset: distance to offset from each edge
+    :param tolerance: optional maximum distance between coincident adjacent
+        points
+    :param dtype: float32 or float64. See PreparedPoly.
+    :param out: optional writable buffer of n * 2 values in dtype. If given,
+        xsect points are written into it. See PreparedPoly.offset_per_vert.
+    :return: one GapCornerArray row per point
+    """
+    return offset_poly_per_edge_array(
+        polyline, offset, PolyType.POLYGON, tolerance=tolerance, dtype=dtype, out=out
+    )
+
+
+def offset_joined_array(  # noqa: PLR0913
+    polyline: npt.ArrayLike,
+    offset: float,
+    poly_type: PolyType,
+    join_type: JoinType,
+    *,
+    miter_limit: float = DEFAULT_MITER_LIMIT,
+    arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+) -> _FArray:
+    """Offset edges (to the left) by a constant amount and join them at corners.
+
+    :param polyline: (n, 2) array of points
+    :param offset: distance to offset from each edge
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param join_type: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+    :param miter_limit: see GapCorner.get_join
+    :param arc_tolerance: see GapCorner.get_join
+    :param tolerance: optional maximum distance between coincident adjacent
+        points
+    :param dtype: float32 or float64. See PreparedPoly.
+    :return: (m, 2) array of points. See PreparedPoly.offset_joined.
+    """
+    prepared = PreparedPoly(polyline, poly_type, tolerance=tolerance, dtype=dtype)
+    return prepared.offset_joined(
+        offset, join_type, miter_limit=miter_limit, arc_tolerance=arc_tolerance
+    )
+
+
+def offset_polyline_multi(
+    polyline: npt.ArrayLike, distances: npt.ArrayLike, *, dtype: npt.DTypeLike = float
+) -> _FArray:
+    """Offset polyline edges (to the left) by each of several constant amounts.
+
+    :param polyline: (n, 2) array of points
+    :param distances: (k,) array of distances to offset from each edge
+    :param dtype: float32 or float64. See PreparedPoly.
+    :return: (k, n, 2) array. ring i matches the xsect values of
+        offset_polyline(polyline, distances[i])
+    """
+    return PreparedPoly(polyline, PolyType.POLYLINE, dtype=dtype).offset_multi(
+        distances
+    )
+
+
+def offset_polygon_multi(
+    polyline: npt.ArrayLike, distances: npt.ArrayLike, *, dtype: npt.DTypeLike = float
+) -> _FArray:
+    """Offset polygon edges (to the left) by each of several constant amounts.
+
+    :param polyline: (n, 2) array of points
+    :param distances: (k,) array of distances to offset from each edge
+    :param dtype: float32 or float64. See PreparedPoly.
+    :return: (k, n, 2) array. ring i matches the xsect values of
+        offset_polygon(polyline, distances[i])
+    """
+    return PreparedPoly(polyline, PolyType.POLYGON, dtype=dtype).offset_multi(distances)
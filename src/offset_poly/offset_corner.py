@@ -6,13 +6,59 @@
 
 from __future__ import annotations
 
+import enum
 import math
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 import vec2_math as v2
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 _Vec2 = tuple[float, float] | Iterable[float]
 _Seg = tuple[_Vec2, _Vec2] | Iterable[Iterable[float]]
+_TwoPoints = tuple[tuple[float, float], tuple[float, float]]
+_ThreePoints = tuple[tuple[float, float], tuple[float, float], tuple[float, float]]
+_OffsetEdge = tuple[_TwoPoints, tuple[float, float, float]]
+
+# angles this close to 0 or pi are straight or degenerate
+ABS_TOL = 1e-6
+
+# the SVG default. Miters longer than 4 gaps are beveled.
+DEFAULT_MITER_LIMIT = 4.0
+
+DEFAULT_ARC_TOLERANCE = 0.01
+
+
+class JoinType(enum.Enum):
+    """How to join offset edges at the outside of a corner.
+
+    MITER extends both offset edges to their xsect, unless the xsect is more than
+    miter_limit gaps from the corner. Then the corner is beveled.
+    BEVEL connects the ends of the offset edges with a straight segment.
+    ROUND connects the ends of the offset edges with an arc around the corner.
+
+    Corners on the inside of a turn always join at the xsect.
+    """
+
+    MITER = enum.auto()
+    BEVEL = enum.auto()
+    ROUND = enum.auto()
+
+
+def get_num_arc_steps(sweep: float, radius: float, arc_tolerance: float) -> int:
+    """Find how many chords an arc needs to stay within tolerance.
+
+    :param sweep: angle of the arc in radians
+    :param radius: radius of the arc
+    :param arc_tolerance: maximum distance between a chord and the arc
+    :return: number of equal chords, at least 1
+    """
+    if arc_tolerance >= radius:
+        return 1
+    max_step = 2 * math.acos(1 - arc_tolerance / radius)
+    return max(math.ceil(abs(sweep) / max_step), 1)
 
 
 def _offset_seg(
@@ -29,6 +75,78 @@ def _offset_seg(
     return v2.vadd(vec_a, vec_left), v2.vadd(vec_b, vec_left)
 
 
+def _offset_edge(seg: _Seg, gap: float) -> _OffsetEdge:
+    """Offset a line segment by a gap and find the line through it.
+
+    :param seg: line segment
+    :param gap: gap to offset by
+    :return: line segment moved gap distance to the left and the standard form
+        (a, b, c) of the line through that segment
+    """
+    seg_ = _offset_seg(seg, gap)
+    return seg_, v2.get_standard_form(seg_)
+
+
+def _offset_edge_xy(
+    x_0: float, y_0: float, x_1: float, y_1: float, gap: float
+) -> _OffsetEdge | None:
+    """Offset a line segment by a gap without any vec2_math calls.
+
+    :param x_0: x of the segment start
+    :param y_0: y of the segment start
+    :param x_1: x of the segment end
+    :param y_1: y of the segment end
+    :param gap: gap to offset by
+    :return: the same value as _offset_edge(((x_0, y_0), (x_1, y_1)), gap), or
+        None if the segment has zero length and gap is not zero
+
+    Every operation is done in the same order as the vec2_math functions
+    _offset_edge calls, so the results are identical.
+    """
+    if gap == 0:
+        nx, ny = 0, 0
+    else:
+        dx, dy = x_1 - x_0, y_1 - y_0
+        norm = math.sqrt(dy**2 + dx**2)
+        if norm == 0:
+            return None
+        scale = gap / norm
+        nx, ny = -dy * scale, dx * scale
+    ax, ay, bx, by = x_0 + nx, y_0 + ny, x_1 + nx, y_1 + ny
+    return ((ax, ay), (bx, by)), (ay - by, bx - ax, ax * by - bx * ay)
+
+
+def _intersect_edges_xy(
+    edge_1: _OffsetEdge, edge_2: _OffsetEdge
+) -> tuple[float, float] | None:
+    """Intersect the lines through two offset edges.
+
+    :param edge_1: an offset segment and its line
+    :param edge_2: an offset segment and its line
+    :return: the same value as v2.get_line_intersection(edge_1[1], edge_2[1])
+    """
+    a_1, b_1, c_1 = edge_1[1]
+    a_2, b_2, c_2 = edge_2[1]
+    det = a_2 * b_1 - b_2 * a_1
+    if math.isclose(det, 0):
+        return None
+    return (b_2 * c_1 - b_1 * c_2) / det, (a_1 * c_2 - a_2 * c_1) / det
+
+
+def _project_xy(
+    x_0: float, y_0: float, x_1: float, y_1: float, point: tuple[float, float]
+) -> tuple[float, float]:
+    """Find the closest point on a nonzero-length segment to a point.
+
+    :return: the same value as v2.project_to_segment(((x_0, y_0), (x_1, y_1)),
+        point)
+    """
+    dx, dy = x_1 - x_0, y_1 - y_0
+    time = ((point[0] - x_0) * dx + (point[1] - y_0) * dy) / (dx * dx + dy * dy)
+    time = max(0, min(1, time))
+    return x_0 + dx * time, y_0 + dy * time
+
+
 class GapCorner:
     """Offset a corner defined by three points.
 
@@ -42,8 +160,28 @@ class GapCorner:
     gap_2 from bc.
 
     Calculate quadratic Bezier control points for a rounded corner at abc
+
+    Derived geometry is computed the first time it is requested then cached.
+    The points, gaps, and angle are read-only, so a cached value cannot go
+    stale. Use translate to move a corner.
     """
 
+    __slots__ = (
+        "_ab_left_edge",
+        "_angle",
+        "_bc_left_edge",
+        "_cpts",
+        "_gap_1",
+        "_gap_2",
+        "_is_degenerate",
+        "_is_straight",
+        "_pnt_a",
+        "_pnt_b",
+        "_pnt_c",
+        "_xsect",
+        "_xsect_right_pnt",
+    )
+
     def __init__(
         self,
         pnt_a: _Vec2,
@@ -54,48 +192,197 @@ class GapCorner:
     ) -> None:
         """Initialize a GapCorner instance."""
         x, y = pnt_a
-        self.pnt_a = x, y
+        self._pnt_a = x, y
         x, y = pnt_b
-        self.pnt_b = x, y
+        self._pnt_b = x, y
         x, y = pnt_c
-        self.pnt_c = x, y
-        self.gap_1 = gap_1
-        self.gap_2 = gap_2 if gap_2 is not None else gap_1
-        vec_ab = v2.vsub(self.pnt_b, self.pnt_a)
-        vec_bc = v2.vsub(self.pnt_c, self.pnt_b)
-        self.angle = v2.get_signed_angle(vec_ab, vec_bc)
+        self._pnt_c = x, y
+        self._gap_1 = gap_1
+        self._gap_2 = gap_2 if gap_2 is not None else gap_1
+        vec_ab = v2.vsub(self._pnt_b, self._pnt_a)
+        vec_bc = v2.vsub(self._pnt_c, self._pnt_b)
+        self._angle = v2.get_signed_angle(vec_ab, vec_bc)
+        self._is_straight = math.isclose(self._angle, 0, abs_tol=ABS_TOL)
+        self._is_degenerate = math.isclose(
+            self._angle % (math.pi * 2), math.pi, abs_tol=ABS_TOL
+        )
+        self._ab_left_edge: _OffsetEdge | None = None
+        self._bc_left_edge: _OffsetEdge | None = None
+        self._xsect: tuple[float, float] | None = None
+        self._xsect_right_pnt: tuple[float, float] | None = None
+        self._cpts: _ThreePoints | None = None
+
+    @staticmethod
+    def from_offset_edges(  # noqa: PLR0913, PLR0917
+        pnt_a: _Vec2,
+        pnt_b: _Vec2,
+        pnt_c: _Vec2,
+        gap_1: float,
+        gap_2: float,
+        ab_left: _OffsetEdge,
+        bc_left: _OffsetEdge,
+    ) -> GapCorner:
+        """Create a GapCorner with precomputed left-offset edges.
+
+        :param pnt_a: first point
+        :param pnt_b: second point
+        :param pnt_c: third point
+        :param gap_1: gap to offset pnt_a and pnt_b by
+        :param gap_2: gap to offset pnt_b and pnt_c by
+        :param ab_left: segment ab offset gap_1 to the left and its line
+        :param bc_left: segment bc offset gap_2 to the left and its line
+        :return: a GapCorner that shares ab_left and bc_left instead of offsetting
+            ab and bc again
+        """
+        corner = GapCorner(pnt_a, pnt_b, pnt_c, gap_1, gap_2)
+        corner._ab_left_edge = ab_left
+        corner._bc_left_edge = bc_left
+        return corner
+
+    @staticmethod
+    def from_fused_kernel(
+        pnt_a: _Vec2, pnt_b: _Vec2, pnt_c: _Vec2, gap_1: float, gap_2: float
+    ) -> GapCorner:
+        """Create a GapCorner with xsect and cpts already computed.
+
+        :param pnt_a: first point
+        :param pnt_b: second point
+        :param pnt_c: third point
+        :param gap_1: gap to offset pnt_a and pnt_b by
+        :param gap_2: gap to offset pnt_b and pnt_c by
+        :return: a GapCorner with the same values GapCorner(pnt_a, pnt_b, pnt_c,
+            gap_1, gap_2) would compute lazily. See _init_fused.
+        """
+        corner = GapCorner.__new__(GapCorner)
+        corner._init_fused(pnt_a, pnt_b, pnt_c, gap_1, gap_2)  # noqa: SLF001
+        return corner
+
+    def _init_fused(
+        self, pnt_a: _Vec2, pnt_b: _Vec2, pnt_c: _Vec2, gap_1: float, gap_2: float
+    ) -> None:
+        """Set every attribute, computing xsect and cpts now.
+
+        Computes the angle, offset edges, xsect, and cpts on plain floats in one
+        pass, skipping the lazy properties and vec2_math calls. Values are the
+        same as a GapCorner would compute lazily. Anything that would raise
+        (zero-length segments with a gap, straight corners with unequal gaps) is
+        left uncomputed, so it still raises when it is requested.
+        """
+        ax, ay = pnt_a
+        bx, by = pnt_b
+        cx, cy = pnt_c
+        self._pnt_a, self._pnt_b, self._pnt_c = (ax, ay), (bx, by), (cx, cy)
+        self._gap_1, self._gap_2 = gap_1, gap_2
+        # x + y * -1 and 0.0 + match the signs of zeros from vec2_math, which
+        # decide whether atan2 returns pi or -pi
+        abx, aby = bx + ax * -1, by + ay * -1
+        bcx, bcy = cx + bx * -1, cy + by * -1
+        angle = math.atan2(abx * bcy - aby * bcx, 0.0 + abx * bcx + aby * bcy)
+        self._angle = angle
+        is_straight = math.isclose(angle, 0, abs_tol=ABS_TOL)
+        is_degenerate = math.isclose(angle % (math.pi * 2), math.pi, abs_tol=ABS_TOL)
+        self._is_straight, self._is_degenerate = is_straight, is_degenerate
+        ab_left = _offset_edge_xy(ax, ay, bx, by, gap_1)
+        bc_left = _offset_edge_xy(bx, by, cx, cy, gap_2)
+        self._ab_left_edge, self._bc_left_edge = ab_left, bc_left
+        self._xsect_right_pnt = None
+        self._xsect = None
+        self._cpts = None
+        if ab_left is None or bc_left is None:
+            return
+
+        if is_degenerate:
+            self._xsect = (math.nan, math.nan)
+        elif is_straight:
+            if gap_1 == gap_2:
+                self._xsect = ab_left[0][1]
+        else:
+            self._xsect = _intersect_edges_xy(ab_left, bc_left)
+
+        if is_straight or is_degenerate:
+            self._cpts = self._pnt_b, self._pnt_b, self._pnt_b
+            return
+        inside = self._xsect
+        if angle < 0:
+            ab_right = _offset_edge_xy(ax, ay, bx, by, -gap_1)
+            bc_right = _offset_edge_xy(bx, by, cx, cy, -gap_2 or 0)
+            if ab_right is not None and bc_right is not None:
+                inside = _intersect_edges_xy(ab_right, bc_right)
+                self._xsect_right_pnt = inside
+        if inside is not None and self._xsect is not None:
+            cp_a = _project_xy(ax, ay, bx, by, inside)
+            cp_c = _project_xy(bx, by, cx, cy, inside)
+            self._cpts = cp_a, self._pnt_b, cp_c
+
+    @property
+    def pnt_a(self) -> tuple[float, float]:
+        """First point."""
+        return self._pnt_a
+
+    @property
+    def pnt_b(self) -> tuple[float, float]:
+        """Second (corner) point."""
+        return self._pnt_b
+
+    @property
+    def pnt_c(self) -> tuple[float, float]:
+        """Third point."""
+        return self._pnt_c
+
+    @property
+    def gap_1(self) -> float:
+        """Gap to offset pnt_a and pnt_b by."""
+        return self._gap_1
+
+    @property
+    def gap_2(self) -> float:
+        """Gap to offset pnt_b and pnt_c by."""
+        return self._gap_2
+
+    @property
+    def angle(self) -> float:
+        """Signed angle from ab to bc."""
+        return self._angle
+
+    @property
+    def _ab_left_offset(self) -> _OffsetEdge:
+        """Return segment ab offset to the left and its line."""
+        if self._ab_left_edge is None:
+            self._ab_left_edge = _offset_edge((self._pnt_a, self._pnt_b), self._gap_1)
+        return self._ab_left_edge
+
+    @property
+    def _bc_left_offset(self) -> _OffsetEdge:
+        """Return segment bc offset to the left and its line."""
+        if self._bc_left_edge is None:
+            self._bc_left_edge = _offset_edge(
+                (self._pnt_b, self._pnt_c), self._gap_2 or 0
+            )
+        return self._bc_left_edge
 
     @property
     def _ab_left(self) -> tuple[tuple[float, float], tuple[float, float]]:
         """Return segment ab offset to the left."""
-        return _offset_seg((self.pnt_a, self.pnt_b), self.gap_1)
+        return self._ab_left_offset[0]
 
     @property
     def _ab_right(self) -> tuple[tuple[float, float], tuple[float, float]]:
         """Return segment ab offset to the right."""
-        return _offset_seg((self.pnt_a, self.pnt_b), -self.gap_1)
+        return _offset_seg((self._pnt_a, self._pnt_b), -self._gap_1)
 
     @property
     def _bc_left(self) -> tuple[tuple[float, float], tuple[float, float]]:
         """Return segment bc offset to the left."""
-        return _offset_seg((self.pnt_b, self.pnt_c), self.gap_2 or 0)
+        return self._bc_left_offset[0]
 
     @property
     def _bc_right(self) -> tuple[tuple[float, float], tuple[float, float]]:
         """Return segment bc offset to the right."""
-        return _offset_seg((self.pnt_b, self.pnt_c), -self.gap_2 or 0)
-
-    @property
-    def _is_straight(self) -> bool:
-        """Return True if b (almost) lies on ac."""
-        return math.isclose(self.angle, 0, abs_tol=1e-6)
+        return _offset_seg((self._pnt_b, self._pnt_c), -self._gap_2 or 0)
 
-    @property
-    def _is_degenerate(self) -> bool:
-        """Return True if corner forms a zero-degree angle."""
-        return math.isclose(self.angle % (math.pi * 2), math.pi, abs_tol=1e-6)
-
-    def _get_xsect(self, seg_1: _Seg, seg_2: _Seg) -> tuple[float, float]:
+    def _get_xsect(
+        self, edge_1: _OffsetEdge, edge_2: _OffsetEdge
+    ) -> tuple[float, float]:
         """Return the intersection of two offset segments.
 
         :raise ValueError: if segments do not intersect (straight line with two
@@ -106,13 +393,12 @@ class GapCorner:
         if self._is_degenerate:
             return (math.nan, math.nan)
         if self._is_straight:
-            if self.gap_1 != self.gap_2:
+            if self._gap_1 != self._gap_2:
                 msg = "gaps must be equal for straight corners"
                 raise ValueError(msg)
-            _, (x, y) = seg_1
+            (_, (x, y)), _ = edge_1
             return (x, y)
-        line_1, line_2 = (v2.get_standard_form(x) for x in (seg_1, seg_2))
-        xsect_ = v2.get_line_intersection(line_1, line_2)
+        xsect_ = v2.get_line_intersection(edge_1[1], edge_2[1])
         if xsect_ is None:
             msg = "segments are not parallel but no intersection found"
             raise RuntimeError(msg)
@@ -121,37 +407,150 @@ class GapCorner:
     @property
     def xsect(self) -> tuple[float, float]:
         """The intersection of left-offset segments ab and bc."""
-        return self._get_xsect(self._ab_left, self._bc_left)
+        if self._xsect is None:
+            self._xsect = self._get_xsect(self._ab_left_offset, self._bc_left_offset)
+        return self._xsect
 
     @property
     def _xsect_right(self) -> tuple[float, float]:
         """The intersection of right-offset segments ab and bc."""
-        return self._get_xsect(self._ab_right, self._bc_right)
+        if self._xsect_right_pnt is None:
+            ab_right = _offset_edge((self._pnt_a, self._pnt_b), -self._gap_1)
+            bc_right = _offset_edge((self._pnt_b, self._pnt_c), -self._gap_2 or 0)
+            self._xsect_right_pnt = self._get_xsect(ab_right, bc_right)
+        return self._xsect_right_pnt
 
     def _get_cp(self, seg: _Seg) -> tuple[float, float]:
         """Return closest point on seg to xsect."""
         if self._is_straight or self._is_degenerate:
-            return self.pnt_b
-        if self.angle > 0:
+            return self._pnt_b
+        if self._angle > 0:
             return v2.project_to_segment(seg, self.xsect)
         return v2.project_to_segment(seg, self._xsect_right)
 
     @property
     def _cp_a(self) -> tuple[float, float]:
         """Return closest point on ab to xsect."""
-        return self._get_cp((self.pnt_a, self.pnt_b))
+        return self._get_cp((self._pnt_a, self._pnt_b))
 
     @property
     def _cp_c(self) -> tuple[float, float]:
         """Return closest point on bc to xsect."""
-        return self._get_cp((self.pnt_b, self.pnt_c))
+        return self._get_cp((self._pnt_b, self._pnt_c))
 
     @property
     def cpts(
         self,
     ) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float]]:
         """Return control points for a Bezier curve at the corner."""
-        return self._cp_a, self.pnt_b, self._cp_c
+        if self._cpts is None:
+            self._cpts = self._cp_a, self._pnt_b, self._cp_c
+        return self._cpts
+
+    @property
+    def is_outside(self) -> bool:
+        """True if the offset edges do not meet at this corner.
+
+        The left side of a right turn (or the right side of a left turn for a
+        negative gap). A degenerate corner is always outside.
+        """
+        if self._is_degenerate:
+            return True
+        if self._is_straight:
+            return False
+        return self._angle * (self._gap_1 + self._gap_2) < 0
+
+    def _iter_join_steps(self, num_steps: int) -> Iterator[tuple[float, float]]:
+        """Step around the outside of the corner from the end of ab to bc.
+
+        :param num_steps: number of equal chords
+        :yield: num_steps + 1 points from the end of offset ab to the start of
+            offset bc. Between them, the radius is interpolated from gap_1 to
+            gap_2.
+        """
+        side = math.copysign(1, self._gap_1 + self._gap_2)
+        sweep = -side * math.pi if self._is_degenerate else self._angle
+        (ax, ay), (bx, by) = self._pnt_a, self._pnt_b
+        start = math.atan2(side * (bx - ax), -side * (by - ay))
+        radius_1, radius_2 = abs(self._gap_1), abs(self._gap_2)
+        yield self._ab_left[1]
+        for i in range(1, num_steps):
+            time = i / num_steps
+            radius = radius_1 + (radius_2 - radius_1) * time
+            theta = start + sweep * time
+            yield bx + radius * math.cos(theta), by + radius * math.sin(theta)
+        yield self._bc_left[0]
+
+    def get_join(
+        self,
+        join_type: JoinType,
+        miter_limit: float = DEFAULT_MITER_LIMIT,
+        arc_tolerance: float = DEFAULT_ARC_TOLERANCE,
+    ) -> list[tuple[float, float]]:
+        """Join the offset edges at this corner.
+
+        :param join_type: JoinType.MITER, JoinType.BEVEL, or JoinType.ROUND
+        :param miter_limit: maximum distance from pnt_b to a miter xsect, in
+            multiples of the larger gap. Only used for JoinType.MITER.
+        :param arc_tolerance: maximum distance between a chord and its arc. Only
+            used for JoinType.ROUND.
+        :return: [xsect] where the offset edges meet, else the points that
+            connect the end of offset ab to the start of offset bc
+        """
+        if not self.is_outside:
+            return [self.xsect]
+        radius = max(abs(self._gap_1), abs(self._gap_2))
+        if join_type == JoinType.MITER:
+            miter = math.dist(self.xsect, self._pnt_b)
+            if miter <= miter_limit * radius:
+                return [self.xsect]
+        num_steps = 1
+        if join_type == JoinType.ROUND:
+            sweep = math.pi if self._is_degenerate else self._angle
+            num_steps = get_num_arc_steps(sweep, radius, arc_tolerance)
+        return list(self._iter_join_steps(num_steps))
+
+    def _init_moved(self, corner: GapCorner, dx: float, dy: float) -> None:
+        """Set every attribute from another corner moved by (dx, dy).
+
+        An xsect or cpts already computed on corner is moved. Offset edges are
+        left to be computed again if they are needed.
+        """
+        (ax, ay), (bx, by), (cx, cy) = corner._pnt_a, corner._pnt_b, corner._pnt_c
+        self._pnt_a, self._pnt_b = (ax + dx, ay + dy), (bx + dx, by + dy)
+        self._pnt_c = cx + dx, cy + dy
+        self._gap_1, self._gap_2, self._angle = (
+            corner._gap_1,
+            corner._gap_2,
+            corner._angle,
+        )
+        self._is_straight = corner._is_straight
+        self._is_degenerate = corner._is_degenerate
+        self._ab_left_edge = None
+        self._bc_left_edge = None
+        self._xsect = corner._xsect
+        if self._xsect is not None:
+            self._xsect = self._xsect[0] + dx, self._xsect[1] + dy
+        self._xsect_right_pnt = corner._xsect_right_pnt
+        if self._xsect_right_pnt is not None:
+            x, y = self._xsect_right_pnt
+            self._xsect_right_pnt = x + dx, y + dy
+        self._cpts = corner._cpts
+        if self._cpts is not None:
+            (ax, ay), _, (cx, cy) = self._cpts
+            self._cpts = (ax + dx, ay + dy), self._pnt_b, (cx + dx, cy + dy)
+
+    def translate(self, vec: _Vec2) -> GapCorner:
+        """Return a copy of this corner moved by a vector.
+
+        :param vec: (x, y) distance to move every point
+        :return: a new GapCorner with the same angle and gaps. An xsect or cpts
+            already computed here is moved instead of computed again.
+        """
+        dx, dy = vec
+        corner = GapCorner.__new__(GapCorner)
+        corner._init_moved(self, dx, dy)  # noqa: SLF001
+        return corner
 
 
 def gap_corner(
@@ -169,4 +568,68 @@ def gap_corner(
     """
     if gap_2 is None:
         gap_2 = gap_1
-    return GapCorner(pnt_a, pnt_b, pnt_c, gap_1, gap_2)
+    return GapCorner.from_fused_kernel(pnt_a, pnt_b, pnt_c, gap_1, gap_2)
+
+
+def iter_gap_corners(
+    points: Iterable[_Vec2], gap_pairs: Iterable[tuple[float, float]]
+) -> Iterator[GapCorner]:
+    """Offset (to the left) each corner along a sequence of points.
+
+    :param points: points. Every point except the first and last is a corner.
+    :param gap_pairs: (gap_1, gap_2) for each corner
+    :yield: a GapCorner for each corner
+
+    Each edge is offset once and shared by the two corners on either end of it, as
+    long as gap_2 of one corner is equal to gap_1 of the next.
+    """
+    points_ = iter(points)
+    pnt_a = next(points_, None)
+    pnt_b = next(points_, None)
+    if pnt_a is None or pnt_b is None:
+        return
+    prev_gap: float | None = None
+    prev_edge: _OffsetEdge | None = None
+    for pnt_c, (gap_1, gap_2) in zip(points_, gap_pairs, strict=False):
+        if prev_edge is not None and prev_gap == gap_1:
+            ab_left = prev_edge
+        else:
+            ab_left = _offset_edge((pnt_a, pnt_b), gap_1)
+        bc_left = _offset_edge((pnt_b, pnt_c), gap_2)
+        yield GapCorner.from_offset_edges(
+            pnt_a, pnt_b, pnt_c, gap_1, gap_2, ab_left, bc_left
+        )
+        pnt_a, pnt_b = pnt_b, pnt_c
+        prev_gap, prev_edge = gap_2, bc_left
+
+
+def iter_fused_gap_corners(
+    points: Iterable[_Vec2], gap_pairs: Iterable[tuple[float, float]]
+) -> Iterator[GapCorner]:
+    """Offset (to the left) each corner along a sequence of points, eagerly.
+
+    :param points: points. Every point except the first and last is a corner.
+    :param gap_pairs: (gap_1, gap_2) for each corner
+    :yield: a GapCorner for each corner with xsect and cpts already computed
+
+    Same values as iter_gap_corners, but each corner is computed in one pass on
+    plain floats. For small polylines, where vec2_math call overhead is most of
+    the cost, that is a few times faster. For large polylines, iter_gap_corners
+    shares each offset edge between two corners and skips whatever is never
+    requested.
+    """
+    points_ = iter(points)
+    pnt_a = next(points_, None)
+    pnt_b = next(points_, None)
+    if pnt_a is None or pnt_b is None:
+        return
+    for pnt_c, (gap_1, gap_2) in zip(points_, gap_pairs, strict=False):
+        corner = GapCorner.from_fused_kernel(pnt_a, pnt_b, pnt_c, gap_1, gap_2)
+        # iter_gap_corners offsets every edge up front, so it raises here
+        if (corner.pnt_a == corner.pnt_b and gap_1) or (
+            corner.pnt_b == corner.pnt_c and gap_2
+        ):
+            msg = "cannot scale a zero-length vector to a nonzero length"
+            raise ValueError(msg)
+        yield corner
+        pnt_a, pnt_b = pnt_b, pnt_c
@@ -7,14 +7,179 @@
 from __future__ import annotations
 
 import itertools as it
+import math
+import operator
+import sys
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
+
+    import numpy as np
+    import numpy.typing as npt
 
 _Vec2 = tuple[float, float] | Iterable[float]
 
+_T = TypeVar("_T")
+
+
+def _is_ndarray(obj: object) -> bool:
+    """Return True if obj is a numpy array, without importing numpy.
+
+    :param obj: anything
+    :return: True if obj is a numpy ndarray
+    """
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def are_coincident(pnt_a: _Vec2, pnt_b: _Vec2, tolerance: float = 0) -> bool:
+    """Return True if two points are within tolerance of each other.
+
+    :param pnt_a: point
+    :param pnt_b: point
+    :param tolerance: maximum distance between coincident points. With the
+        default 0, points must be exactly equal.
+    :return: True if the points are coincident
+    """
+    if tolerance:
+        return math.dist(tuple(pnt_a), tuple(pnt_b)) <= tolerance
+    return tuple(pnt_a) == tuple(pnt_b)
+
+
+@overload
+def get_point_runs(
+    polyline: npt.NDArray[Any], tolerance: float = 0
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
+
+
+@overload
+def get_point_runs(
+    polyline: Sequence[_Vec2], tolerance: float = 0
+) -> tuple[Sequence[int], Sequence[int]]: ...
+
+
+def get_point_runs(
+    polyline: Sequence[_Vec2] | npt.NDArray[Any], tolerance: float = 0
+) -> (
+    tuple[Sequence[int], Sequence[int]]
+    | tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]
+):
+    """Find runs of coincident adjacent points in one pass.
+
+    :param polyline: polyline. If a numpy array, points are compared as arrays
+        without a Python loop.
+    :param tolerance: maximum distance between coincident adjacent points. With
+        the default 0, points must be exactly equal. Each point is compared to
+        the point before it, so a run can drift farther than tolerance if every
+        step is within tolerance.
+    :return: (kept, run_lengths). kept[k] is the index of the first point in
+        run k. run_lengths[k] is the number of points in run k. Lists for
+        Python sequences and integer arrays for numpy arrays.
+
+    [A, B, B, C] -> [0, 1, 3], [1, 2, 1]
+    """
+    if _is_ndarray(polyline):
+        np = sys.modules["numpy"]
+        points = np.reshape(polyline, (len(polyline), -1))
+        is_first = np.ones(len(points), dtype=bool)
+        if tolerance:
+            steps = np.hypot(*(points[1:] - points[:-1]).T)
+            is_first[1:] = steps > tolerance
+        else:
+            is_first[1:] = np.any(points[1:] != points[:-1], axis=1)
+        kept = np.flatnonzero(is_first)
+        return kept, np.diff(kept, append=len(points))
+    if tolerance:
+        steps = map(math.dist, it.islice(polyline, 1, None), polyline)
+        is_first = it.chain([True], map(float(tolerance).__lt__, steps))
+    else:
+        is_first = it.chain(
+            [True], map(operator.ne, it.islice(polyline, 1, None), polyline)
+        )
+    kept = list(it.compress(range(len(polyline)), is_first))
+    if len(kept) == len(polyline):
+        return kept, [1] * len(kept)
+    return kept, list(map(operator.sub, [*kept[1:], len(polyline)], kept))
+
+
+def snap_points(points: Iterable[_Vec2], tolerance: float) -> list[tuple[float, float]]:
+    """Snap every point to the first earlier point within tolerance.
+
+    :param points: any iterable of points
+    :param tolerance: maximum distance between points snapped together. Must be
+        greater than 0.
+    :return: points as tuples. Points within tolerance of an earlier point,
+        adjacent or not, are replaced with that exact point.
+    :raise ValueError: if tolerance is not greater than 0
+
+    Points are hashed into a grid of tolerance-sized cells, so each point is only
+    compared to points in the nine cells around it. After snapping, jittered
+    duplicates (including the closing point of a polygon) are exactly equal, so
+    get_point_runs with the default tolerance will collapse them.
+    """
+    if tolerance <= 0:
+        msg = f"tolerance must be greater than 0, not {tolerance}"
+        raise ValueError(msg)
+    grid: dict[tuple[int, int], list[tuple[float, float]]] = {}
+    snapped: list[tuple[float, float]] = []
+    for x, y in points:
+        col, row = math.floor(x / tolerance), math.floor(y / tolerance)
+        cells = ((col + i, row + j) for i in (-1, 0, 1) for j in (-1, 0, 1))
+        near = (p for c in cells for p in grid.get(c, ()))
+        match = next((p for p in near if math.dist(p, (x, y)) <= tolerance), None)
+        if match is None:
+            match = (x, y)
+            grid.setdefault((col, row), []).append(match)
+        snapped.append(match)
+    return snapped
+
+
+@overload
+def get_run_index(
+    run_lengths: npt.NDArray[np.intp], num_values: int
+) -> npt.NDArray[np.intp]: ...
+
+
+@overload
+def get_run_index(run_lengths: Sequence[int], num_values: int) -> Sequence[int]: ...
+
+
+def get_run_index(
+    run_lengths: Sequence[int] | npt.NDArray[np.intp], num_values: int
+) -> Sequence[int] | npt.NDArray[np.intp]:
+    """Map each point to a value, one value per run, cycling the values.
+
+    :param run_lengths: run lengths from get_point_runs
+    :param num_values: number of values, at least 1. Run k gets value
+        k % num_values, so a closing point gets the first value.
+    :return: one value index per point. An integer array if run_lengths is a
+        numpy array, else a list.
+
+    [1, 2, 1], 2 -> [0, 1, 1, 0]
+    """
+    if _is_ndarray(run_lengths):
+        np = sys.modules["numpy"]
+        return np.repeat(np.arange(len(run_lengths)) % num_values, run_lengths)
+    value_indices = it.cycle(range(num_values))
+    return list(it.chain.from_iterable(map(it.repeat, value_indices, run_lengths)))
+
+
+def expand_runs(values: Sequence[_T], run_lengths: Sequence[int]) -> list[_T]:
+    """Repeat one value per run of points, cycling the values.
+
+    :param values: one value per run. If there are fewer values than runs, the
+        values are cycled, so a closing point gets the first value.
+    :param run_lengths: run lengths from get_point_runs
+    :return: run_lengths[k] copies of values[k % len(values)] for each run k
+
+    [D, E], [1, 2, 1] -> [D, E, E, D]
+    """
+    if sum(run_lengths) == len(run_lengths):
+        return list(it.islice(it.cycle(values), len(run_lengths)))
+    return list(it.chain.from_iterable(map(it.repeat, it.cycle(values), run_lengths)))
+
 
 def remove_coincident_adjacent_points(polyline: Sequence[_Vec2]) -> list[_Vec2]:
     """Remove zero-length segments from a polyline.
@@ -22,14 +187,31 @@ def remove_coincident_adjacent_points(polyline: Sequence[_Vec2]) -> list[_Vec2]:
     :param polyline: polyline
     :return: polyline with zero-length segments removed
     """
-    new_points: list[_Vec2] = []
-    for i, point in enumerate(polyline):
-        if i == 0 or point != polyline[i - 1]:
-            new_points.append(point)
-    return new_points
+    kept, _ = get_point_runs(polyline)
+    return list(map(polyline.__getitem__, kept))
 
 
-_T = TypeVar("_T")
+def iter_point_runs(
+    points: Iterable[_Vec2],
+) -> Iterator[tuple[tuple[float, float], int]]:
+    """Collapse runs of coincident adjacent points.
+
+    :param points: any iterable of points. Will only be iterated over once.
+    :yield: each unique point (as a tuple) and the number of times it is repeated
+
+    [A, B, B, C] -> (A, 1), (B, 2), (C, 1)
+    """
+    run_point: tuple[float, float] | None = None
+    run_length = 0
+    for x, y in points:
+        if (x, y) == run_point:
+            run_length += 1
+            continue
+        if run_point is not None:
+            yield run_point, run_length
+        run_point, run_length = (x, y), 1
+    if run_point is not None:
+        yield run_point, run_length
 
 
 def align_closing_points(polyline_a: Sequence[_Vec2], polyline_b: list[_T]) -> list[_T]:
@@ -49,13 +231,5 @@ def align_closing_points(polyline_a: Sequence[_Vec2], polyline_b: list[_T]) -> l
     polyline_b -> [D, E, F]
     polyline_c -> [D, E, F, D]
     """
-    polyline_c: list[_T] = []
-    points_b = it.cycle(polyline_b)
-    for i, point_a in enumerate(polyline_a):
-        if i == 0:
-            polyline_c.append(next(points_b))
-        elif point_a == polyline_a[i - 1]:
-            polyline_c.append(polyline_c[-1])
-        else:
-            polyline_c.append(next(points_b))
-    return polyline_c
+    _, run_lengths = get_point_runs(polyline_a)
+    return expand_runs(polyline_b, run_lengths)
@@ -0,0 +1,401 @@
+"""Remove loops where an offset polyline or polygon crosses itself.
+
+Offsets of concave shapes cross themselves when the offset is larger than a local
+feature. Convex corners offset inward and concave corners offset outward give
+small inverted loops ("swallowtails"). A narrow neck offset inward splits a
+polygon into two loops with the original orientation.
+
+Intersecting segments are found with a uniform grid. Each segment is added to
+every grid cell it passes through (not every cell in its bounding box, which
+grows with the square of a long diagonal edge). Only segments that share a cell
+are tested against each other. With cells about the size of an average segment,
+this is close to O(N log N) for offsets, instead of testing every pair of
+segments.
+
+Once the intersections are found, the path is split into loops. Any loop that
+closes on an intersection point is cut out of the path when that intersection is
+reached for the second time.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import itertools as it
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from offset_poly.offset import MIN_PTS_FOR_POLYGON, MIN_PTS_FOR_POLYLINE, PolyType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+_Vec2 = tuple[float, float] | Iterable[float]
+_Point = tuple[float, float]
+_Segment = tuple[_Point, _Point]
+
+# A cross product this close to zero means the segments are parallel.
+_PARALLEL_TOL = 1e-12
+
+# Pad each segment by this many cell sizes, so a crossing that rounds onto a cell
+# boundary is in a cell both segments share.
+_CELL_PAD = 1e-9
+
+
+def _clean_points(points: Iterable[_Vec2], poly_type: PolyType) -> list[_Point]:
+    """Convert points to tuples and remove nan and coincident adjacent points.
+
+    :param points: offset points. Might include (nan, nan) from 180-degree corners.
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :return: points as float tuples. No closing point for polygons.
+    """
+    clean: list[_Point] = []
+    for x, y in points:
+        point = (float(x), float(y))
+        if math.isnan(point[0]) or math.isnan(point[1]):
+            continue
+        if not clean or point != clean[-1]:
+            clean.append(point)
+    if poly_type == PolyType.POLYGON:
+        while len(clean) > 1 and clean[0] == clean[-1]:
+            _ = clean.pop()
+    return clean
+
+
+def _get_segments(points: Sequence[_Point], poly_type: PolyType) -> list[_Segment]:
+    """Return the segments of a polyline or polygon.
+
+    :param points: clean points
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :return: (points[i], points[i + 1]) for each segment
+    """
+    if not points:
+        return []
+    if poly_type == PolyType.POLYGON:
+        return list(zip(points, [*points[1:], points[0]], strict=True))
+    return list(it.pairwise(points))
+
+
+def _get_cell_size(segments: Sequence[_Segment]) -> float:
+    """Return a grid-cell size near the average segment extent.
+
+    :param segments: segments to be indexed
+    :return: width and height of a grid cell. Always greater than zero.
+    """
+    extents = [max(abs(bx - ax), abs(by - ay)) for (ax, ay), (bx, by) in segments]
+    return max(sum(extents) / len(extents), _PARALLEL_TOL)
+
+
+def _iter_cells(segment: _Segment, cell_size: float) -> Iterator[tuple[int, int]]:
+    """Yield every grid cell a segment passes through.
+
+    :param segment: a segment
+    :param cell_size: width and height of a grid cell
+    :yield: (col, row) of each cell, one column at a time. Cells within
+        _CELL_PAD cell sizes of the segment are included.
+
+    The segment is clipped to each column it spans, and only the rows between
+    the ends of that clipped piece are yielded, so a long segment is added to
+    O(length / cell_size) cells.
+    """
+    (ax, ay), (bx, by) = sorted(segment)
+    pad = cell_size * _CELL_PAD
+    slope = (by - ay) / (bx - ax) if bx != ax else 0
+    min_col = math.floor((ax - pad) / cell_size)
+    max_col = math.floor((bx + pad) / cell_size)
+    for col in range(min_col, max_col + 1):
+        if bx == ax:
+            y_0, y_1 = ay, by
+        else:
+            x_0 = min(max(ax, col * cell_size), bx)
+            x_1 = max(min(bx, (col + 1) * cell_size), ax)
+            y_0, y_1 = ay + (x_0 - ax) * slope, ay + (x_1 - ax) * slope
+        min_row = math.floor((min(y_0, y_1) - pad) / cell_size)
+        max_row = math.floor((max(y_0, y_1) + pad) / cell_size)
+        for row in range(min_row, max_row + 1):
+            yield col, row
+
+
+def _iter_candidate_pairs(segments: Sequence[_Segment]) -> Iterator[tuple[int, int]]:
+    """Yield each pair of segment indices that share a grid cell.
+
+    :param segments: segments to be indexed
+    :yield: (i, j) with i < j. Each pair is yielded once.
+    """
+    cell_size = _get_cell_size(segments)
+    grid: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    for i, segment in enumerate(segments):
+        for cell in _iter_cells(segment, cell_size):
+            grid[cell].append(i)
+    seen: set[tuple[int, int]] = set()
+    for cell in grid.values():
+        for pair in it.combinations(cell, 2):
+            if pair not in seen:
+                seen.add(pair)
+                yield pair
+
+
+def _intersect_segments(
+    seg_a: _Segment, seg_b: _Segment
+) -> tuple[float, float, _Point] | None:
+    """Find where two segments cross.
+
+    :param seg_a: first segment
+    :param seg_b: second segment
+    :return: (param on seg_a, param on seg_b, intersection point) or None if the
+        segments do not cross. Params are in [0, 1), so a crossing at a shared
+        vertex is found on only one of the two segments that share it. Parallel
+        segments never cross.
+    """
+    (ax, ay), (bx, by) = seg_a
+    (cx, cy), (dx, dy) = seg_b
+    vec_ab = (bx - ax, by - ay)
+    vec_cd = (dx - cx, dy - cy)
+    denom = vec_ab[0] * vec_cd[1] - vec_ab[1] * vec_cd[0]
+    if abs(denom) < _PARALLEL_TOL:
+        return None
+    vec_ac = (cx - ax, cy - ay)
+    time_a = (vec_ac[0] * vec_cd[1] - vec_ac[1] * vec_cd[0]) / denom
+    time_b = (vec_ac[0] * vec_ab[1] - vec_ac[1] * vec_ab[0]) / denom
+    if not (0 <= time_a < 1 and 0 <= time_b < 1):
+        return None
+    return time_a, time_b, (ax + vec_ab[0] * time_a, ay + vec_ab[1] * time_a)
+
+
+def _are_adjacent(i: int, j: int, num_segments: int, poly_type: PolyType) -> bool:
+    """Return True if segments i < j share a vertex.
+
+    :param i: index of the first segment
+    :param j: index of the second segment, greater than i
+    :param num_segments: number of segments in the polyline or polygon
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :return: True if segment j follows segment i
+    """
+    if j - i == 1:
+        return True
+    return poly_type == PolyType.POLYGON and i == 0 and j == num_segments - 1
+
+
+def _iter_crossings(
+    segments: Sequence[_Segment], poly_type: PolyType
+) -> Iterator[tuple[int, int, float, float, _Point]]:
+    """Yield every crossing between non-adjacent segments.
+
+    :param segments: segments of a polyline or polygon
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :yield: (i, j, param on segment i, param on segment j, point) for each
+        crossing, in no particular order
+    """
+    if not segments:
+        return
+    for i, j in _iter_candidate_pairs(segments):
+        if _are_adjacent(i, j, len(segments), poly_type):
+            continue
+        xsect = _intersect_segments(segments[i], segments[j])
+        if xsect is not None:
+            yield i, j, *xsect
+
+
+def find_self_intersections(
+    points: Iterable[_Vec2], poly_type: PolyType
+) -> list[tuple[int, int, tuple[float, float]]]:
+    """Find every point where a polyline or polygon crosses itself.
+
+    :param points: polyline or polygon points. nan points and coincident adjacent
+        points are removed before searching.
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :return: (i, j, point) for each crossing, where i < j are segment indices into
+        the cleaned points. Sorted by i then j.
+    """
+    segments = _get_segments(_clean_points(points, poly_type), poly_type)
+    return sorted((i, j, x) for i, j, _, _, x in _iter_crossings(segments, poly_type))
+
+
+def _get_signed_area(points: Sequence[_Point]) -> float:
+    """Return the signed area of a closed loop. Positive if ccw.
+
+    :param points: loop points without a closing point
+    :return: signed area
+    """
+    area = 0.0
+    for (ax, ay), (bx, by) in zip(points, [*points[1:], points[0]], strict=True):
+        area += ax * by - bx * ay
+    return area / 2
+
+
+def _iter_split_path(
+    segments: Sequence[_Segment], poly_type: PolyType
+) -> Iterator[tuple[int | None, int, _Point]]:
+    """Yield every point on the path, with crossings inserted where they occur.
+
+    :param segments: segments of a polyline or polygon
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :yield: (crossing id, segment index, point) for each point. The crossing id
+        is None for the original points. Each crossing is yielded twice, once on
+        each segment.
+    """
+    on_segment: defaultdict[int, list[tuple[float, int, _Point]]] = defaultdict(list)
+    crossings = _iter_crossings(segments, poly_type)
+    for crossing_id, (i, j, time_i, time_j, point) in enumerate(crossings):
+        on_segment[i].append((time_i, crossing_id, point))
+        on_segment[j].append((time_j, crossing_id, point))
+    for i, (pnt_a, _) in enumerate(segments):
+        yield None, i, pnt_a
+        for _, crossing, point in sorted(on_segment[i]):
+            yield crossing, i, point
+    if poly_type == PolyType.POLYLINE:
+        yield None, len(segments) - 1, segments[-1][1]
+
+
+def _get_turn(seg_a: _Segment, seg_b: _Segment) -> float:
+    """Return the cross product of two segment vectors. Positive for a left turn.
+
+    :param seg_a: segment turning from
+    :param seg_b: segment turning to
+    :return: cross product of the segment vectors
+    """
+    (ax, ay), (bx, by) = seg_a
+    (cx, cy), (dx, dy) = seg_b
+    return (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+
+
+def _split_loops(
+    segments: Sequence[_Segment], poly_type: PolyType
+) -> tuple[list[list[_Point]], list[tuple[int, int, float]]]:
+    """Cut every closed loop out of a path.
+
+    :param segments: segments of a polyline or polygon
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :return: (loops, links). Each loop starts and ends at the same crossing,
+        which is not repeated. The last loop is what is left of the path after
+        every other loop is cut out. Each link is (loop, parent loop, turn), where
+        turn is the cross product of the parent's path into and out of the
+        crossing where the loop was cut out.
+
+    Each crossing is visited twice. When a crossing is reached the second time,
+    everything after its first visit is a closed loop. Loops cut out earlier and
+    attached after that first visit are children of the new loop.
+    """
+    path: list[_Point] = []
+    path_ids: list[int | None] = []
+    first_visit: dict[int, tuple[int, int]] = {}
+    loops: list[list[_Point]] = []
+    links: list[tuple[int, int, float]] = []
+    orphans: list[tuple[int, int, float]] = []  # (path index, loop, turn)
+    for crossing, seg_index, point in _iter_split_path(segments, poly_type):
+        if crossing is not None and crossing in first_visit:
+            beg, beg_seg_index = first_visit.pop(crossing)
+            while orphans and orphans[-1][0] > beg:
+                _, child, turn = orphans.pop()
+                links.append((child, len(loops), turn))
+            turn = _get_turn(segments[beg_seg_index], segments[seg_index])
+            orphans.append((beg, len(loops), turn))
+            loops.append(path[beg:])
+            for popped in path_ids[beg + 1 :]:
+                if popped is not None:
+                    _ = first_visit.pop(popped, None)
+            del path[beg + 1 :]
+            del path_ids[beg + 1 :]
+            continue
+        if crossing is not None:
+            first_visit[crossing] = (len(path), seg_index)
+        path.append(point)
+        path_ids.append(crossing)
+    links.extend((child, len(loops), turn) for _, child, turn in orphans)
+    loops.append(path)
+    return loops, links
+
+
+def _get_left_windings(
+    loops: Sequence[list[_Point]], links: Iterable[tuple[int, int, float]]
+) -> list[int]:
+    """Get the winding number just to the left of each loop.
+
+    :param loops: loops from _split_loops
+    :param links: links from _split_loops
+    :return: the winding number of the entire path around a point just to the left
+        of each loop
+
+    The winding number left of a loop is one more than the winding number to the
+    right. The loop with the leftmost point has a winding number of 0 outside.
+    Every other winding number follows from the parent-child links. A child cut
+    out where its parent turns left lies to the right of its parent.
+    """
+    areas = [_get_signed_area(x) if x else 0.0 for x in loops]
+    neighbors: defaultdict[int, list[tuple[int, float, bool]]] = defaultdict(list)
+    for child, parent, turn in links:
+        neighbors[child].append((parent, turn, True))
+        neighbors[parent].append((child, turn, False))
+    anchor = min((i for i, x in enumerate(loops) if x), key=lambda i: min(loops[i]))
+    windings = {anchor: 1 if areas[anchor] > 0 else 0}
+    stack = [anchor]
+    while stack:
+        i = stack.pop()
+        for j, turn, j_is_parent in neighbors[i]:
+            if j in windings:
+                continue
+            if j_is_parent:
+                outside = windings[i] - (1 if areas[i] > 0 else 0)
+                windings[j] = outside + (1 if turn > 0 else 0)
+            else:
+                outside = windings[i] - (1 if turn > 0 else 0)
+                windings[j] = outside + (1 if areas[j] > 0 else 0)
+            stack.append(j)
+    return [windings.get(i, 0) for i in range(len(loops))]
+
+
+def remove_self_intersections(
+    points: Iterable[_Vec2],
+    poly_type: PolyType,
+    reference: Iterable[_Vec2] | None = None,
+) -> list[list[tuple[float, float]]]:
+    """Remove the parts of an offset that cross over themselves.
+
+    :param points: offset points, for instance [x.xsect for x in corners]. nan
+        points and coincident adjacent points are removed.
+    :param poly_type: PolyType.POLYLINE or PolyType.POLYGON
+    :param reference: optional points of the original (not offset) polygon, for
+        instance [x.pnt_b for x in corners]. Only the orientation is used. If
+        None, the orientation of the offset points is used. Ignored for
+        polylines.
+    :return: a list of polylines or polygons without self intersections.
+        For a polyline, this is one polyline from the first point to the last
+        point with every closed loop removed.
+        For a polygon, this is every loop on the boundary of the offset area,
+        without closing points. Loops with the orientation of the reference are
+        outer boundaries. Loops with the opposite orientation are holes.
+
+    The offset area of a polygon is where the offset path winds around once in
+    the direction of the reference. Loops that wind around twice (swallowtails
+    doubled over inside the offset) or zero times (swallowtails turned inside out
+    outside the offset) are removed.
+
+    An offset that inverts an entire polygon without crossing itself (a square
+    offset inward by more than its width, for instance) has no self
+    intersections, so it is returned as is.
+    """
+    clean = _clean_points(points, poly_type)
+    if poly_type == PolyType.POLYLINE:
+        min_points = MIN_PTS_FOR_POLYLINE
+    else:
+        min_points = MIN_PTS_FOR_POLYGON
+    if len(clean) < min_points:
+        return [clean] if clean and poly_type == PolyType.POLYLINE else []
+    loops, links = _split_loops(_get_segments(clean, poly_type), poly_type)
+    if poly_type == PolyType.POLYLINE:
+        return [_clean_points(loops[-1], poly_type)]
+    if reference is None:
+        orientation = _get_signed_area(clean)
+    else:
+        orientation = _get_signed_area(_clean_points(reference, poly_type))
+    boundary_winding = 1 if orientation > 0 else 0
+    windings = _get_left_windings(loops, links)
+    kept = (
+        _clean_points(x, poly_type)
+        for x, w in zip(loops, windings, strict=True)
+        if w == boundary_winding
+    )
+    return [x for x in kept if len(x) >= min_points and _get_signed_area(x) != 0]
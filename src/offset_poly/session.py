@@ -0,0 +1,347 @@
+"""Re-offset a polyline or polygon after editing a few points.
+
+Each GapCorner depends only on its own point, the unique points before and after,
+and its own gaps. When one point moves, only the corner of its run of coincident
+points and the corners of the runs on either side need to change. OffsetSession
+keeps the offset of the whole shape and recomputes only those corners.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import itertools as it
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from vec2_math import vadd, vsub
+
+from offset_poly.offset import MIN_PTS_FOR_POLYGON, MIN_PTS_FOR_POLYLINE, PolyType
+from offset_poly.offset_corner import GapCorner, gap_corner
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_Vec2 = tuple[float, float] | Iterable[float]
+_Point = tuple[float, ...]
+_Gaps = tuple[float, float]
+
+
+class OffsetSession:
+    """An offset polyline or polygon that can be edited one point at a time.
+
+    Gaps are given per point, not per unique corner as in offset_poly_per_vert,
+    so they stay with their points through inserts and deletes. A run of
+    coincident adjacent points uses the gaps of the first point in the run. The
+    run that contains point 0 uses the gaps of point 0. After every edit,
+    `corners` is what offset_poly_per_vert would return with the gaps of each run.
+    """
+
+    __slots__ = ("_corners", "_gaps", "_num_breaks", "_points", "poly_type")
+
+    def __init__(
+        self,
+        polyline: Iterable[_Vec2],
+        poly_type: PolyType,
+        vert_offsets: Iterable[tuple[float, float]] = ((0, 0),),
+    ) -> None:
+        """Offset every corner once.
+
+        :param polyline: polyline or polygon points
+        :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+        :param vert_offsets: (gap_1, gap_2) for each point. Cycled if shorter
+            than polyline, so [(1, 1)] offsets every edge by 1.
+        :raise ValueError: if poly_type is not a PolyType
+        :raise ValueError: if there are not enough unique points
+        """
+        if poly_type not in (PolyType.POLYGON, PolyType.POLYLINE):
+            msg = (
+                "poly_type must be PolyType.POLYGON or PolyType.POLYLINE, "
+                + f"not {poly_type}"
+            )
+            raise ValueError(msg)
+        self.poly_type = poly_type
+        self._points: list[_Point] = [tuple(x) for x in polyline]
+        gaps = it.cycle(vert_offsets)
+        self._gaps: list[_Gaps] = [next(gaps) for _ in self._points]
+        self._num_breaks = self._count_breaks(self._points)
+        self._check_num_points()
+        runs = list(self._iter_runs())
+        self._corners = [self._get_run_corner(*runs[0])] * len(self._points)
+        self._set_run_corners(runs[1:])
+
+    def __len__(self) -> int:
+        """Return the number of points.
+
+        :return: number of points, including coincident points
+        """
+        return len(self._points)
+
+    def __getitem__(self, index: int) -> GapCorner:
+        """Return the GapCorner of one point without copying every corner.
+
+        :param index: index of a point
+        :return: GapCorner for that point
+        """
+        return self._corners[index]
+
+    @property
+    def points(self) -> list[_Point]:
+        """Return a copy of the points.
+
+        :return: points as tuples
+        """
+        return list(self._points)
+
+    @property
+    def gaps(self) -> list[_Gaps]:
+        """Return a copy of the (gap_1, gap_2) pair for each point.
+
+        :return: gaps for each point
+        """
+        return list(self._gaps)
+
+    @property
+    def corners(self) -> list[GapCorner]:
+        """Return one GapCorner per point.
+
+        :return: a new list. Coincident adjacent points share a GapCorner.
+        """
+        return list(self._corners)
+
+    def move(self, index: int, point: _Vec2) -> None:
+        """Move one point.
+
+        :param index: index of the point to move
+        :param point: new position
+        :raise IndexError: if index is out of range
+        """
+        index = range(len(self))[index]
+        self._splice(index, index + 1, [tuple(point)], [self._gaps[index]])
+
+    def insert(
+        self, index: int, point: _Vec2, gaps: tuple[float, float] | None = None
+    ) -> None:
+        """Insert a point before index.
+
+        :param index: index of the new point
+        :param point: position of the new point
+        :param gaps: (gap_1, gap_2) for the new point. If None, gap_2 of the
+            previous point is used for both gaps, so a point inserted on an edge
+            keeps the offset of that edge.
+        """
+        if index < 0:
+            index = max(index + len(self), 0)
+        index = min(index, len(self))
+        if gaps is None:
+            gap = self._gaps[index - 1][1]
+            gaps = (gap, gap)
+        self._splice(index, index, [tuple(point)], [gaps])
+
+    def delete(self, index: int) -> None:
+        """Remove one point.
+
+        :param index: index of the point to remove
+        :raise IndexError: if index is out of range
+        """
+        index = range(len(self))[index]
+        self._splice(index, index + 1, [], [])
+
+    def set_gaps(self, index: int, gap_1: float, gap_2: float | None = None) -> None:
+        """Change the gaps of one point.
+
+        :param index: index of the point
+        :param gap_1: offset of the edge before the point
+        :param gap_2: optional offset of the edge after the point. Defaults to gap_1.
+        :raise IndexError: if index is out of range
+
+        Has no effect on the offset if the point is not the first point in its
+        run of coincident points, but the gaps are kept in case the point moves.
+        """
+        index = range(len(self))[index]
+        gap_2 = gap_1 if gap_2 is None else gap_2
+        self._splice(index, index + 1, [self._points[index]], [(gap_1, gap_2)])
+
+    def _count_breaks(self, points: Sequence[_Point]) -> int:
+        """Count the adjacent pairs of points that are not coincident.
+
+        :param points: any run of points
+        :return: number of times points[i] != points[i + 1]
+        """
+        return sum(a != b for a, b in it.pairwise(points))
+
+    def _get_num_unique(self) -> int:
+        """Return the number of unique corners.
+
+        :return: number of points after removing coincident adjacent points and
+            (for polygons) a closing point
+        """
+        if not self._points:
+            return 0
+        num_unique = self._num_breaks + 1
+        is_closed = self._points[0] == self._points[-1]
+        if self.poly_type == PolyType.POLYGON and is_closed and num_unique > 1:
+            num_unique -= 1
+        return num_unique
+
+    def _check_num_points(self) -> None:
+        """Raise a ValueError if there are too few unique points.
+
+        :raise ValueError: if there are not enough unique points
+        """
+        if self.poly_type == PolyType.POLYGON:
+            if self._get_num_unique() < MIN_PTS_FOR_POLYGON:
+                msg = "at least three unique points required for a polygon"
+                raise ValueError(msg)
+        elif self._get_num_unique() < MIN_PTS_FOR_POLYLINE:
+            msg = "at least two unique points required for a polyline"
+            raise ValueError(msg)
+
+    def _splice(
+        self, beg: int, end: int, points: list[_Point], gaps: list[_Gaps]
+    ) -> None:
+        """Replace points[beg:end] and recompute the corners around them.
+
+        :param beg: first index to replace
+        :param end: index after the last index to replace
+        :param points: new points
+        :param gaps: new gaps, one per new point
+        :raise ValueError: if the edit would leave too few unique points. The
+            session is unchanged.
+        """
+        old_points = self._points[beg:end]
+        old_gaps = self._gaps[beg:end]
+        old_corners = self._corners[beg:end]
+        old_breaks = self._count_breaks(self._points[max(beg - 1, 0) : end + 1])
+        self._points[beg:end] = points
+        self._gaps[beg:end] = gaps
+        self._corners[beg:end] = [self._corners[0]] * len(points)
+        new_breaks = self._count_breaks(
+            self._points[max(beg - 1, 0) : beg + len(points) + 1]
+        )
+        self._num_breaks += new_breaks - old_breaks
+        try:
+            self._check_num_points()
+        except ValueError:
+            self._points[beg : beg + len(points)] = old_points
+            self._gaps[beg : beg + len(points)] = old_gaps
+            self._corners[beg : beg + len(points)] = old_corners
+            self._num_breaks += old_breaks - new_breaks
+            raise
+        self._refresh(range(beg - 1, beg + len(points) + 1))
+
+    def _step(self, index: int, step: int) -> int | None:
+        """Return the index next to index.
+
+        :param index: index of a point
+        :param step: 1 for the next point, -1 for the previous point
+        :return: index of the next or previous point. Wraps around for polygons.
+            None past either end of a polyline.
+        """
+        index += step
+        if self.poly_type == PolyType.POLYGON:
+            return index % len(self)
+        if 0 <= index < len(self):
+            return index
+        return None
+
+    def _get_run(self, index: int) -> tuple[int, int]:
+        """Find the run of coincident adjacent points that includes index.
+
+        :param index: index of a point
+        :return: (first index, last index) of the run. For polygons, the first
+            index might be greater than the last if the run wraps around.
+        """
+        point = self._points[index]
+        beg = end = index
+        for _ in range(len(self) - 1):
+            prev = self._step(beg, -1)
+            if prev is None or self._points[prev] != point:
+                break
+            beg = prev
+        for _ in range(len(self) - 1):
+            next_ = self._step(end, 1)
+            if next_ is None or self._points[next_] != point:
+                break
+            end = next_
+        return beg, end
+
+    def _iter_run_indices(self, beg: int, end: int) -> Iterable[int]:
+        """Iterate over every index in a run.
+
+        :param beg: first index of the run
+        :param end: last index of the run
+        :return: every index from beg to end, wrapping around for polygons
+        """
+        if beg <= end:
+            return range(beg, end + 1)
+        return it.chain(range(beg, len(self)), range(end + 1))
+
+    def _get_run_corner(self, beg: int, end: int) -> GapCorner:
+        """Offset the corner of one run of coincident points.
+
+        :param beg: first index of the run
+        :param end: last index of the run
+        :return: a GapCorner for every point in the run
+        """
+        pnt_b = self._points[beg]
+        prev = self._step(beg, -1)
+        next_ = self._step(end, 1)
+        gap_1, gap_2 = self._gaps[0 if beg > end or beg == 0 else beg]
+        if prev is None and next_ is not None:  # first run of a polyline
+            pnt_c = self._points[next_]
+            pnt_a = vadd(pnt_b, vsub(pnt_b, pnt_c))
+            gap_1 = gap_2
+        elif next_ is None and prev is not None:  # last run of a polyline
+            pnt_a = self._points[prev]
+            pnt_c = vsub(pnt_b, vsub(pnt_a, pnt_b))
+            gap_2 = gap_1
+        elif prev is not None and next_ is not None:
+            pnt_a, pnt_c = self._points[prev], self._points[next_]
+        else:
+            msg = "at least two unique points required for a polyline"
+            raise ValueError(msg)
+        return gap_corner(pnt_a, pnt_b, pnt_c, gap_1, gap_2)
+
+    def _iter_runs(self) -> Iterable[tuple[int, int]]:
+        """Iterate over every run of coincident adjacent points.
+
+        :return: (first index, last index) of each run, starting with the run
+            that includes index 0
+        """
+        beg, end = self._get_run(0)
+        first = beg
+        while True:
+            yield beg, end
+            next_ = self._step(end, 1)
+            if next_ is None or next_ == first:
+                return
+            beg, end = self._get_run(next_)
+
+    def _set_run_corners(self, runs: Iterable[tuple[int, int]]) -> None:
+        """Recompute the corner of each run.
+
+        :param runs: (first index, last index) of each run to recompute
+        """
+        for beg, end in runs:
+            corner = self._get_run_corner(beg, end)
+            for index in self._iter_run_indices(beg, end):
+                self._corners[index] = corner
+
+    def _refresh(self, indices: Iterable[int]) -> None:
+        """Recompute the runs that include indices.
+
+        :param indices: the edited indices and the index on either side. Out of
+            range indices wrap around for polygons and are ignored for polylines.
+
+        A corner depends on its own run and the runs on either side. Every run
+        with an edited point next to it includes one of indices.
+        """
+        runs: set[tuple[int, int]] = set()
+        for index in indices:
+            if self.poly_type == PolyType.POLYGON:
+                runs.add(self._get_run(index % len(self)))
+            elif 0 <= index < len(self):
+                runs.add(self._get_run(index))
+        self._set_run_corners(runs)
@@ -0,0 +1,184 @@
+"""Opt-in timings and corner counts for the offset functions.
+
+Nothing is recorded unless a record_stats block is active. Otherwise each
+instrumented call costs one context variable lookup.
+
+Instrumented calls are offset_poly_per_vert (and every function built on it:
+offset_poly_per_edge, offset_polyline, offset_polygon, and their join
+variants), the PreparedPoly offset methods (and every offset_array function
+built on them), batch.offset_rings, and offset_many when it runs in this process.
+iter_offset_polyline is not counted, nor is work done in worker processes.
+
+~~~python
+with record_stats() as stats:
+    _ = offset_polygon(points, 1)
+print(stats)
+~~~
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import math
+import time
+from typing import TYPE_CHECKING, Literal
+
+from offset_poly.offset_corner import ABS_TOL
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    _Phase = Literal["prepare", "solve", "align"]
+
+# corners this close to straight or degenerate have ill-conditioned xsects
+NEAR_PARALLEL_TOL = 1e-3
+
+_PHASES: tuple[_Phase, ...] = ("prepare", "solve", "align")
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+class OffsetStats:
+    """Timings and corner counts accumulated over every call in a block.
+
+    :ivar calls: number of instrumented offset calls
+    :ivar seconds: seconds spent in each phase. "prepare" removes coincident
+        points and wraps or anchors the ends. "solve" offsets each unique
+        corner. "align" maps corners back to input points.
+    :ivar corners: number of unique corners offset
+    :ivar straight: corners with a straight angle
+    :ivar degenerate: corners where bc doubles back over ab
+    :ivar near_parallel: other corners within NEAR_PARALLEL_TOL of straight or
+        degenerate, where the xsect is ill-conditioned
+    :ivar nan: corners with a nan xsect
+
+    GapCorner computes xsect lazily, so list results count nan corners from
+    their angles (every degenerate corner, plus corners with nan input). Array
+    results count nan values in the computed xsect.
+    """
+
+    __slots__ = (
+        "calls",
+        "corners",
+        "degenerate",
+        "nan",
+        "near_parallel",
+        "seconds",
+        "straight",
+    )
+
+    def __init__(self) -> None:
+        """Start every count at zero."""
+        self.calls = 0
+        self.seconds = dict.fromkeys(_PHASES, 0.0)
+        self.corners = 0
+        self.straight = 0
+        self.degenerate = 0
+        self.near_parallel = 0
+        self.nan = 0
+
+    def __repr__(self) -> str:
+        """Show every count and timing."""
+        seconds = ", ".join(f"{k}={v:.6f}s" for k, v in self.seconds.items())
+        return (
+            f"OffsetStats(calls={self.calls}, {seconds}, corners={self.corners}, "
+            + f"straight={self.straight}, degenerate={self.degenerate}, "
+            + f"near_parallel={self.near_parallel}, nan={self.nan})"
+        )
+
+    @contextlib.contextmanager
+    def timer(self, phase: _Phase) -> Generator[None, None, None]:
+        """Add the time spent in a block to a phase.
+
+        :param phase: "prepare", "solve", or "align"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[phase] += time.perf_counter() - start
+
+    def add_corners(
+        self, corners: int, straight: int, degenerate: int, near_parallel: int, nan: int
+    ) -> None:
+        """Add the corner counts of one call.
+
+        :param corners: number of unique corners
+        :param straight: number of straight corners
+        :param degenerate: number of degenerate corners
+        :param near_parallel: number of near-parallel corners
+        :param nan: number of corners with a nan xsect
+        """
+        self.calls += 1
+        self.corners += corners
+        self.straight += straight
+        self.degenerate += degenerate
+        self.near_parallel += near_parallel
+        self.nan += nan
+
+    def add_angles(self, angles: Iterable[float]) -> None:
+        """Count corners from their signed angles, as GapCorner classifies them.
+
+        :param angles: the angle of each unique corner
+        """
+        corners = straight = degenerate = near_parallel = nan = 0
+        for angle in angles:
+            corners += 1
+            if math.isnan(angle):
+                nan += 1
+                continue
+            from_straight = abs(angle)
+            from_degenerate = abs(angle % math.tau - math.pi)
+            if from_degenerate <= ABS_TOL:
+                degenerate += 1
+                nan += 1
+            elif from_straight <= ABS_TOL:
+                straight += 1
+            elif min(from_straight, from_degenerate) <= NEAR_PARALLEL_TOL:
+                near_parallel += 1
+        self.add_corners(corners, straight, degenerate, near_parallel, nan)
+
+
+_ACTIVE: contextvars.ContextVar[OffsetStats | None] = contextvars.ContextVar(
+    "offset_poly_stats", default=None
+)
+
+
+def get_active_stats() -> OffsetStats | None:
+    """Return the OffsetStats of the innermost record_stats block, if any."""
+    return _ACTIVE.get()
+
+
+def time_phase(
+    stats: OffsetStats | None, phase: _Phase
+) -> contextlib.AbstractContextManager[None]:
+    """Time a block if stats are being recorded.
+
+    :param stats: the active OffsetStats or None
+    :param phase: "prepare", "solve", or "align"
+    :return: a context manager that adds to stats.seconds[phase], or a shared
+        do-nothing context manager if stats is None
+    """
+    if stats is None:
+        return _NULL_TIMER
+    return stats.timer(phase)
+
+
+@contextlib.contextmanager
+def record_stats() -> Generator[OffsetStats, None, None]:
+    """Record timings and corner counts for every offset call in a block.
+
+    :yield: an OffsetStats that is updated by every offset call in the block (in
+        this thread or async task). Nested blocks record only into the innermost
+        OffsetStats.
+    """
+    stats = OffsetStats()
+    token = _ACTIVE.set(stats)
+    try:
+        yield stats
+    finally:
+        _ACTIVE.reset(token)
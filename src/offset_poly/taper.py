@@ -0,0 +1,163 @@
+"""Offset a polyline or polygon by a distance that varies along its arc length.
+
+offset_poly_per_edge holds one gap along each edge, so a taper has to be built
+from many short edges with different gaps, and any two collinear edges with
+different gaps raise a ValueError. Here the offset is a function of arc length
+instead. It is evaluated once at each corner, in one vectorized pass over the
+cumulative edge lengths, and both edges at that corner are offset by the same
+gap, so collinear corners are never a problem. Between corners, the offset
+curve is a straight line from one xsect to the next.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from offset_poly.offset import PolyType
+from offset_poly.offset_array import PreparedPoly, get_float_dtype
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+    from offset_poly.offset_array import GapCornerArray
+
+    _FArray = npt.NDArray[np.floating[Any]]
+    _Taper = Callable[[_FArray], npt.ArrayLike] | npt.ArrayLike
+
+
+def subdivide_edges(
+    polyline: npt.ArrayLike,
+    max_step: float,
+    poly_type: PolyType,
+    *,
+    dtype: npt.DTypeLike = float,
+) -> _FArray:
+    """Split every edge into equal pieces no longer than max_step.
+
+    :param polyline: (n, 2) array of points
+    :param max_step: maximum length of each piece. Must be greater than 0.
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE. A polygon's closing
+        edge (from the last point back to the first) is split, too.
+    :param dtype: float32 or float64
+    :return: (m, 2) array of points. Every input point is kept, in order, with
+        new points between them.
+    :raise ValueError: if max_step is not greater than 0
+    """
+    if max_step <= 0:
+        msg = f"max_step must be greater than 0, not {max_step}"
+        raise ValueError(msg)
+    points: _FArray = np.reshape(
+        np.asarray(polyline, dtype=get_float_dtype(dtype)), (-1, 2)
+    )
+    is_polygon = poly_type == PolyType.POLYGON
+    ends = np.roll(points, -1, axis=0) if is_polygon else points[1:]
+    starts = points[: len(ends)]
+    vecs = ends - starts
+    lengths: _FArray = np.hypot(vecs[:, 0], vecs[:, 1])
+    num_steps = np.ceil(lengths / max_step).astype(np.intp)
+    num_steps = np.maximum(num_steps, 1)
+    edge = np.repeat(np.arange(len(vecs)), num_steps)
+    first = np.cumsum(num_steps) - num_steps
+    time = (np.arange(len(edge)) - first[edge]) / num_steps[edge]
+    pieces = starts[edge] + vecs[edge] * time[:, np.newaxis].astype(points.dtype)
+    if is_polygon:
+        return pieces
+    return np.concatenate((pieces, points[-1:]))
+
+
+def get_arc_lengths(prepared: PreparedPoly) -> tuple[_FArray, float]:
+    """Measure the arc length from the first corner to each corner.
+
+    :param prepared: a PreparedPoly
+    :return: ((m,) arc length at each unique corner, total length). The total
+        length of a polygon includes the closing edge back to the first corner.
+    """
+    edge_vecs = prepared.edge_vecs
+    lengths: _FArray = np.hypot(edge_vecs[:, 0], edge_vecs[:, 1])
+    arc_lengths: _FArray = np.zeros(prepared.num_corners, dtype=prepared.dtype)
+    _ = np.cumsum(lengths[1:-1], out=arc_lengths[1:])
+    total = float(arc_lengths[-1])
+    if prepared.poly_type == PolyType.POLYGON:
+        total += float(lengths[-1])
+    return arc_lengths, total
+
+
+def _evaluate_taper(offsets: _Taper, arc_lengths: _FArray) -> _FArray:
+    """Evaluate the offset at each arc length.
+
+    :param offsets: a callable from an (m,) array of arc lengths to m offsets,
+        or a (k, 2) array of (arc length, offset) samples sorted by arc length
+    :param arc_lengths: (m,) array of arc lengths
+    :return: (m,) array of offsets in the dtype of arc_lengths. Samples are
+        interpolated linearly and held constant past either end.
+    :raise ValueError: if samples are not a (k, 2) array sorted by arc length
+    """
+    if callable(offsets):
+        gaps = np.asarray(offsets(arc_lengths), dtype=arc_lengths.dtype)
+        return np.broadcast_to(gaps, arc_lengths.shape)
+    samples = np.asarray(offsets, dtype=float)
+    if samples.ndim != 2 or samples.shape[1] != 2 or len(samples) == 0:  # noqa: PLR2004
+        msg = (
+            "offsets must be a callable or a (k, 2) array of (arc length, offset) "
+            + f"samples, not an array of shape {samples.shape}"
+        )
+        raise ValueError(msg)
+    if np.any(np.diff(samples[:, 0]) < 0):
+        msg = "offset samples must be sorted by arc length"
+        raise ValueError(msg)
+    gaps = np.interp(arc_lengths, samples[:, 0], samples[:, 1])
+    return gaps.astype(arc_lengths.dtype)
+
+
+def offset_tapered(  # noqa: PLR0913
+    polyline: npt.ArrayLike,
+    offsets: _Taper,
+    poly_type: PolyType,
+    *,
+    relative: bool = False,
+    max_step: float | None = None,
+    tolerance: float = 0,
+    dtype: npt.DTypeLike = float,
+) -> GapCornerArray:
+    """Offset each corner (to the left) by a function of its arc length.
+
+    :param polyline: (n, 2) array of points
+    :param offsets: a callable from an (m,) array of arc lengths to m offsets
+        (or one offset for every corner), or a (k, 2) array of (arc length,
+        offset) samples sorted by arc length. Samples are interpolated linearly
+        and held constant past either end.
+    :param poly_type: PolyType.POLYGON or PolyType.POLYLINE
+    :param relative: if True, arc lengths are divided by the total length, so
+        offsets are given over [0, 1] from the first point to the end of the
+        polyline (or back around to the first point of a polygon).
+    :param max_step: optional maximum edge length. If given, edges are split
+        (see subdivide_edges) so the taper is sampled at least this often.
+    :param tolerance: optional maximum distance between coincident adjacent
+        points. See offset.offset_poly_per_vert.
+    :param dtype: float32 or float64. See PreparedPoly.
+    :return: one GapCornerArray row per input point, or per point after
+        subdividing if max_step is given. Both gaps at each corner are the
+        offset at that corner.
+    :raise ValueError: if fewer than three points are given for a polygon
+    :raise ValueError: if fewer than two points are given for a polyline
+    :raise ValueError: if offset samples are not a (k, 2) array sorted by arc
+        length
+    :raise ValueError: if max_step is not greater than 0
+
+    Arc length is measured along unique points, from 0 at the first point.
+    """
+    if max_step is not None:
+        polyline = subdivide_edges(polyline, max_step, poly_type, dtype=dtype)
+    prepared = PreparedPoly(polyline, poly_type, tolerance=tolerance, dtype=dtype)
+    arc_lengths, total = get_arc_lengths(prepared)
+    if relative:
+        arc_lengths /= total
+    gaps = _evaluate_taper(offsets, arc_lengths)
+    return prepared.offset_per_vert(np.stack((gaps, gaps), axis=1))
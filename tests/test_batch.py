@@ -0,0 +1,138 @@
+"""Test offsetting many polygons across processes.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import random
+from collections.abc import Sequence
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from offset_poly import batch  # noqa: E402
+from offset_poly.batch import offset_many, offset_rings, split_rings  # noqa: E402
+from offset_poly.offset import PolyType, offset_poly_per_edge  # noqa: E402
+from offset_poly.offset_array import GapCornerArray  # noqa: E402
+
+
+def _random_polys(num_polys: int) -> list[list[tuple[float, float]]]:
+    """Return random polygons with 3 to 10 points."""
+    return [
+        [
+            (random.uniform(-5, 5), random.uniform(-5, 5))
+            for _ in range(random.randint(3, 10))
+        ]
+        for _ in range(num_polys)
+    ]
+
+
+def _assert_matches_scalar(
+    polys: Sequence[Sequence[tuple[float, float]]],
+    offsets: Sequence[float | Sequence[float]],
+    poly_type: PolyType,
+    results: Sequence[GapCornerArray],
+) -> None:
+    assert len(results) == len(polys)
+    for poly, offset, result in zip(polys, offsets, results, strict=True):
+        corners = offset_poly_per_edge(poly, np.atleast_1d(offset).tolist(), poly_type)
+        np.testing.assert_allclose(result.xsect, [c.xsect for c in corners], atol=1e-9)
+        np.testing.assert_allclose(result.cpts, [c.cpts for c in corners], atol=1e-9)
+
+
+class TestOffsetMany:
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    def test_serial(self, poly_type: PolyType) -> None:
+        polys = _random_polys(20)
+        results = offset_many(polys, 1, poly_type)
+        _assert_matches_scalar(polys, [1] * 20, poly_type, results)
+
+    def test_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Results come back from worker processes in input order."""
+        monkeypatch.setattr(batch, "_MIN_POINTS_FOR_POOL", 0)
+        polys = _random_polys(50)
+        offsets = [random.uniform(-1, 1) for _ in polys]
+        results = offset_many(polys, offsets, PolyType.POLYGON, workers=2)
+        _assert_matches_scalar(polys, offsets, PolyType.POLYGON, results)
+        assert results[3][0].pnt_b == tuple(polys[3][0])
+
+    def test_per_edge_offsets(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(batch, "_MIN_POINTS_FOR_POOL", 0)
+        polys = [[(0, 0), (5, 0), (5, 5), (0, 5)]] * 3
+        offsets = [[-2, -1, -1, -1], 1, [-1, -1, -1, -2]]
+        results = offset_many(polys, offsets, PolyType.POLYGON, workers=2)
+        _assert_matches_scalar(polys, offsets, PolyType.POLYGON, results)
+
+    @pytest.mark.parametrize(
+        "offset", [np.float64(0.5), np.float32(0.5), np.int64(1), np.array(0.5)]
+    )
+    def test_numpy_scalar_offset(self, offset: float) -> None:
+        polys = _random_polys(5)
+        results = offset_many(polys, offset, PolyType.POLYGON, workers=1)
+        _assert_matches_scalar(polys, [float(offset)] * 5, PolyType.POLYGON, results)
+
+    def test_offsets_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="expected 3 offsets"):
+            _ = offset_many(_random_polys(3), [1, 2], PolyType.POLYGON)
+
+    def test_empty(self) -> None:
+        assert offset_many([], 1, PolyType.POLYGON) == []
+
+    def test_float32(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(batch, "_MIN_POINTS_FOR_POOL", 0)
+        polys = [[(0, 0), (i, 0), (i, i), (0, i)] for i in range(1, 11)]
+        results = offset_many(polys, 0.5, PolyType.POLYGON, workers=2, dtype="float32")
+        assert all(x.xsect.dtype == np.float32 for x in results)
+        expect = offset_many(polys, 0.5, PolyType.POLYGON, workers=1)
+        for result, corners in zip(results, expect, strict=True):
+            np.testing.assert_allclose(result.xsect, corners.xsect, atol=1e-5)
+
+
+class TestOffsetRings:
+    def test_mixed_rings(self) -> None:
+        rings = [
+            [(0, 0), (5, 0), (5, 5), (0, 5), (0, 0)],
+            [(0, 0), (0, 0), (5, 0)],
+            [(1, 1), (2, 1), (2, 1), (2, 2), (1, 1), (1, 1)],
+            [(0, 0), (5, 0), (5, 5), (0, 5), (0, 0)],
+        ]
+        poly_types = [PolyType.POLYGON, PolyType.POLYLINE, PolyType.POLYGON]
+        poly_types.append(PolyType.POLYLINE)
+        offsets = [1, -1, 0.5, 2]
+        points = np.concatenate(rings)
+        bounds = np.cumsum([0, *map(len, rings)])
+        result = offset_rings(points, bounds, offsets, poly_types)
+        assert len(result) == len(points)
+        for ring, poly_type, offset, ring_result in zip(
+            rings, poly_types, offsets, split_rings(result, bounds), strict=True
+        ):
+            _assert_matches_scalar([ring], [offset], poly_type, [ring_result])
+            corners = offset_poly_per_edge(ring, [offset], poly_type)
+            assert [r.pnt_a for r in ring_result] == [c.pnt_a for c in corners]
+            assert [r.pnt_c for r in ring_result] == [c.pnt_c for c in corners]
+
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    def test_per_edge_offsets(self, poly_type: PolyType) -> None:
+        rings = _random_polys(30)
+        offsets = [
+            [random.uniform(-1, 1) for _ in range(random.randint(1, 12))] for _ in rings
+        ]
+        points = np.concatenate(rings)
+        bounds = np.cumsum([0, *map(len, rings)])
+        offset_bounds = np.cumsum([0, *map(len, offsets)])
+        result = offset_rings(
+            points, bounds, np.concatenate(offsets), poly_type, offset_bounds
+        )
+        for ring, offset, ring_result in zip(
+            rings, offsets, split_rings(result, bounds), strict=True
+        ):
+            corners = offset_poly_per_edge(ring, offset, poly_type)
+            np.testing.assert_allclose(
+                ring_result.xsect, [c.xsect for c in corners], atol=1e-9
+            )
+
+    def test_too_few_points(self) -> None:
+        points = [(0, 0), (5, 0), (5, 5), (0, 0), (0, 0), (1, 1)]
+        with pytest.raises(ValueError, match="ring 1"):
+            _ = offset_rings(points, [0, 3, 6], 1, PolyType.POLYGON)
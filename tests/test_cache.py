@@ -0,0 +1,182 @@
+"""Test the offset results cache.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import itertools as it
+import math
+import sys
+from collections.abc import Callable, Iterable
+
+import pytest
+
+from offset_poly.cache import OffsetCache
+from offset_poly.offset import PolyType, offset_poly_per_edge, offset_polygon
+
+SQUARE = [(0, 0), (1, 0), (1, 1), (0, 1)]
+GLYPH = [(0, 0), (3, 0), (3, 1), (1, 1), (1, 1), (1, 3), (0, 3)]
+
+
+def _move(
+    points: Iterable[tuple[float, float]], dx: float, dy: float
+) -> list[tuple[float, float]]:
+    return [(x + dx, y + dy) for x, y in points]
+
+
+# each call misses after offset_polygon(GLYPH, 0.1)
+_MISSES: list[Callable[[OffsetCache], object]] = [
+    lambda c: c.offset_polygon(GLYPH, 0.2),
+    lambda c: c.offset_polyline(GLYPH, 0.1),
+    lambda c: c.offset_polygon(GLYPH, 0.1, tolerance=0.5),
+    lambda c: c.offset_polygon(_move(GLYPH, 1, 0), 0.1),
+]
+
+
+class TestOffsetCache:
+    def test_hit(self) -> None:
+        cache = OffsetCache()
+        first = cache.offset_polygon(GLYPH, 0.1)
+        second = cache.offset_polygon(GLYPH, 0.1)
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+        assert second is not first
+        expect = offset_polygon(GLYPH, 0.1)
+        assert [x.xsect for x in second] == [x.xsect for x in expect]
+        assert [x.cpts for x in second] == [x.cpts for x in expect]
+
+    def test_repeated_corners_shared(self) -> None:
+        """Coincident points still share one GapCorner."""
+        cache = OffsetCache(translation_invariant=True)
+        _ = cache.offset_polygon(GLYPH, 0.1)
+        corners = cache.offset_polygon(_move(GLYPH, 2, 2), 0.1)
+        assert corners[3] is corners[4]
+
+    @pytest.mark.parametrize("call", _MISSES)
+    def test_miss(self, call: Callable[[OffsetCache], object]) -> None:
+        cache = OffsetCache()
+        _ = cache.offset_polygon(GLYPH, 0.1)
+        _ = call(cache)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_per_edge(self) -> None:
+        cache = OffsetCache()
+        offsets = [0.1, 0.2, 0.1, 0.2]
+        _ = cache.offset_poly_per_edge(SQUARE, offsets, PolyType.POLYGON)
+        corners = cache.offset_poly_per_edge(
+            SQUARE, it.cycle(offsets), PolyType.POLYGON
+        )
+        assert cache.hits == 1
+        expect = offset_poly_per_edge(SQUARE, offsets, PolyType.POLYGON)
+        assert [x.xsect for x in corners] == [x.xsect for x in expect]
+
+    def test_translation_invariant(self) -> None:
+        cache = OffsetCache(translation_invariant=True)
+        _ = cache.offset_polygon(GLYPH, 0.1)
+        moved = _move(GLYPH, 100.5, -3.25)
+        corners = cache.offset_polygon(moved, 0.1)
+        assert (cache.hits, cache.misses) == (1, 1)
+        for have, want in zip(corners, offset_polygon(moved, 0.1), strict=True):
+            assert have.pnt_b == want.pnt_b
+            assert all(map(math.isclose, have.xsect, want.xsect))
+            assert all(map(math.isclose, have.cpts[0], want.cpts[0]))
+
+    def test_evict_least_recently_used(self) -> None:
+        cache = OffsetCache()
+        _ = cache.offset_polygon(SQUARE, 1)
+        cache.max_bytes = cache.nbytes * 2
+        _ = cache.offset_polygon(SQUARE, 2)
+        _ = cache.offset_polygon(SQUARE, 1)
+        _ = cache.offset_polygon(SQUARE, 3)
+        assert (len(cache), cache.evictions) == (2, 1)
+        assert cache.nbytes <= cache.max_bytes
+        _ = cache.offset_polygon(SQUARE, 1)
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_nbytes_measured_from_corners(self) -> None:
+        """Each unique corner counts at least its instance and its xsect."""
+        cache = OffsetCache()
+        corners = offset_polygon(GLYPH, 0.1)
+        unique = {id(x): x for x in corners}.values()
+        _ = cache.offset_polygon(GLYPH, 0.1)
+        assert len(unique) == len(GLYPH) - 1
+        floor = sum(sys.getsizeof(x) + sys.getsizeof(x.xsect) for x in unique)
+        assert cache.nbytes > floor
+
+    def test_too_large_to_hold(self) -> None:
+        cache = OffsetCache(0)
+        _ = cache.offset_polygon(SQUARE, 1)
+        _ = cache.offset_polygon(SQUARE, 1)
+        assert (len(cache), cache.misses, cache.nbytes) == (0, 2, 0)
+
+    def test_clear(self) -> None:
+        cache = OffsetCache()
+        _ = cache.offset_polygon(SQUARE, 1)
+        cache.clear()
+        assert (len(cache), cache.nbytes, cache.misses) == (0, 0, 1)
+
+    def test_negative_max_bytes(self) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            _ = OffsetCache(-1)
+
+    def test_errors_not_cached(self) -> None:
+        cache = OffsetCache()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="three unique points"):
+                _ = cache.offset_polygon([(0, 0), (1, 0)], 1)
+        assert (len(cache), cache.misses) == (0, 2)
+
+
+class TestOffsetCacheArray:
+    def test_hit_is_read_only(self) -> None:
+        np = pytest.importorskip("numpy")
+        cache = OffsetCache()
+        _ = cache.offset_polygon(np.array(GLYPH, dtype=float), 0.1, as_array=True)
+        corners = cache.offset_polygon(
+            np.array(GLYPH, dtype=np.float32), 0.1, as_array=True
+        )
+        assert cache.hits == 1
+        assert not isinstance(corners, list)
+        assert not corners.xsect.flags.writeable
+        expect = offset_polygon(np.array(GLYPH, dtype=float), 0.1, as_array=True)
+        np.testing.assert_array_equal(corners.xsect, expect.xsect)
+
+    def test_list_and_array_kept_apart(self) -> None:
+        _ = pytest.importorskip("numpy")
+        cache = OffsetCache()
+        _ = cache.offset_polygon(GLYPH, 0.1)
+        corners = cache.offset_polygon(GLYPH, 0.1, as_array=True)
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert not isinstance(corners, list)
+
+    def test_buffer_returns_list_by_default(self) -> None:
+        np = pytest.importorskip("numpy")
+        cache = OffsetCache()
+        _ = cache.offset_polygon(GLYPH, 0.1)
+        corners = cache.offset_polygon(np.array(GLYPH, dtype=float), 0.1)
+        assert cache.hits == 1
+        assert isinstance(corners, list)
+
+    def test_translation_invariant(self) -> None:
+        np = pytest.importorskip("numpy")
+        cache = OffsetCache(translation_invariant=True)
+        _ = cache.offset_polygon(np.array(GLYPH, dtype=float), 0.1, as_array=True)
+        moved = np.array(GLYPH, dtype=float) + np.array([7.5, -2])
+        corners = cache.offset_polygon(moved, 0.1, as_array=True)
+        assert cache.hits == 1
+        assert not isinstance(corners, list)
+        assert corners.xsect.flags.writeable
+        expect = offset_polygon(moved, 0.1, as_array=True)
+        np.testing.assert_allclose(corners.xsect, expect.xsect)
+        np.testing.assert_allclose(corners.cpts, expect.cpts)
+        np.testing.assert_allclose(corners.windows, expect.windows)
+
+    def test_per_edge_buffer_offsets(self) -> None:
+        np = pytest.importorskip("numpy")
+        cache = OffsetCache()
+        points = np.array(SQUARE, dtype=float)
+        offsets = np.array([0.1, 0.2, 0.1, 0.2])
+        for edge_offsets in (offsets, list(offsets), offsets[::-1]):
+            _ = cache.offset_poly_per_edge(
+                points, edge_offsets, PolyType.POLYGON, as_array=True
+            )
+        assert (cache.hits, cache.misses) == (1, 2)
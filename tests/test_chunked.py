@@ -0,0 +1,113 @@
+"""Test offsetting rings one chunk at a time.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from offset_poly.batch import offset_rings  # noqa: E402
+from offset_poly.chunked import offset_rings_chunked, offset_xy_file  # noqa: E402
+from offset_poly.offset import PolyType  # noqa: E402
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy.typing as npt
+
+    _FArray = npt.NDArray[Any]
+
+
+def _random_ring(num_points: int) -> list[tuple[int, int]]:
+    """Return a ring on a small grid with repeated and (sometimes) closing points."""
+    ring = [(random.randint(0, 3), random.randint(0, 3)) for _ in range(num_points)]
+    if random.choice((True, False)):
+        ring += [ring[0], ring[0]]
+    return ring
+
+
+class TestOffsetRingsChunked:
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    @pytest.mark.parametrize("runs", range(20))
+    def test_matches_offset_rings(self, runs: int, poly_type: PolyType) -> None:
+        del runs
+        rings = [_random_ring(random.randint(3, 30)) for _ in range(6)]
+        points = np.concatenate(rings).astype(float)
+        bounds = np.cumsum([0, *map(len, rings)])
+        offsets = [random.uniform(-1, 1) for _ in rings]
+        try:
+            expect = offset_rings(points, bounds, offsets, poly_type).xsect
+        except ValueError:
+            return
+        out = np.empty_like(points)
+        chunk_points = random.randint(2, 40)
+        _ = offset_rings_chunked(
+            points, bounds, offsets, poly_type, out, chunk_points=chunk_points
+        )
+        np.testing.assert_allclose(out, expect, atol=1e-9)
+
+    def test_large_closed_polygon(self) -> None:
+        circle = [
+            (math.cos(i * math.tau / 1000), math.sin(i * math.tau / 1000))
+            for i in range(1000)
+        ]
+        points = np.array([*circle, circle[0]])
+        out = np.empty_like(points)
+        _ = offset_rings_chunked(
+            points, [0, len(points)], 0.1, PolyType.POLYGON, out, chunk_points=64
+        )
+        expect = offset_rings(points, [0, len(points)], 0.1, PolyType.POLYGON)
+        np.testing.assert_allclose(out, expect.xsect, atol=1e-12)
+
+    def test_too_few_points(self) -> None:
+        points = np.array([(0, 0), (1, 0), (1, 0), (1, 0)], dtype=float)
+        with pytest.raises(ValueError, match="three unique points"):
+            _ = offset_rings_chunked(
+                points,
+                [0, 4],
+                1,
+                PolyType.POLYGON,
+                np.empty_like(points),
+                chunk_points=2,
+            )
+
+    def test_bad_bounds(self) -> None:
+        points = np.zeros((4, 2))
+        with pytest.raises(ValueError, match="ring_bounds must start at 0"):
+            _ = offset_rings_chunked(points, [0, 3], 1, PolyType.POLYGON, points)
+
+
+class TestOffsetXyFile:
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_round_trip(self, tmp_path: Path, dtype: npt.DTypeLike) -> None:
+        rings = [
+            [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)],
+            [(0, 0), (1, 0), (1, 1), (2, 1), (2, 2)],
+        ]
+        points = np.concatenate(rings).astype(dtype)
+        bounds = np.array([0, 5, 10], dtype=np.int64)
+        points.tofile(tmp_path / "points.bin")
+        bounds.tofile(tmp_path / "bounds.bin")
+        out = offset_xy_file(
+            tmp_path / "points.bin",
+            tmp_path / "bounds.bin",
+            tmp_path / "out.bin",
+            [1, 0.5],
+            PolyType.POLYGON,
+            dtype=dtype,
+            chunk_points=3,
+        )
+        expect = offset_rings(points, bounds, [1, 0.5], PolyType.POLYGON).xsect
+        written: _FArray = np.reshape(
+            np.fromfile(tmp_path / "out.bin", dtype=dtype), (-1, 2)
+        )
+        np.testing.assert_allclose(written, expect, atol=1e-6)
+        np.testing.assert_array_equal(out, written)
@@ -0,0 +1,252 @@
+"""Test the command-line offsetter.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import json
+import subprocess
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from offset_poly.cli import main
+from offset_poly.offset import PolyType, offset_poly_per_edge, offset_polygon
+from offset_poly.offset_corner import GapCorner
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)]
+WKT = "POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 1 2, 2 2, 2 1, 1 1))\n"
+
+
+def _xsects(corners: Iterable[GapCorner]) -> list[list[float]]:
+    return [list(x.xsect) for x in corners]
+
+
+class TestMain:
+    def test_wkt(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        _ = (tmp_path / "in.wkt").write_text(WKT + "LINESTRING (0 0, 5 0, 5 5)\n")
+        assert main([str(tmp_path / "in.wkt"), "-d", "0.5", "-w", "1"]) == 0
+        out, err = capsys.readouterr()
+        assert out.splitlines() == [
+            "POLYGON ((0.5 0.5, 3.5 0.5, 3.5 3.5, 0.5 3.5, 0.5 0.5), "
+            + "(0.5 0.5, 0.5 2.5, 2.5 2.5, 2.5 0.5, 0.5 0.5))",
+            "LINESTRING (0.0 0.5, 4.5 0.5, 4.5 5.0)",
+        ]
+        assert "3 rings, 13 points" in err
+
+    def test_workers_keep_order(self, tmp_path: Path) -> None:
+        lines = [f"POLYGON ((0 0, {i} 0, {i} {i}, 0 {i}, 0 0))" for i in range(2, 40)]
+        _ = (tmp_path / "in.wkt").write_text("\n".join(lines))
+        args = ["-d", "1", "-q", "-c", "3", "-o"]
+        assert (
+            main([str(tmp_path / "in.wkt"), *args, str(tmp_path / "a.wkt"), "-w", "1"])
+            == 0
+        )
+        assert (
+            main([str(tmp_path / "in.wkt"), *args, str(tmp_path / "b.wkt"), "-w", "2"])
+            == 0
+        )
+        assert (tmp_path / "a.wkt").read_text() == (tmp_path / "b.wkt").read_text()
+
+    def test_geojson(self, tmp_path: Path) -> None:
+        feature = {
+            "type": "Feature",
+            "properties": {"id": 1},
+            "geometry": {"type": "Polygon", "coordinates": [SQUARE]},
+        }
+        lines = json.dumps(feature) + "\n"
+        _ = (tmp_path / "in.geojsonl").write_text(lines)
+        output = tmp_path / "out.geojsonl"
+        assert (
+            main(
+                [str(tmp_path / "in.geojsonl"), "-d", "1", "-w", "1", "-o", str(output)]
+            )
+            == 0
+        )
+        result = cast("dict[str, Any]", json.loads(output.read_text()))
+        assert result["properties"] == {"id": 1}
+        assert result["geometry"]["coordinates"] == [_xsects(offset_polygon(SQUARE, 1))]
+
+    def test_csv_per_edge_offsets(self, tmp_path: Path) -> None:
+        _ = (tmp_path / "in.csv").write_text(
+            "ring,x,y\na,0,0\na,4,0\na,4,4\nb,0,0\nb,1,0\n"
+        )
+        output = tmp_path / "out.csv"
+        args = [str(tmp_path / "in.csv"), "-d", "1,2", "-t", "polyline", "-w", "1"]
+        assert main([*args, "-o", str(output)]) == 0
+        rows = [x.split(",") for x in output.read_text().splitlines()[1:]]
+        expect = offset_poly_per_edge(
+            [(0, 0), (4, 0), (4, 4)], [1, 2, 1], PolyType.POLYLINE
+        )
+        assert [[float(x), float(y)] for _, x, y in rows[:3]] == _xsects(expect)
+        assert [ring for ring, _, _ in rows] == ["a", "a", "a", "b", "b"]
+
+    def test_csv_short_row(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        _ = (tmp_path / "in.csv").write_text("ring,x,y\na,0,0\na,4\n")
+        assert main([str(tmp_path / "in.csv"), "-d", "1", "-w", "1"]) == 1
+        assert "line 3" in capsys.readouterr().err
+
+    def test_npy(self, tmp_path: Path) -> None:
+        np = pytest.importorskip("numpy")
+        rings = np.array([SQUARE[:4], [(0, 0), (2, 0), (2, 2), (0, 2)]], dtype=float)
+        np.save(tmp_path / "in.npy", rings)
+        output = tmp_path / "out.npy"
+        assert (
+            main([str(tmp_path / "in.npy"), "-d", "0.5", "-w", "1", "-o", str(output)])
+            == 0
+        )
+        result = np.load(output)
+        assert result.shape == rings.shape
+        assert result[0].tolist() == _xsects(offset_polygon(SQUARE[:4], 0.5))
+
+    def test_npy_chunks_per_edge_offsets(self, tmp_path: Path) -> None:
+        """Chunks of rings on two workers match offset_poly_per_edge."""
+        np = pytest.importorskip("numpy")
+        rings = np.random.default_rng(0).random((7, 5, 2))
+        np.save(tmp_path / "in.npy", rings)
+        output = tmp_path / "out.npy"
+        args = [str(tmp_path / "in.npy"), "-d", "0.1,0.2", "-t", "polyline"]
+        assert main([*args, "-c", "2", "-w", "2", "-q", "-o", str(output)]) == 0
+        result = np.load(output)
+        for ring, xsect in zip(rings, result, strict=True):
+            expect = offset_poly_per_edge(
+                ring.tolist(), [0.1, 0.2, 0.1, 0.2, 0.1], PolyType.POLYLINE
+            )
+            np.testing.assert_allclose(xsect, _xsects(expect))
+
+    def test_xy(self, tmp_path: Path) -> None:
+        np = pytest.importorskip("numpy")
+        np.array(SQUARE, dtype=float).tofile(tmp_path / "in.xy")
+        np.array([0, 5], dtype=np.int64).tofile(tmp_path / "in.rings")
+        args = [str(tmp_path / "in.xy"), "--ring-bounds", str(tmp_path / "in.rings")]
+        assert main([*args, "-d", "1", "-o", str(tmp_path / "out.xy")]) == 0
+        result = np.fromfile(tmp_path / "out.xy").reshape(-1, 2)
+        assert result.tolist() == _xsects(offset_polygon(SQUARE, 1))
+
+    def test_xy_workers(self, tmp_path: Path) -> None:
+        """Rings are split between workers and written in place."""
+        np = pytest.importorskip("numpy")
+        from offset_poly.chunked import offset_xy_file  # noqa: PLC0415
+
+        rng = np.random.default_rng(0)
+        sizes = rng.integers(3, 40, 50)
+        rng.random((int(sizes.sum()), 2)).tofile(tmp_path / "in.xy")
+        np.append(0, np.cumsum(sizes)).tofile(tmp_path / "in.rings")
+        args = [str(tmp_path / "in.xy"), "--ring-bounds", str(tmp_path / "in.rings")]
+        args += ["-d", "0.01", "-t", "polyline", "-q", "-o"]
+        assert main([*args, str(tmp_path / "out.xy"), "-w", "3"]) == 0
+        expect = offset_xy_file(
+            tmp_path / "in.xy",
+            tmp_path / "in.rings",
+            tmp_path / "expect.xy",
+            0.01,
+            PolyType.POLYLINE,
+        )
+        np.testing.assert_array_equal(np.fromfile(tmp_path / "out.xy"), expect.ravel())
+
+    def test_xy_bad_ring_bounds(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        np = pytest.importorskip("numpy")
+        np.array(SQUARE, dtype=float).tofile(tmp_path / "in.xy")
+        np.array([0, 4], dtype=np.int64).tofile(tmp_path / "in.rings")
+        args = [str(tmp_path / "in.xy"), "--ring-bounds", str(tmp_path / "in.rings")]
+        assert main([*args, "-d", "1", "-o", str(tmp_path / "out.xy")]) == 1
+        assert "ring_bounds" in capsys.readouterr().err
+
+    def test_degenerate_corners_dropped(self, tmp_path: Path) -> None:
+        """Text output cannot hold nan, so U-turn corners are dropped."""
+        _ = (tmp_path / "in.wkt").write_text(
+            "POLYGON ((0 0, 2 0, 2 2, 1 2, 1 0.5, 1 2, 0 2, 0 0))\n"
+        )
+        output = tmp_path / "out.wkt"
+        args = [str(tmp_path / "in.wkt"), "-d", "0.25", "-w", "1", "-q"]
+        assert main([*args, "-o", str(output)]) == 0
+        assert output.read_text() == (
+            "POLYGON ((0.25 0.25, 1.75 0.25, 1.75 1.75, 1.25 1.75, "
+            + "0.75 1.75, 0.25 1.75, 0.25 0.25))\n"
+        )
+
+    def test_closed_linestring_stays_open(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A closed polyline's ends are offset separately, not joined."""
+        _ = (tmp_path / "in.wkt").write_text("LINESTRING (0 0, 4 0, 4 4, 0 4, 0 0)\n")
+        assert main([str(tmp_path / "in.wkt"), "-d", "1", "-w", "1", "-q"]) == 0
+        assert capsys.readouterr().out == (
+            "LINESTRING (0.0 1.0, 3.0 1.0, 3.0 3.0, 1.0 3.0, 1.0 0.0)\n"
+        )
+
+    def test_degenerate_corners_geojson(self, tmp_path: Path) -> None:
+        feature = {
+            "type": "Feature",
+            "properties": {},
+            "geometry": {"type": "LineString", "coordinates": [[0, 0], [2, 0], [1, 0]]},
+        }
+        _ = (tmp_path / "in.geojsonl").write_text(json.dumps(feature) + "\n")
+        output = tmp_path / "out.geojsonl"
+        args = [str(tmp_path / "in.geojsonl"), "-d", "1", "-w", "1", "-q"]
+        assert main([*args, "-o", str(output)]) == 0
+
+        def reject(name: str) -> None:
+            raise AssertionError(name)
+
+        result = cast(
+            "dict[str, Any]", json.loads(output.read_text(), parse_constant=reject)
+        )
+        assert result["geometry"]["coordinates"] == [[0, 1], [1, -1]]
+
+    def test_collapsed_rings_dropped(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Geometries with a ring that offsets to nothing are dropped with a warning."""
+        _ = (tmp_path / "in.wkt").write_text(
+            "POLYGON ((0 0, 1 0, 2 0, 0 0))\n"
+            + "POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 2 1, 1 1))\n"
+            + "POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0))\n"
+        )
+        assert main([str(tmp_path / "in.wkt"), "-d", "1", "-w", "1", "-q"]) == 0
+        out, err = capsys.readouterr()
+        assert out == "POLYGON ((1.0 1.0, 3.0 1.0, 3.0 3.0, 1.0 3.0, 1.0 1.0))\n"
+        assert "dropped record 1" in err
+        assert "dropped record 2" in err
+
+    def test_collapsed_rings_dropped_geojson(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        geometry = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 0]]]}
+        _ = (tmp_path / "in.geojsonl").write_text(json.dumps(geometry) + "\n")
+        args = [str(tmp_path / "in.geojsonl"), "-d", "1", "-w", "1", "-q"]
+        assert main(args) == 0
+        out, err = capsys.readouterr()
+        assert not out
+        assert "dropped record 1" in err
+
+    def test_bad_input(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        _ = (tmp_path / "in.wkt").write_text("POINT (1 2)\n")
+        assert main([str(tmp_path / "in.wkt"), "-d", "1", "-w", "1"]) == 1
+        assert "unsupported" in capsys.readouterr().err
+
+    def test_unknown_format(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        assert main([str(tmp_path / "in.txt"), "-d", "1"]) == 1
+        assert "--format" in capsys.readouterr().err
+
+
+def test_python_m() -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "offset_poly", "-f", "wkt", "-d", "1", "-w", "1", "-q"],
+        input="LINESTRING (0 0, 1 0)\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == "LINESTRING (0.0 1.0, 1.0 1.0)\n"
@@ -0,0 +1,95 @@
+"""Test flattening rounded corners into a dense polyline.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import itertools as it
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from offset_poly.flatten import flatten_corners, flatten_cpts, get_num_steps  # noqa: E402
+from offset_poly.offset import offset_polygon, offset_polyline  # noqa: E402
+from offset_poly.offset_array import offset_polygon_array  # noqa: E402
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    _FArray = npt.NDArray[Any]
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)]
+
+
+def _sample_curve(cpts: npt.ArrayLike, num_samples: int = 501) -> _FArray:
+    time = np.linspace(0, 1, num_samples)[:, np.newaxis]
+    p0, p1, p2 = np.asarray(cpts, dtype=float)
+    return (1 - time) ** 2 * p0 + 2 * time * (1 - time) * p1 + time**2 * p2
+
+
+def _distance_to_polyline(points: _FArray, polyline: _FArray) -> _FArray:
+    dist = np.full(len(points), np.inf)
+    for beg, end in it.pairwise(polyline):
+        vec = end - beg
+        time = np.clip((points - beg) @ vec / (vec @ vec), 0, 1)
+        near = beg + time[:, np.newaxis] * vec
+        diff = points - near
+        dist = np.minimum(dist, np.hypot(diff[:, 0], diff[:, 1]))
+    return dist
+
+
+class TestFlattenCpts:
+    @pytest.mark.parametrize("tolerance", [0.1, 0.01, 0.001])
+    def test_within_tolerance(self, tolerance: float) -> None:
+        cpts = np.random.default_rng(0).uniform(0, 10, (20, 3, 2))
+        points, bounds = flatten_cpts(cpts, tolerance)
+        for k, curve in enumerate(cpts):
+            chords = points[bounds[k] : bounds[k + 1]]
+            assert np.array_equal(chords[[0, -1]], curve[[0, 2]])
+            dist = _distance_to_polyline(_sample_curve(curve), chords)
+            assert dist.max() <= tolerance
+
+    def test_point_curve(self) -> None:
+        cpts = [[(1, 1), (1, 1), (1, 1)], [(0, 0), (1, 0), (2, 0)]]
+        assert get_num_steps(cpts, 0.1).tolist() == [0, 1]
+        points, bounds = flatten_cpts(cpts, 0.1)
+        assert points.tolist() == [[1, 1], [0, 0], [2, 0]]
+        assert bounds.tolist() == [0, 1, 3]
+
+    def test_dtype(self) -> None:
+        cpts = np.array([[(0, 0), (1, 0), (1, 1)]], dtype=np.float32)
+        points, _ = flatten_cpts(cpts, 0.01)
+        assert points.dtype == np.float32
+
+    def test_bad_tolerance(self) -> None:
+        with pytest.raises(ValueError, match="greater than 0"):
+            _ = flatten_cpts([[(0, 0), (1, 0), (1, 1)]], 0)
+
+
+class TestFlattenCorners:
+    def test_closed_polygon(self) -> None:
+        points = flatten_corners(offset_polygon(SQUARE, 1), 0.01)
+        assert np.array_equal(points[0], points[-1])
+        assert points[0].tolist() == [0, 1]
+        assert (
+            len(points)
+            == 4 * (get_num_steps([[(0, 1), (0, 0), (1, 0)]], 0.01)[0] + 1) + 1
+        )
+
+    def test_array_matches_list(self) -> None:
+        array = offset_polygon_array(np.array(SQUARE, dtype=float), 1)
+        expect = flatten_corners(offset_polygon(SQUARE, 1), 0.01)
+        assert np.allclose(flatten_corners(array, 0.01), expect)
+
+    def test_repeated_points(self) -> None:
+        polyline = [(0, 0), (2, 0), (2, 0), (2, 2)]
+        expect = flatten_corners(offset_polyline([(0, 0), (2, 0), (2, 2)], 1), 0.01)
+        points = flatten_corners(offset_polyline(polyline, 1), 0.01)
+        assert np.array_equal(points, expect)
+
+    def test_empty(self) -> None:
+        assert flatten_corners([], 0.01).shape == (0, 2)
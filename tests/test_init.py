@@ -0,0 +1,55 @@
+"""Test that the package namespace loads modules lazily.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import offset_poly
+from offset_poly import offset, offset_corner, self_intersections
+
+
+def _get_loaded(statement: str) -> list[str]:
+    """Return which offset_poly dependencies a fresh interpreter has loaded."""
+    modules = ["numpy", "offset_poly.offset", "offset_poly.offset_corner", "vec2_math"]
+    script = (
+        f"import json, sys; {statement}; "
+        + f"print(json.dumps([x for x in {modules} if x in sys.modules]))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestLazyImport:
+    def test_import_loads_nothing(self) -> None:
+        assert _get_loaded("import offset_poly") == []
+
+    def test_first_use_loads_engine(self) -> None:
+        loaded = _get_loaded("from offset_poly import offset_polygon")
+        assert "offset_poly.offset" in loaded
+        assert "numpy" not in loaded
+
+    def test_names(self) -> None:
+        assert offset_poly.offset_polygon is offset.offset_polygon
+        assert offset_poly.gap_corner is offset_corner.gap_corner
+        assert (
+            offset_poly.remove_self_intersections
+            is self_intersections.remove_self_intersections
+        )
+        assert set(offset_poly.__all__) <= set(dir(offset_poly))
+
+    def test_all_names_resolve(self) -> None:
+        _ = pytest.importorskip("numpy")
+        for name in offset_poly.__all__:
+            assert getattr(offset_poly, name).__name__ == name
+
+    def test_unknown_name(self) -> None:
+        with pytest.raises(AttributeError):
+            _ = offset_poly.not_a_name
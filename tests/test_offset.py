@@ -3,12 +3,19 @@
 :author: Shay Hill
 :created: 2023-08-19
 """
+import array
+import itertools as it
 import math
 
+import pytest
+
 from offset_poly.offset import (
+    JoinType,
+    iter_offset_polyline,
     offset_polygon,
     offset_polyline,
     offset_poly_per_edge,
+    offset_poly_per_vert,
     PolyType,
 )
 
@@ -338,3 +345,258 @@ class TestOffsetPolyPerEdge:
             x.xsect for x in offset_poly_per_edge(polyline, offsets, PolyType.POLYLINE)
         ]
         assert _all_xy_close(result, expect)
+
+
+class TestIterOffsetPolyline:
+    def test_matches_offset_polyline(self):
+        polyline = [(0, 0), (5, 0), (5, 5), (0, 5)]
+        result = list(iter_offset_polyline(iter(polyline), 1))
+        expect = offset_polyline(polyline, 1)
+        assert [x.xsect for x in result] == [x.xsect for x in expect]
+        assert [x.cpts for x in result] == [x.cpts for x in expect]
+
+    def test_multiples_retained(self):
+        polyline = [(0, 0), (0, 0), (5, 0), (5, 5), (5, 5), (0, 5), (0, 0), (0, 0)]
+        result = list(iter_offset_polyline(iter(polyline), 1))
+        expect = offset_polyline(polyline, 1)
+        assert [x.xsect for x in result] == [x.xsect for x in expect]
+
+    def test_two_points(self):
+        result = list(iter_offset_polyline(iter([(0, 0), (0, 0), (5, 0)]), 1))
+        assert [x.xsect for x in result] == [(0, 1), (0, 1), (5, 1)]
+
+    def test_lazy(self):
+        """Corners are yielded before the input is exhausted."""
+        points = ((float(i), float(i % 2)) for i in it.count())
+        corners = iter_offset_polyline(points, 1)
+        num_corners = 1000
+        assert len(list(it.islice(corners, num_corners))) == num_corners
+
+    def test_too_few_points(self):
+        with pytest.raises(ValueError, match="two unique points"):
+            _ = list(iter_offset_polyline(iter([(0, 0), (0, 0)]), 1))
+
+
+class TestBufferInput:
+    polygon = ((0, 0), (4, 0), (4, 0), (4, 4), (0, 4), (0, 0))
+
+    def _expect(self) -> list[tuple[float, float]]:
+        return [x.xsect for x in offset_polygon(self.polygon, 1)]
+
+    def test_ndarray(self):
+        """Buffer input returns GapCorner instances unless as_array is True."""
+        np = pytest.importorskip("numpy")
+        points = np.array(self.polygon, dtype=float)
+        result = offset_polygon(points, 1)
+        assert isinstance(result, list)
+        assert [x.xsect for x in result] == self._expect()
+        assert result[1] is result[2]
+        result = offset_polygon(points, 1, as_array=True)
+        assert not isinstance(result, list)
+        assert [x.xsect for x in result] == self._expect()
+
+    def test_strided_ndarray(self):
+        np = pytest.importorskip("numpy")
+        points = np.array(self.polygon, dtype=float)[::-1][::-1]
+        assert [x.xsect for x in offset_polygon(points, 1)] == self._expect()
+
+    def test_flat_array_array(self):
+        flat = array.array("d", it.chain.from_iterable(self.polygon))
+        assert [x.xsect for x in offset_polygon(flat, 1)] == self._expect()
+        assert [x.xsect for x in offset_polygon(memoryview(flat), 1)] == self._expect()
+
+    def test_flat_int_array_array(self):
+        flat = array.array("i", it.chain.from_iterable(self.polygon))
+        corners = offset_polygon(flat, 1)  # pyright: ignore[reportArgumentType]
+        assert [x.xsect for x in corners] == self._expect()
+
+    def test_flat_vert_offsets(self):
+        """A flat buffer of vert offsets is read as (gap_1, gap_2) pairs."""
+        gaps = array.array("d", [1] * len(self.polygon) * 2)
+        result = offset_poly_per_vert(self.polygon, gaps, PolyType.POLYGON)
+        assert [x.xsect for x in result] == self._expect()
+
+    def test_flat_array_array_as_array(self):
+        _ = pytest.importorskip("numpy")
+        flat = array.array("d", it.chain.from_iterable(self.polygon))
+        result = offset_polygon(flat, 1, as_array=True)
+        assert [x.xsect for x in result] == self._expect()
+
+    def test_per_edge_iterator(self):
+        np = pytest.importorskip("numpy")
+        points = np.array(self.polygon, dtype=float)
+        result = offset_poly_per_edge(
+            points, it.cycle([1]), PolyType.POLYGON, as_array=True
+        )
+        assert [x.xsect for x in result] == self._expect()
+
+    def test_per_edge_list_as_array(self):
+        _ = pytest.importorskip("numpy")
+        result = offset_poly_per_edge(
+            self.polygon, it.cycle([1]), PolyType.POLYGON, as_array=True
+        )
+        assert [x.xsect for x in result] == self._expect()
+
+    def test_out_list(self):
+        out = array.array("d", [0] * len(self.polygon) * 2)
+        _ = offset_polygon(self.polygon, 1, out=out)
+        assert list(zip(out[::2], out[1::2], strict=True)) == self._expect()
+
+    def test_out(self):
+        np = pytest.importorskip("numpy")
+        out = np.empty((len(self.polygon), 2))
+        points = np.array(self.polygon, dtype=float)
+        result = offset_polygon(points, 1, out=out, as_array=True)
+        assert [tuple(x) for x in out.tolist()] == self._expect()
+        assert np.shares_memory(result.xsect, out)
+
+    def test_out_flat_buffer(self):
+        flat = array.array("d", it.chain.from_iterable(self.polygon))
+        out = array.array("d", [0] * len(flat))
+        _ = offset_polyline(flat, 1, out=out)
+        expect = [x.xsect for x in offset_polyline(self.polygon, 1)]
+        assert list(zip(out[::2], out[1::2], strict=True)) == expect
+
+    def test_dtype_float32(self):
+        np = pytest.importorskip("numpy")
+        result = offset_polygon(self.polygon, 1, as_array=True, dtype=np.float32)
+        assert result.xsect.dtype == np.float32
+        result = offset_poly_per_edge(
+            self.polygon, [1] * 5, PolyType.POLYGON, as_array=True, dtype=np.float32
+        )
+        assert result.xsect.dtype == np.float32
+        np.testing.assert_allclose(result.xsect, self._expect())
+
+    def test_out_float32(self):
+        """The dtype of a float32 out buffer is the default dtype."""
+        np = pytest.importorskip("numpy")
+        out = np.empty((len(self.polygon), 2), dtype=np.float32)
+        result = offset_polygon(self.polygon, 1, out=out, as_array=True)
+        assert np.shares_memory(result.xsect, out)
+        np.testing.assert_allclose(out, self._expect())
+
+    def test_out_float32_list(self):
+        out = array.array("f", [0] * len(self.polygon) * 2)
+        _ = offset_polygon(self.polygon, 1, out=out)
+        assert list(zip(out[::2], out[1::2], strict=True)) == self._expect()
+
+    def test_dtype_without_as_array(self):
+        with pytest.raises(ValueError, match="as_array"):
+            _ = offset_polygon(
+                self.polygon,
+                1,
+                dtype="float32",  # pyright: ignore[reportArgumentType]
+            )
+
+    def test_out_buffer_input(self):
+        """Write xsects into array.array and memoryview out buffers."""
+        flat = array.array("d", it.chain.from_iterable(self.polygon))
+        for points in (flat, memoryview(flat)):
+            out_array = array.array("d", [0] * len(flat))
+            _ = offset_polygon(points, 1, out=out_array)
+            xsects = zip(out_array[::2], out_array[1::2], strict=True)
+            assert list(xsects) == self._expect()
+            out_view = memoryview(array.array("d", [0] * len(flat)))
+            _ = offset_polygon(points, 1, out=out_view)
+            xsects = zip(out_view[::2], out_view[1::2], strict=True)
+            assert list(xsects) == self._expect()
+
+    def test_out_wrong_size(self):
+        with pytest.raises(ValueError, match="C-contiguous buffer"):
+            _ = offset_polygon(self.polygon, 1, out=array.array("d", [0, 0]))
+
+    def test_out_int(self):
+        out = array.array("i", [0] * len(self.polygon) * 2)
+        with pytest.raises(ValueError, match="floats"):
+            _ = offset_polygon(
+                self.polygon,
+                1,
+                out=out,  # pyright: ignore[reportArgumentType]
+            )
+
+
+class TestSnap:
+    jittered = ((0, 0), (2, 0), (2, 2), (0, 2), (1e-9, 0), (0, -2))
+    snapped = ((0, 0), (2, 0), (2, 2), (0, 2), (0, 0), (0, -2))
+
+    def test_snaps_non_adjacent(self):
+        """Points within tolerance of a non-adjacent point are snapped to it."""
+        result = offset_polyline(self.jittered, 1, tolerance=1e-6, snap=True)
+        expect = offset_polyline(self.snapped, 1)
+        assert [x.xsect for x in result] == [x.xsect for x in expect]
+
+    def test_as_array(self):
+        _ = pytest.importorskip("numpy")
+        result = offset_polyline(
+            self.jittered, 1, tolerance=1e-6, snap=True, as_array=True
+        )
+        expect = offset_polyline(self.snapped, 1)
+        assert [x.xsect for x in result] == [x.xsect for x in expect]
+
+    def test_no_tolerance(self):
+        with pytest.raises(ValueError, match="tolerance"):
+            _ = offset_polyline(self.jittered, 1, snap=True)
+
+
+class TestJoin:
+    square = ((0, 0), (4, 0), (4, 4), (0, 4), (0, 0))
+
+    def test_miter(self):
+        result = offset_polygon(self.square, -1, join=JoinType.MITER)
+        assert result == [(-1, -1), (5, -1), (5, 5), (-1, 5), (-1, -1)]
+
+    def test_inside_corners_join_at_xsect(self):
+        for join in JoinType:
+            result = offset_polygon(self.square, 1, join=join)
+            assert result == [x.xsect for x in offset_polygon(self.square, 1)]
+
+    def test_bevel(self):
+        result = offset_polygon(self.square[:-1], -1, join=JoinType.BEVEL)
+        assert (result[:4], len(result)) == ([(-1, 0), (0, -1), (4, -1), (5, 0)], 8)
+
+    def test_miter_limit(self):
+        spike = [(0, 0), (10, 0), (0, 1)]
+        limited = offset_polyline(spike, -1, join=JoinType.MITER)
+        unlimited = offset_polyline(spike, -1, join=JoinType.MITER, miter_limit=100)
+        assert (len(limited), len(unlimited)) == (4, 3)
+
+    def test_degenerate_corner_is_beveled(self):
+        result = offset_polyline([(0, 0), (2, 0), (0, 0)], 1, join=JoinType.MITER)
+        assert result == [(0, 1), (2, 1), (2, -1), (0, -1)]
+
+    def test_round(self):
+        result = offset_polygon(
+            self.square, -1, join=JoinType.ROUND, arc_tolerance=0.01
+        )
+        assert result[0] == result[-1]
+        for x, y in result:
+            near_x = min(max(x, 0), 4)
+            near_y = min(max(y, 0), 4)
+            assert math.isclose(math.dist((x, y), (near_x, near_y)), 1)
+        assert len(result) == 4 * (6 + 1) + 1
+
+    def test_repeated_points(self):
+        square = [(0, 0), (4, 0), (4, 0), (4, 4), (0, 4)]
+        result = offset_polygon(square, -1, join=JoinType.BEVEL)
+        expect = offset_polygon(self.square[:-1], -1, join=JoinType.BEVEL)
+        assert result == expect
+
+    def test_array_matches_list(self):
+        np = pytest.importorskip("numpy")
+        polygon = [(0, 0), (4, 0), (4, 4), (3, 1), (1, 5), (0, 0)]
+        for join in JoinType:
+            for gap in (-0.5, 0.5):
+                expect = offset_polygon(polygon, gap, join=join, arc_tolerance=0.01)
+                result = offset_polygon(
+                    np.array(polygon, dtype=float), gap, join=join, arc_tolerance=0.01
+                )
+                np.testing.assert_allclose(result, expect, atol=1e-9)
+
+    def test_out_with_join(self):
+        with pytest.raises(ValueError, match="out cannot be used with join"):
+            _ = offset_polygon(  # pyright: ignore[reportCallIssue, reportUnknownVariableType]
+                self.square,
+                1,
+                join=JoinType.BEVEL,
+                out=array.array("d", [0] * 10),  # pyright: ignore[reportArgumentType]
+            )
@@ -0,0 +1,303 @@
+"""Test the NumPy backend against the GapCorner results.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from offset_poly.offset import (  # noqa: E402
+    PolyType,
+    offset_poly_per_edge,
+    offset_poly_per_vert,
+    offset_polygon,
+    offset_polyline,
+)
+from offset_poly.offset_array import (  # noqa: E402
+    GapCornerArray,
+    PreparedPoly,
+    gap_corner_arrays,
+    offset_poly_per_edge_array,
+    offset_poly_per_vert_array,
+    offset_polygon_array,
+    offset_polygon_multi,
+    offset_polyline_array,
+    offset_polyline_multi,
+)
+from offset_poly.offset_corner import gap_corner  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from offset_poly.offset_corner import GapCorner
+
+    _FArray = npt.NDArray[Any]
+
+
+def _random_polyline(num_points: int) -> list[tuple[float, float]]:
+    """Return a random polyline with some repeated points."""
+    points = [(random.uniform(-5, 5), random.uniform(-5, 5)) for _ in range(num_points)]
+    for _ in range(num_points // 5):
+        i = random.randrange(num_points)
+        points.insert(i, points[i])
+    return points
+
+
+def _assert_matches(
+    corners: Sequence[GapCorner],
+    arrays: GapCornerArray | tuple[_FArray, _FArray, _FArray],
+) -> None:
+    """Assert arrays match a list of GapCorner instances."""
+    if isinstance(arrays, GapCornerArray):
+        arrays = arrays.xsect, arrays.angle, arrays.cpts
+    xsect, angle, cpts = arrays
+    assert len(xsect) == len(angle) == len(cpts) == len(corners)
+    np.testing.assert_allclose(xsect, [c.xsect for c in corners], atol=1e-9)
+    np.testing.assert_allclose(angle, [c.angle for c in corners], atol=1e-9)
+    np.testing.assert_allclose(cpts, [c.cpts for c in corners], atol=1e-9)
+
+
+class TestGapCornerArrays:
+    @pytest.mark.parametrize("runs", range(20))
+    def test_matches_gap_corner(self, runs: int) -> None:
+        del runs
+        pnts = np.random.uniform(-5, 5, (3, 50, 2))
+        gaps = np.random.uniform(-5, 5, (2, 50))
+        corners = [
+            gap_corner(a, b, c, g1, g2)
+            for a, b, c, g1, g2 in zip(*pnts.tolist(), *gaps.tolist(), strict=True)
+        ]
+        _assert_matches(corners, gap_corner_arrays(*pnts, *gaps))
+
+    def test_gap2_not_given(self) -> None:
+        xsect, _, _ = gap_corner_arrays([(0, 0)], [(0, 2)], [(2, 2)], [1])
+        assert xsect.tolist() == [[-1, 3]]
+
+    def test_straight(self) -> None:
+        xsect, _, _ = gap_corner_arrays([(0, 0)], [(0, 2)], [(0, 4)], 1, 1)
+        assert xsect.tolist() == [[-1, 2]]
+
+    def test_zero_angle_with_different_gaps(self) -> None:
+        with pytest.raises(ValueError, match="gaps must be equal for straight corners"):
+            _ = gap_corner_arrays([(0, 0)], [(0, 2)], [(0, 4)], 1, 2)
+
+    def test_pi_angle(self) -> None:
+        xsect, _, cpts = gap_corner_arrays([(0, 0)], [(0, 2)], [(0, 1)], 1)
+        assert np.isnan(xsect).all()
+        assert cpts.tolist() == [[[0, 2], [0, 2], [0, 2]]]
+
+
+class TestOffsetArrays:
+    @pytest.mark.parametrize("runs", range(20))
+    def test_polygon(self, runs: int) -> None:
+        del runs
+        polyline = _random_polyline(20)
+        offset = random.uniform(-2, 2)
+        _assert_matches(
+            offset_polygon(polyline, offset), offset_polygon_array(polyline, offset)
+        )
+
+    @pytest.mark.parametrize("runs", range(20))
+    def test_polyline(self, runs: int) -> None:
+        del runs
+        polyline = _random_polyline(20)
+        offset = random.uniform(-2, 2)
+        _assert_matches(
+            offset_polyline(polyline, offset), offset_polyline_array(polyline, offset)
+        )
+
+    def test_closed_polygon(self) -> None:
+        polyline = [(0, 0), (5, 0), (5, 5), (0, 5), (0, 0)]
+        _assert_matches(offset_polygon(polyline, 1), offset_polygon_array(polyline, 1))
+
+    def test_multiples_retained(self) -> None:
+        polyline = [(0, 0), (0, 0), (5, 0), (5, 5), (5, 5), (0, 5), (0, 0), (0, 0)]
+        _assert_matches(offset_polygon(polyline, 1), offset_polygon_array(polyline, 1))
+        _assert_matches(
+            offset_polyline(polyline, 1), offset_polyline_array(polyline, 1)
+        )
+
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    def test_per_edge(self, poly_type: PolyType) -> None:
+        polyline = [(0, 0), (5, 0), (5, 5), (0, 5)]
+        offsets = [-2, -1, -3, -1]
+        _assert_matches(
+            offset_poly_per_edge(polyline, offsets, poly_type),
+            offset_poly_per_edge_array(polyline, offsets, poly_type),
+        )
+
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    def test_per_vert(self, poly_type: PolyType) -> None:
+        polyline = [(0, 0), (5, 0), (5, 5), (0, 5)]
+        gaps = [(1, 2), (2, 3), (3, 4), (4, 1)]
+        _assert_matches(
+            offset_poly_per_vert(polyline, gaps, poly_type),
+            offset_poly_per_vert_array(polyline, gaps, poly_type),
+        )
+
+    def test_too_few_points(self) -> None:
+        with pytest.raises(ValueError, match="three unique points"):
+            _ = offset_polygon_array([(0, 0), (1, 0), (1, 0)], 1)
+        with pytest.raises(ValueError, match="two unique points"):
+            _ = offset_polyline_array([(0, 0), (0, 0)], 1)
+
+    def test_pi_angle_gives_nan(self) -> None:
+        result = offset_polyline_array([(0, 0), (0, 2), (0, 1)], 1)
+        assert math.isnan(result.xsect[1, 0])
+
+
+class TestGapCornerArray:
+    def test_rows_match_gap_corners(self) -> None:
+        polyline = [(0, 0), (5, 0), (5, 0), (5, 5), (0, 5), (0, 0)]
+        gaps = [(1, 2), (2, 3), (3, 4), (4, 1)]
+        corners = offset_poly_per_vert(polyline, gaps, PolyType.POLYGON)
+        result = offset_poly_per_vert_array(polyline, gaps, PolyType.POLYGON)
+        assert len(result) == len(corners)
+        for row, corner in zip(result, corners, strict=True):
+            assert row.pnt_a == corner.pnt_a
+            assert row.pnt_b == corner.pnt_b
+            assert row.pnt_c == corner.pnt_c
+            assert row.gap_1 == corner.gap_1
+            assert row.gap_2 == corner.gap_2
+            assert math.isclose(row.angle, corner.angle)
+            assert np.allclose(row.xsect, corner.xsect)
+            assert np.allclose(row.cpts, corner.cpts)
+
+    def test_row_types(self) -> None:
+        row = offset_polygon_array([(0, 0), (5, 0), (5, 5), (0, 5)], 1)[-1]
+        assert row.xsect == (1, 4)
+        assert isinstance(row.xsect[0], float)
+        assert row.cpts == ((1, 5), (0, 5), (0, 4))
+
+    def test_index_error(self) -> None:
+        result = offset_polygon_array([(0, 0), (5, 0), (5, 5)], 1)
+        with pytest.raises(IndexError):
+            _ = result[3]
+
+    def test_columns_are_contiguous(self) -> None:
+        result = offset_polygon_array(np.random.uniform(-5, 5, (100, 2)), 1)
+        for column in (result.xsect, result.angle, result.cpts, result.gap_1):
+            assert column.flags.c_contiguous
+        assert result.nbytes == sum(
+            getattr(result, x).nbytes for x in GapCornerArray.__slots__
+        )
+
+
+class TestOffsetMulti:
+    @pytest.mark.parametrize("runs", range(10))
+    def test_polygon(self, runs: int) -> None:
+        del runs
+        polyline = _random_polyline(20)
+        distances = [-2, -0.5, 0, 1, 3]
+        result = offset_polygon_multi(polyline, distances)
+        assert result.shape == (5, len(polyline), 2)
+        for ring, distance in zip(result, distances, strict=True):
+            expect = [c.xsect for c in offset_polygon(polyline, distance)]
+            np.testing.assert_allclose(ring, expect, atol=1e-9)
+
+    @pytest.mark.parametrize("runs", range(10))
+    def test_polyline(self, runs: int) -> None:
+        del runs
+        polyline = _random_polyline(20)
+        distances = np.linspace(-2, 2, 7)
+        result = offset_polyline_multi(polyline, distances)
+        for ring, distance in zip(result, distances, strict=True):
+            expect = [c.xsect for c in offset_polyline(polyline, distance)]
+            np.testing.assert_allclose(ring, expect, atol=1e-9)
+
+    def test_scalar_distance(self) -> None:
+        result = offset_polygon_multi([(0, 0), (5, 0), (5, 5), (0, 5)], 1)
+        assert result.tolist() == [[[1, 1], [4, 1], [4, 4], [1, 4]]]
+
+
+class TestPreparedPoly:
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    def test_repeated_offsets(self, poly_type: PolyType) -> None:
+        polyline = _random_polyline(20)
+        prepared = PreparedPoly(polyline, poly_type)
+        for offset in (-1, 0.5, 2):
+            _assert_matches(
+                offset_poly_per_edge(polyline, [offset], poly_type),
+                prepared.offset(offset),
+            )
+
+    def test_per_edge(self) -> None:
+        polyline = [(0, 0), (5, 0), (5, 5), (0, 5)]
+        prepared = PreparedPoly(polyline, PolyType.POLYGON)
+        for offsets in ([-2, -1, -1, -1], [-1, -1, -1, -2]):
+            _assert_matches(
+                offset_poly_per_edge(polyline, offsets, PolyType.POLYGON),
+                prepared.offset_per_edge(offsets),
+            )
+
+    def test_per_vert(self) -> None:
+        polyline = [(0, 0), (5, 0), (5, 5), (5, 5), (0, 5), (0, 0)]
+        prepared = PreparedPoly(polyline, PolyType.POLYGON)
+        gaps = [(1, 2), (2, 3), (3, 4), (4, 1)]
+        _assert_matches(
+            offset_poly_per_vert(polyline, gaps, PolyType.POLYGON),
+            prepared.offset_per_vert(gaps),
+        )
+
+    def test_geometry(self) -> None:
+        prepared = PreparedPoly([(0, 0), (2, 0), (2, 2), (0, 2)], PolyType.POLYGON)
+        assert (len(prepared), prepared.num_corners) == (4, 4)
+        np.testing.assert_allclose(prepared.angle, [math.pi / 2] * 4)
+        assert prepared.edge_vecs.tolist() == [
+            [0, -2],
+            [2, 0],
+            [0, 2],
+            [-2, 0],
+            [0, -2],
+        ]
+        assert prepared.normals.tolist() == [[1, 0], [0, 1], [-1, 0], [0, -1], [1, 0]]
+
+    def test_offset_multi(self) -> None:
+        polyline = _random_polyline(20)
+        prepared = PreparedPoly(polyline, PolyType.POLYGON)
+        for ring, distance in zip(prepared.offset_multi([1, 2]), [1, 2], strict=True):
+            np.testing.assert_allclose(ring, prepared.offset(distance).xsect)
+
+
+class TestDtype:
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    def test_float32_close_to_float64(self, poly_type: PolyType) -> None:
+        polyline = [
+            (math.cos(i * math.tau / 100), math.sin(i * math.tau / 100))
+            for i in range(100)
+        ]
+        prepared = PreparedPoly(polyline, poly_type, dtype=np.float32)
+        result = prepared.offset(0.1)
+        assert prepared.dtype == np.float32
+        for column in (result.xsect, result.angle, result.cpts, result.gap_1):
+            assert column.dtype == np.float32
+        expect = offset_poly_per_edge(polyline, [0.1], poly_type)
+        np.testing.assert_allclose(result.xsect, [c.xsect for c in expect], atol=1e-5)
+        assert prepared.offset_multi([1, 2]).dtype == np.float32
+
+    def test_float32_straight_tolerance(self) -> None:
+        """Rounding error in a float32 straight corner is not a sharp corner."""
+        line = np.linspace((0, 0), (1000, 1e-3), 5000)
+        polyline = np.vstack((line, [(500, -100)]))
+        result = offset_polygon_array(polyline, 1, dtype=np.float32)
+        assert not np.isnan(result.xsect).any()
+        max_error = 1e-3
+        assert np.abs(result.xsect[1:-2, 1] - 1).max() < max_error
+
+    def test_gap_corner_arrays(self) -> None:
+        arrays = gap_corner_arrays([(0, 0)], [(1, 0)], [(1, 1)], 1, dtype="float32")
+        assert [x.dtype for x in arrays] == [np.float32] * 3
+
+    def test_bad_dtype(self) -> None:
+        with pytest.raises(ValueError, match="dtype must be float32 or float64"):
+            _ = offset_polygon_array([(0, 0), (1, 0), (1, 1)], 1, dtype=np.int32)
@@ -7,8 +7,11 @@ import math
 import pytest
 import random
 
+from offset_poly import offset
 from offset_poly.offset_corner import (
     gap_corner,
+    iter_fused_gap_corners,
+    iter_gap_corners,
 )
 
 _ThreePoints = tuple[tuple[float, float], tuple[float, float], tuple[float, float]]
@@ -91,3 +94,116 @@ class TestMiterCorner:
         rev = gap_corner(pnt_c, pnt_b, pnt_a, -random_gap)
         assert math.isclose(fwd.xsect[0], rev.xsect[0])
         assert math.isclose(fwd.xsect[1], rev.xsect[1])
+
+
+class TestCaching:
+    def test_xsect_computed_once(self):
+        corner = gap_corner((0, 0), (0, 2), (2, 2), 1, 2)
+        assert corner.xsect is corner.xsect
+
+    def test_cpts_computed_once(self):
+        corner = gap_corner((0, 0), (0, 2), (-2, 2), 1)
+        assert corner.cpts is corner.cpts
+        assert corner.cpts == ((0, 1), (0, 2), (-1, 2))
+
+    def test_no_instance_dict(self):
+        corner = gap_corner((0, 0), (0, 2), (2, 2), 1)
+        assert not hasattr(corner, "__dict__")
+
+    def test_error_not_cached(self):
+        """A straight corner with unequal gaps raises on every access."""
+        corner = gap_corner((0, 0), (0, 2), (0, 4), 1, 2)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="gaps must be equal"):
+                _ = corner.xsect
+
+
+class TestReadOnlyInputs:
+    @pytest.mark.parametrize(
+        "name", ["pnt_a", "pnt_b", "pnt_c", "gap_1", "gap_2", "angle"]
+    )
+    def test_cannot_set(self, name: str) -> None:
+        """Inputs cannot change under a cached xsect or cpts."""
+        corner = gap_corner((0, 0), (0, 2), (2, 2), 1, 1)
+        with pytest.raises(AttributeError):
+            setattr(corner, name, 0)
+        assert corner.xsect == (-1, 3)
+
+
+class TestIterGapCorners:
+    def test_matches_gap_corner(self):
+        points = [(0, 0), (0, 2), (2, 2), (2, 5), (-1, 3)]
+        gaps = [(1, 1), (1, 2), (2, 3)]
+        corners = list(iter_gap_corners(points, gaps))
+        expect = [
+            gap_corner(a, b, c, g1, g2)
+            for a, b, c, (g1, g2) in zip(
+                points, points[1:], points[2:], gaps, strict=False
+            )
+        ]
+        assert [c.xsect for c in corners] == [c.xsect for c in expect]
+        assert [c.cpts for c in corners] == [c.cpts for c in expect]
+
+    def test_edges_shared(self):
+        """The bc edge of one corner is the ab edge of the next."""
+        points = [(0, 0), (0, 2), (2, 2), (2, 5)]
+        corner_1, corner_2 = iter_gap_corners(points, [(1, 1), (1, 1)])
+        ab_left = corner_2._ab_left  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        bc_left = corner_1._bc_left  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        assert bc_left is ab_left
+
+    def test_edges_not_shared_for_different_gaps(self):
+        points = [(0, 0), (0, 2), (2, 2), (2, 5)]
+        corner_1, corner_2 = iter_gap_corners(points, [(1, 1), (2, 2)])
+        ab_left = corner_2._ab_left  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        bc_left = corner_1._bc_left  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        assert bc_left != ab_left
+        assert corner_2.xsect == gap_corner(points[1], points[2], points[3], 2).xsect
+
+    def test_too_few_points(self):
+        assert list(iter_gap_corners([(0, 0), (1, 1)], [(1, 1)])) == []
+
+
+def _same(aaa: float, bbb: float) -> bool:
+    """Return True if two values are equal or both nan."""
+    return aaa == bbb or (math.isnan(aaa) and math.isnan(bbb))
+
+
+class TestFusedKernel:
+    def test_matches_iter_gap_corners(self):
+        """The fused kernel gives the same values as lazy GapCorners."""
+        points = [(random.random(), random.random()) for _ in range(200)]
+        # a straight corner and a degenerate corner
+        points += [(points[-1][0] + 1, points[-1][1])]
+        points += [(points[-1][0] + 2, points[-1][1]), points[-1]]
+        gaps = [random.uniform(-1, 1) for _ in range(len(points) - 2)]
+        gap_pairs = [(x, x) for x in gaps]
+        fused = list(iter_fused_gap_corners(points, gap_pairs))
+        lazy = list(iter_gap_corners(points, gap_pairs))
+        assert len(fused) == len(lazy)
+        for aaa, bbb in zip(fused, lazy, strict=True):
+            assert _same(aaa.angle, bbb.angle)
+            assert all(_same(x, y) for x, y in zip(aaa.xsect, bbb.xsect, strict=True))
+            assert aaa.cpts == bbb.cpts or all(map(math.isnan, aaa.xsect))
+
+    def test_zero_length_raises_immediately(self):
+        """Raise ValueError on a zero-length edge with a nonzero gap."""
+        corners = iter_fused_gap_corners([(0, 0), (0, 0), (1, 0)], [(1, 1)])
+        with pytest.raises(ValueError, match="zero-length vector"):
+            _ = next(corners)
+
+    def test_unequal_gaps_on_straight_corner(self):
+        """Raise ValueError on access, as a lazy GapCorner would."""
+        corner = gap_corner((0, 0), (1, 0), (2, 0), 1, 2)
+        with pytest.raises(ValueError, match="gaps must be equal"):
+            _ = corner.xsect
+
+    def test_same_result_either_side_of_threshold(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """offset_polygon returns the same xsects from either kernel."""
+        points = [(random.random(), random.random()) for _ in range(20)]
+        fused = [x.xsect for x in offset.offset_polygon(points, 0.1)]
+        monkeypatch.setattr(offset, "_MAX_CORNERS_FOR_FUSED", 0)
+        lazy = [x.xsect for x in offset.offset_polygon(points, 0.1)]
+        assert fused == lazy
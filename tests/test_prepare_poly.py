@@ -0,0 +1,124 @@
+"""Test the shared run-length map of coincident adjacent points.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from offset_poly.offset import PolyType, offset_poly_per_vert, offset_polygon
+from offset_poly.prepare_poly import (
+    align_closing_points,
+    are_coincident,
+    expand_runs,
+    get_point_runs,
+    get_run_index,
+    remove_coincident_adjacent_points,
+    snap_points,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+SQUARE = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+
+def _random_polyline(num_points: int) -> list[tuple[int, int]]:
+    return [(random.randint(0, 2), random.randint(0, 2)) for _ in range(num_points)]
+
+
+class TestGetPointRuns:
+    def test_runs(self) -> None:
+        polyline = [(0, 0), (1, 0), (1, 0), (2, 0)]
+        assert get_point_runs(polyline) == ([0, 1, 3], [1, 2, 1])
+
+    def test_empty(self) -> None:
+        assert get_point_runs([]) == ([], [])
+
+    @pytest.mark.parametrize("runs", range(10))
+    def test_array_matches_list(self, runs: int) -> None:
+        del runs
+        np = pytest.importorskip("numpy")
+        polyline = _random_polyline(30)
+        points: npt.NDArray[Any] = np.array(polyline)
+        kept, run_lengths = get_point_runs(points)
+        assert isinstance(kept, np.ndarray)
+        assert (kept.tolist(), run_lengths.tolist()) == get_point_runs(polyline)
+
+    def test_tolerance(self) -> None:
+        polyline = [(0, 0), (1, 0), (1, 1e-9), (2, 0)]
+        assert get_point_runs(polyline, 1e-6) == ([0, 1, 3], [1, 2, 1])
+        assert get_point_runs(polyline) == ([0, 1, 2, 3], [1, 1, 1, 1])
+
+    @pytest.mark.parametrize("runs", range(10))
+    def test_array_tolerance_matches_list(self, runs: int) -> None:
+        del runs
+        np = pytest.importorskip("numpy")
+        polyline = [(x + random.uniform(0, 1e-9), y) for x, y in _random_polyline(30)]
+        points: npt.NDArray[Any] = np.array(polyline)
+        kept, run_lengths = get_point_runs(points, 1e-6)
+        expect = get_point_runs(polyline, 1e-6)
+        assert (kept.tolist(), run_lengths.tolist()) == expect
+
+
+class TestSnapPoints:
+    def test_snaps_non_adjacent(self) -> None:
+        points = [(0, 0), (1, 0), (1, 1), (1e-9, 0), (1, 1e-9)]
+        assert snap_points(points, 1e-6) == [(0, 0), (1, 0), (1, 1), (0, 0), (1, 0)]
+
+    def test_neighbor_cell(self) -> None:
+        assert snap_points([(0.99, 0), (1.01, 0)], 0.1) == [(0.99, 0), (0.99, 0)]
+
+    def test_bad_tolerance(self) -> None:
+        with pytest.raises(ValueError, match="tolerance must be greater than 0"):
+            _ = snap_points(SQUARE, 0)
+
+
+class TestTolerance:
+    def test_are_coincident(self) -> None:
+        assert are_coincident((0, 0), (0, 1e-9), 1e-6)
+        assert not are_coincident((0, 0), (0, 1e-9))
+
+    def test_jittered_square_matches_clean_square(self) -> None:
+        jittered = [(0, 0), (1, 0), (1, 1e-12), (1, 1), (0, 1), (1e-12, 0)]
+        result = offset_poly_per_vert(
+            jittered, [(1, 1)], PolyType.POLYGON, tolerance=1e-9
+        )
+        expect = offset_polygon(SQUARE, 1)
+        assert [x.xsect for x in result] == [
+            x.xsect for x in (expect[0], expect[1], expect[1], *expect[2:], expect[0])
+        ]
+
+    def test_array_jittered_square(self) -> None:
+        np = pytest.importorskip("numpy")
+        offset_array = pytest.importorskip("offset_poly.offset_array")
+        jittered = np.array([(0, 0), (1, 0), (1, 1e-12), (1, 1), (0, 1), (1e-12, 0)])
+        result = offset_array.offset_polygon_array(jittered, 1, tolerance=1e-9)
+        expect = offset_polygon(jittered.tolist(), 1, tolerance=1e-9)
+        assert np.allclose(result.xsect, [x.xsect for x in expect])
+
+
+class TestExpandRuns:
+    def test_closing_point_gets_first_value(self) -> None:
+        assert expand_runs("DE", [1, 2, 1]) == ["D", "E", "E", "D"]
+
+    def test_run_index(self) -> None:
+        assert get_run_index([1, 2, 1], 2) == [0, 1, 1, 0]
+
+    def test_array_run_index(self) -> None:
+        np = pytest.importorskip("numpy")
+        run_lengths: npt.NDArray[Any] = np.array([1, 2, 1])
+        assert get_run_index(run_lengths, 2).tolist() == [0, 1, 1, 0]
+
+    @pytest.mark.parametrize("runs", range(10))
+    def test_align_closing_points(self, runs: int) -> None:
+        del runs
+        polyline = _random_polyline(30)
+        unique = remove_coincident_adjacent_points(polyline)
+        aligned = align_closing_points(polyline, unique)
+        assert aligned == polyline
@@ -0,0 +1,220 @@
+"""Test finding and removing self intersections.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import itertools as it
+import math
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from offset_poly.offset import (
+    MIN_PTS_FOR_POLYGON,
+    PolyType,
+    offset_polygon,
+    offset_polyline,
+)
+from offset_poly.self_intersections import (
+    _iter_cells,  # pyright: ignore[reportPrivateUsage]
+    find_self_intersections,
+    remove_self_intersections,
+)
+
+_Point = tuple[float, float]
+
+# ccw rectangles joined by a neck 1 unit high
+DUMBBELL = [
+    (0, 0),
+    (4, 0),
+    (4, 1.5),
+    (6, 1.5),
+    (6, 0),
+    (10, 0),
+    (10, 4),
+    (6, 4),
+    (6, 2.5),
+    (4, 2.5),
+    (4, 4),
+    (0, 4),
+]
+
+
+def _brute_force(
+    points: Sequence[_Point], poly_type: PolyType
+) -> list[tuple[int, int]]:
+    """Find crossings by testing every pair of non-adjacent segments."""
+    if poly_type == PolyType.POLYGON:
+        segs = list(zip(points, [*points[1:], points[0]], strict=True))
+    else:
+        segs = list(it.pairwise(points))
+    crossings: list[tuple[int, int]] = []
+    for i, j in it.combinations(range(len(segs)), 2):
+        if j - i == 1 or (
+            poly_type == PolyType.POLYGON and (i, j) == (0, len(segs) - 1)
+        ):
+            continue
+        (ax, ay), (bx, by) = segs[i]
+        (cx, cy), (dx, dy) = segs[j]
+        denom = (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+        if denom == 0:
+            continue
+        t = ((cx - ax) * (dy - cy) - (cy - ay) * (dx - cx)) / denom
+        u = ((cx - ax) * (by - ay) - (cy - ay) * (bx - ax)) / denom
+        if 0 <= t < 1 and 0 <= u < 1:
+            crossings.append((i, j))
+    return crossings
+
+
+def _assert_simple(loop: Sequence[_Point], poly_type: PolyType) -> None:
+    assert find_self_intersections(loop, poly_type) == []
+
+
+class TestFindSelfIntersections:
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    @pytest.mark.parametrize("runs", range(10))
+    def test_matches_brute_force(self, runs: int, poly_type: PolyType) -> None:
+        del runs
+        points = [(random.uniform(-5, 5), random.uniform(-5, 5)) for _ in range(40)]
+        result = find_self_intersections(points, poly_type)
+        assert [(i, j) for i, j, _ in result] == _brute_force(points, poly_type)
+
+    def test_crossing_point(self) -> None:
+        points = [(0, 0), (4, 0), (4, 2), (2, 2), (2, -2)]
+        assert find_self_intersections(points, PolyType.POLYLINE) == [(0, 3, (2, 0))]
+
+    def test_simple(self) -> None:
+        assert find_self_intersections(DUMBBELL, PolyType.POLYGON) == []
+
+    def test_too_few_points(self) -> None:
+        assert find_self_intersections([], PolyType.POLYGON) == []
+        assert find_self_intersections([(0, 0)], PolyType.POLYLINE) == []
+
+    def test_long_edge_among_short(self) -> None:
+        """A long diagonal closing edge crosses a zigzag of short edges."""
+        points = [
+            (t + d, t - d)
+            for t, d in zip(
+                [10 * k / 400 for k in range(400, -1, -1)], it.cycle([0.01, -0.01])
+            )
+        ]
+        result = find_self_intersections(points, PolyType.POLYGON)
+        assert len(result) > len(points) // 4
+        assert [(i, j) for i, j, _ in result] == _brute_force(points, PolyType.POLYGON)
+
+    def test_long_edge_cells(self) -> None:
+        """A long diagonal edge is added to O(length) cells, not O(length**2)."""
+        cells = list(_iter_cells(((0, 0), (100, 100)), 1))
+        assert len(cells) <= 4 * 101
+        assert len(set(cells)) == len(cells)
+
+
+class TestRemoveSelfIntersections:
+    def test_polyline_loop(self) -> None:
+        points = [(0, 0), (4, 0), (4, 2), (2, 2), (2, -2)]
+        result = remove_self_intersections(points, PolyType.POLYLINE)
+        assert result == [[(0, 0), (2, 0), (2, -2)]]
+
+    def test_polyline_swallowtail(self) -> None:
+        """Offset a polyline across a notch narrower than the offset."""
+        polyline = [(0, 0), (10, 0), (10, -1), (11, -1), (11, 0), (20, 0)]
+        points = [x.xsect for x in offset_polyline(polyline, 2)]
+        assert find_self_intersections(points, PolyType.POLYLINE)
+        result = remove_self_intersections(points, PolyType.POLYLINE)
+        assert result == [[(0, 2), (12, 2), (20, 2)]]
+
+    def test_bowtie_keeps_matching_orientation(self) -> None:
+        bowtie = [(0, 0), (2, 2), (2, 0), (0, 2)]
+        ccw = [(0, 0), (1, 0), (1, 1)]
+        cw = list(reversed(ccw))
+        (keep_ccw,) = remove_self_intersections(bowtie, PolyType.POLYGON, ccw)
+        (keep_cw,) = remove_self_intersections(bowtie, PolyType.POLYGON, cw)
+        assert sorted(keep_ccw) == [(0, 0), (0, 2), (1, 1)]
+        assert sorted(keep_cw) == [(1, 1), (2, 0), (2, 2)]
+
+    def test_neck_splits_polygon(self) -> None:
+        corners = offset_polygon(DUMBBELL, 0.8)
+        result = remove_self_intersections(
+            [x.xsect for x in corners], PolyType.POLYGON, [x.pnt_b for x in corners]
+        )
+        _, _ = result  # one loop on either side of the neck
+        for loop in result:
+            _assert_simple(loop, PolyType.POLYGON)
+            assert len(loop) > MIN_PTS_FOR_POLYGON
+
+    def test_neck_not_split(self) -> None:
+        corners = offset_polygon(DUMBBELL, 0.4)
+        (result,) = remove_self_intersections(
+            [x.xsect for x in corners], PolyType.POLYGON
+        )
+        assert result == [x.xsect for x in corners]
+
+    def test_arms_split(self) -> None:
+        """Offset the arms of a "C" inward past the width of its spine."""
+        c_shape = [(0, 0), (10, 0), (10, 10), (0, 10), (0, 6), (8, 6), (8, 4), (0, 4)]
+        corners = offset_polygon(c_shape, 1.5)
+        result = remove_self_intersections([x.xsect for x in corners], PolyType.POLYGON)
+        assert sorted(map(sorted, result)) == [
+            [(1.5, 1.5), (1.5, 2.5), (8.5, 1.5), (8.5, 2.5)],
+            [(1.5, 7.5), (1.5, 8.5), (8.5, 7.5), (8.5, 8.5)],
+        ]
+
+    @pytest.mark.parametrize("direction", [1, -1])
+    def test_mouth_closes_into_hole(self, direction: int) -> None:
+        """Offset a "C" outward past the width of its mouth."""
+        c_shape = [
+            (0, 0),
+            (10, 0),
+            (10, 10),
+            (0, 10),
+            (0, 5.5),
+            (2, 5.5),
+            (2, 8),
+            (8, 8),
+            (8, 2),
+            (2, 2),
+            (2, 4.5),
+            (0, 4.5),
+        ][::direction]
+        corners = offset_polygon(c_shape, -direction)
+        result = remove_self_intersections(
+            [x.xsect for x in corners], PolyType.POLYGON, c_shape
+        )
+        outer, hole = sorted(result, key=min)
+        assert {(-1, -1), (11, -1), (11, 11), (-1, 11)} <= set(outer)
+        assert {(3, 3), (7, 3), (7, 7), (3, 7)} <= set(hole)
+        xs, ys = zip(*hole, strict=True)
+        assert (min(xs), max(xs), min(ys), max(ys)) == (3, 7, 3, 7)
+
+    @pytest.mark.parametrize("offset", [0.05, -0.05])
+    def test_swallowtails_removed(self, offset: float) -> None:
+        """Offset a wavy circle past the radius of curvature of its waves."""
+        num, num_waves = 2000, 20
+        wavy = [
+            (
+                (1 + 0.1 * math.sin(i * math.tau * num_waves / num))
+                * math.cos(i * math.tau / num),
+                (1 + 0.1 * math.sin(i * math.tau * num_waves / num))
+                * math.sin(i * math.tau / num),
+            )
+            for i in range(num)
+        ]
+        points = [x.xsect for x in offset_polygon(wavy, offset)]
+        assert len(find_self_intersections(points, PolyType.POLYGON)) == num_waves
+        (result,) = remove_self_intersections(points, PolyType.POLYGON)
+        _assert_simple(result, PolyType.POLYGON)
+
+    def test_nan_and_duplicates_removed(self) -> None:
+        points = [(0, 0), (0, 0), (1, 0), (math.nan, math.nan), (1, 1), (0, 0)]
+        result = remove_self_intersections(points, PolyType.POLYGON)
+        assert result == [[(0, 0), (1, 0), (1, 1)]]
+
+    @pytest.mark.parametrize("runs", range(10))
+    def test_random_results_are_simple(self, runs: int) -> None:
+        del runs
+        points = [(random.uniform(-5, 5), random.uniform(-5, 5)) for _ in range(30)]
+        for poly_type in (PolyType.POLYGON, PolyType.POLYLINE):
+            for loop in remove_self_intersections(points, poly_type):
+                _assert_simple(loop, poly_type)
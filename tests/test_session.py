@@ -0,0 +1,146 @@
+"""Test incremental offsets against offsetting from scratch.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import math
+import random
+from collections.abc import Sequence
+from typing import cast
+
+import pytest
+
+from offset_poly.offset import PolyType, offset_poly_per_vert
+from offset_poly.offset_corner import GapCorner
+from offset_poly.session import OffsetSession
+
+
+def _random_point() -> tuple[int, int]:
+    """Return a point on a small grid, so points are often coincident."""
+    return random.randint(0, 4), random.randint(0, 4)
+
+
+def _random_gaps() -> tuple[float, float]:
+    gap = random.uniform(0.5, 1)
+    return gap, gap
+
+
+def _offset_from_scratch(
+    points: Sequence[tuple[float, ...]],
+    gaps: Sequence[tuple[float, float]],
+    poly_type: PolyType,
+) -> list[GapCorner]:
+    """Offset with offset_poly_per_vert and the gaps of the first point in each run."""
+    run_gaps = [g for i, g in enumerate(gaps) if i == 0 or points[i] != points[i - 1]]
+    if poly_type == PolyType.POLYGON and points[0] == points[-1]:
+        run_gaps = run_gaps[:-1]
+    return offset_poly_per_vert(points, run_gaps, poly_type)
+
+
+def _safe_xsect(corner: GapCorner) -> tuple[float, float] | None:
+    try:
+        return corner.xsect
+    except ValueError:
+        return None
+
+
+def _assert_matches_scratch(session: OffsetSession) -> None:
+    expect = _offset_from_scratch(session.points, session.gaps, session.poly_type)
+    result = session.corners
+    assert len(result) == len(expect)
+    for have, want in zip(result, expect, strict=True):
+        assert have.pnt_a == want.pnt_a
+        assert have.pnt_b == want.pnt_b
+        assert have.pnt_c == want.pnt_c
+        assert (have.gap_1, have.gap_2) == (want.gap_1, want.gap_2)
+        have_xsect, want_xsect = _safe_xsect(have), _safe_xsect(want)
+        if want_xsect is None or math.isnan(want_xsect[0]):
+            assert str(have_xsect) == str(want_xsect)
+        else:
+            assert have_xsect == pytest.approx(want_xsect)
+    for i in range(1, len(result)):
+        if session.points[i] == session.points[i - 1]:
+            assert result[i] is result[i - 1]
+
+
+class TestOffsetSession:
+    @pytest.mark.parametrize("poly_type", [PolyType.POLYGON, PolyType.POLYLINE])
+    @pytest.mark.parametrize("runs", range(20))
+    def test_random_edits(self, runs: int, poly_type: PolyType) -> None:
+        del runs
+        points = [_random_point() for _ in range(12)]
+        gaps = [_random_gaps() for _ in points]
+        try:
+            session = OffsetSession(points, poly_type, gaps)
+        except ValueError:
+            return
+        _assert_matches_scratch(session)
+        for _ in range(40):
+            index = random.randrange(len(session))
+            edit = random.choice(["move", "insert", "delete", "set_gaps"])
+            try:
+                if edit == "move":
+                    session.move(index, _random_point())
+                elif edit == "insert":
+                    session.insert(index, _random_point(), _random_gaps())
+                elif edit == "delete":
+                    session.delete(index)
+                else:
+                    session.set_gaps(index, *_random_gaps())
+            except ValueError:
+                pass
+            _assert_matches_scratch(session)
+
+    def test_closing_point(self) -> None:
+        square = [(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)]
+        session = OffsetSession(square, PolyType.POLYGON, [(1, 1)])
+        assert session.corners[0] is session.corners[-1]
+        session.move(-1, (0, 1))
+        assert session.corners[0] is not session.corners[-1]
+        _assert_matches_scratch(session)
+        session.move(-1, (0, 0))
+        assert session.corners[0] is session.corners[-1]
+        _assert_matches_scratch(session)
+
+    def test_only_neighbors_recomputed(self) -> None:
+        circle = [
+            (math.cos(i * math.tau / 100), math.sin(i * math.tau / 100))
+            for i in range(100)
+        ]
+        session = OffsetSession(circle, PolyType.POLYGON, [(0.1, 0.1)])
+        before = session.corners
+        session.move(50, (0, 0))
+        after = session.corners
+        changed = [
+            i for i, (a, b) in enumerate(zip(before, after, strict=True)) if a is not b
+        ]
+        assert changed == [49, 50, 51]
+        _assert_matches_scratch(session)
+
+    def test_insert_keeps_edge_offset(self) -> None:
+        session = OffsetSession(
+            [(0, 0), (4, 0), (4, 4), (0, 4)], PolyType.POLYGON, [(1, 2)]
+        )
+        session.insert(1, (2, 0))
+        assert session.gaps[1] == (2, 2)
+        assert session[1].xsect == (2, 2)
+
+    def test_too_few_points(self) -> None:
+        session = OffsetSession([(0, 0), (1, 0), (1, 1)], PolyType.POLYGON)
+        before = session.corners
+        with pytest.raises(ValueError, match="three unique points"):
+            session.move(2, (1, 0))
+        with pytest.raises(ValueError, match="three unique points"):
+            session.delete(0)
+        assert session.points == [(0, 0), (1, 0), (1, 1)]
+        assert session.corners == before
+
+    def test_index_error(self) -> None:
+        session = OffsetSession([(0, 0), (1, 0)], PolyType.POLYLINE)
+        with pytest.raises(IndexError):
+            session.move(2, (1, 1))
+
+    def test_bad_poly_type(self) -> None:
+        with pytest.raises(ValueError, match="poly_type must be"):
+            _ = OffsetSession([(0, 0), (1, 0)], cast("PolyType", "polyline"))
@@ -0,0 +1,86 @@
+"""Test opt-in timings and corner counts.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+import math
+
+import pytest
+
+from offset_poly.offset import JoinType, PolyType, offset_polygon, offset_polyline
+from offset_poly.stats import get_active_stats, record_stats
+
+# one straight, one degenerate, and one near-parallel corner
+POLYLINE = [(0, 0), (1, 0), (2, 0), (1, 0), (1, 1), (2, 1), (3, 1 + 1e-4)]
+
+
+class TestRecordStats:
+    def test_disabled(self) -> None:
+        assert get_active_stats() is None
+        _ = offset_polygon([(0, 0), (1, 0), (1, 1)], 1)
+        assert get_active_stats() is None
+
+    def test_counts(self) -> None:
+        with record_stats() as stats:
+            corners = offset_polyline(POLYLINE, 1)
+        counts = (stats.straight, stats.degenerate, stats.near_parallel)
+        assert (stats.calls, stats.corners, counts) == (1, len(POLYLINE), (3, 1, 1))
+        assert stats.nan == sum(math.isnan(x.xsect[0]) for x in corners)
+        assert all(x > 0 for x in stats.seconds.values())
+
+    def test_array_counts_match(self) -> None:
+        np = pytest.importorskip("numpy")
+        with record_stats() as expect:
+            _ = offset_polyline(POLYLINE, 1)
+        with record_stats() as stats:
+            _ = offset_polyline(np.array(POLYLINE, dtype=float), 1, as_array=True)
+        assert (
+            repr(stats).split("s, corners")[-1] == repr(expect).split("s, corners")[-1]
+        )
+
+    def test_offset_rings(self) -> None:
+        np = pytest.importorskip("numpy")
+        from offset_poly.batch import offset_rings  # noqa: PLC0415
+
+        points = np.array(POLYLINE * 2, dtype=float)
+        with record_stats() as stats:
+            _ = offset_rings(points, [0, 7, 14], 1, PolyType.POLYLINE)
+        assert (stats.calls, stats.corners, stats.degenerate) == (1, 14, 2)
+        assert all(x > 0 for x in stats.seconds.values())
+
+    def test_offset_multi(self) -> None:
+        np = pytest.importorskip("numpy")
+        from offset_poly.offset_array import PreparedPoly  # noqa: PLC0415
+
+        prepared = PreparedPoly(np.array(POLYLINE, dtype=float), PolyType.POLYLINE)
+        with record_stats() as stats:
+            _ = prepared.offset_multi([1, 2, 3])
+        assert (stats.calls, stats.corners, stats.near_parallel) == (3, 21, 3)
+
+    def test_offset_joined(self) -> None:
+        with record_stats() as expect:
+            _ = offset_polyline(POLYLINE, 1)
+        with record_stats() as stats:
+            _ = offset_polyline(POLYLINE, 1, join=JoinType.BEVEL)
+        assert (stats.calls, stats.degenerate) == (expect.calls, expect.degenerate)
+        np = pytest.importorskip("numpy")
+        with record_stats() as stats:
+            _ = offset_polyline(
+                np.array(POLYLINE, dtype=float), 1, join=JoinType.BEVEL, as_array=True
+            )
+        assert (stats.calls, stats.degenerate) == (expect.calls, expect.degenerate)
+
+    def test_runs_counted_once(self) -> None:
+        with record_stats() as stats:
+            _ = offset_polygon([(0, 0), (1, 0), (1, 0), (1, 1), (0, 0)], 1)
+        assert (stats.calls, stats.corners) == (1, 3)
+
+    def test_nested(self) -> None:
+        square = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        with record_stats() as outer:
+            _ = offset_polygon(square, 1)
+            with record_stats() as inner:
+                _ = offset_polygon(square, 1)
+            _ = offset_polygon(square, 1)
+        assert (outer.calls, inner.calls) == (2, 1)
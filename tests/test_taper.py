@@ -0,0 +1,124 @@
+"""Test offsets that vary along arc length.
+
+:author: Shay Hill
+:created: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from offset_poly.offset import PolyType, offset_poly_per_edge  # noqa: E402
+from offset_poly.offset_array import PreparedPoly, offset_polygon_array  # noqa: E402
+from offset_poly.taper import get_arc_lengths, offset_tapered, subdivide_edges  # noqa: E402
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+STRAIGHT = [(0, 0), (1, 0), (2, 0), (3, 0)]
+
+
+class TestOffsetTapered:
+    def test_collinear_edges(self) -> None:
+        """Collinear edges with different gaps raise in offset_poly_per_edge."""
+        corners = offset_poly_per_edge(STRAIGHT, [0.1, 0.2, 0.3], PolyType.POLYLINE)
+        with pytest.raises(ValueError, match="gaps must be equal"):
+            _ = [x.xsect for x in corners]
+        tapered = offset_tapered(STRAIGHT, lambda s: 0.1 + 0.1 * s, PolyType.POLYLINE)
+        np.testing.assert_allclose(
+            tapered.xsect, [(0, 0.1), (1, 0.2), (2, 0.3), (3, 0.4)]
+        )
+        np.testing.assert_allclose(tapered.gap_1, tapered.gap_2)
+
+    def test_constant_matches_offset_polygon(self) -> None:
+        corners = offset_tapered(SQUARE, lambda _: 0.5, PolyType.POLYGON)
+        expect = offset_polygon_array(SQUARE, 0.5)
+        np.testing.assert_array_equal(corners.xsect, expect.xsect)
+        np.testing.assert_array_equal(corners.cpts, expect.cpts)
+
+    def test_samples_match_callable(self) -> None:
+        samples = [(0, 1), (6, 0), (8, 0.5)]
+        corners = offset_tapered(SQUARE, samples, PolyType.POLYGON)
+        expect = offset_tapered(
+            SQUARE,
+            lambda s: np.interp(s, *zip(*samples, strict=True)),
+            PolyType.POLYGON,
+        )
+        np.testing.assert_array_equal(corners.xsect, expect.xsect)
+        np.testing.assert_allclose(corners.gap_1, [1, 1 / 3, 0.5, 0.5])
+
+    def test_relative(self) -> None:
+        """A polygon's arc length runs back around to the first point."""
+        corners = offset_tapered(
+            SQUARE, [(0, 0), (1, 1)], PolyType.POLYGON, relative=True
+        )
+        np.testing.assert_allclose(corners.gap_1, [0, 0.25, 0.5, 0.75])
+
+    def test_coincident_points(self) -> None:
+        """Coincident points share one corner and add no arc length."""
+        points = [(0, 0), (1, 0), (1, 0), (3, 0)]
+        corners = offset_tapered(points, lambda s: s, PolyType.POLYLINE)
+        np.testing.assert_allclose(corners.gap_1, [0, 1, 1, 3])
+        assert corners.corner_index.tolist() == [0, 1, 1, 2]
+
+    def test_max_step(self) -> None:
+        corners = offset_tapered(
+            [(0, 0), (3, 0)],
+            [(0, 1), (1, 0)],
+            PolyType.POLYLINE,
+            relative=True,
+            max_step=1,
+        )
+        np.testing.assert_allclose(
+            corners.xsect, [(0, 1), (1, 2 / 3), (2, 1 / 3), (3, 0)]
+        )
+
+    def test_float32(self) -> None:
+        corners = offset_tapered(
+            SQUARE, lambda s: s / 16, PolyType.POLYGON, dtype=np.float32
+        )
+        assert corners.xsect.dtype == np.float32
+
+    @pytest.mark.parametrize(
+        ("offsets", "match"),
+        [
+            ([1, 2], "shape"),
+            ([(0, 1, 2)], "shape"),
+            (np.zeros((0, 2)), "shape"),
+            ([(1, 0), (0, 1)], "sorted by arc length"),
+        ],
+    )
+    def test_bad_samples(self, offsets: npt.ArrayLike, match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            _ = offset_tapered(SQUARE, offsets, PolyType.POLYGON)
+
+
+class TestSubdivideEdges:
+    def test_polygon(self) -> None:
+        points = subdivide_edges([(0, 0), (2, 0), (2, 2)], 1, PolyType.POLYGON)
+        assert points.shape == (7, 2)
+        np.testing.assert_array_equal(points[[0, 2, 4]], [(0, 0), (2, 0), (2, 2)])
+        assert np.all(np.hypot(*np.diff(points, axis=0).T) <= 1)
+
+    def test_polyline_keeps_coincident_points(self) -> None:
+        points = subdivide_edges([(0, 0), (0, 0), (0, 1.5)], 1, PolyType.POLYLINE)
+        np.testing.assert_array_equal(points, [(0, 0), (0, 0), (0, 0.75), (0, 1.5)])
+
+    def test_max_step(self) -> None:
+        with pytest.raises(ValueError, match="max_step must be greater than 0"):
+            _ = subdivide_edges(SQUARE, 0, PolyType.POLYGON)
+
+
+def test_get_arc_lengths() -> None:
+    arc_lengths, total = get_arc_lengths(PreparedPoly(SQUARE, PolyType.POLYGON))
+    np.testing.assert_array_equal(arc_lengths, [0, 4, 8, 12])
+    polyline_arc_lengths, polyline_total = get_arc_lengths(
+        PreparedPoly(SQUARE, PolyType.POLYLINE)
+    )
+    np.testing.assert_array_equal(polyline_arc_lengths, [0, 4, 8, 12])
+    assert (total, polyline_total) == (16, 12)